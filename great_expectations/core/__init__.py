@@ -6,7 +6,7 @@ from copy import deepcopy
 import datetime
 
 from dateutil import parser
-from six import string_types
+from six import string_types, integer_types
 
 from IPython import get_ipython
 from marshmallow import Schema, fields, ValidationError, post_load, pre_dump
@@ -203,9 +203,12 @@ def ensure_json_serializable(data):
         test_obj may also be converted in place.
 
     """
+    # Fast path for the scalars that make up most of large argument lists (e.g. value sets)
+    if data is None or isinstance(data, string_types + integer_types + (float, bool)):
+        return
+
     import numpy as np
     import pandas as pd
-    from six import string_types, integer_types
     import datetime
     import decimal
 
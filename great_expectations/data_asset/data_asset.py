@@ -20,6 +20,11 @@ try:
 except ImportError:  # Python 2.7
     from collections import Hashable
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2.7 without the futures backport
+    ThreadPoolExecutor = None
+
 from great_expectations import __version__ as ge_version
 from great_expectations.data_asset.util import (
     recursively_convert_to_json_serializable,
@@ -153,6 +158,12 @@ class DataAsset(object):
                     modification. For more detail, see :ref:`meta`.
         """
         def outer_wrapper(func):
+            # Get the signature of the inner wrapper once, rather than on every call:
+            if PY3:
+                argspec = inspect.getfullargspec(func)[0][1:]
+            else:
+                argspec = inspect.getargspec(func)[0][1:]
+
             @wraps(func)
             def wrapper(self, *args, **kwargs):
 
@@ -188,23 +199,18 @@ class DataAsset(object):
                 else:
                     meta = None
 
-                # Get the signature of the inner wrapper:
-                if PY3:
-                    argspec = inspect.getfullargspec(func)[0][1:]
-                else:
-                    argspec = inspect.getargspec(func)[0][1:]
-
                 if "result_format" in argspec:
                     all_args["result_format"] = result_format
                 else:
                     if "result_format" in all_args:
                         del all_args["result_format"]
 
-                all_args = recursively_convert_to_json_serializable(all_args)
+                # Conversion builds new containers, so the stored config does not share state with the caller's
+                # arguments and does not need to be copied again
+                expectation_args = recursively_convert_to_json_serializable(all_args)
 
                 # Patch in PARAMETER args, and remove locally-supplied arguments
-                # This will become the stored config
-                expectation_args = copy.deepcopy(all_args)
+                # expectation_args will become the stored config
 
                 if self._expectation_suite.evaluation_parameters:
                     evaluation_args = build_evaluation_parameters(
@@ -258,7 +264,11 @@ class DataAsset(object):
                     self._append_expectation(expectation_config)
 
                 if include_config:
-                    return_obj.expectation_config = copy.deepcopy(expectation_config)
+                    if self._active_validation:
+                        # The config was not appended to the suite, so there is nothing to protect by copying it
+                        return_obj.expectation_config = expectation_config
+                    else:
+                        return_obj.expectation_config = copy.deepcopy(expectation_config)
 
                 # If there was no interactive evaluation, success will not have been computed.
                 if return_obj.success is not None:
@@ -710,7 +720,9 @@ class DataAsset(object):
                  evaluation_parameters=None,
                  catch_exceptions=True,
                  result_format=None,
-                 only_return_failures=False):
+                 only_return_failures=False,
+                 max_workers=None,
+                 max_processes=None):
         """Generates a JSON-formatted report describing the outcome of all expectations.
 
         Use the default expectation_suite=None to validate the expectations config associated with the DataAsset.
@@ -737,6 +749,14 @@ class DataAsset(object):
                 etc.).
             only_return_failures (boolean): \
                 If True, expectation results are only returned when ``success = False`` \
+            max_workers (int or None): \
+                If greater than 1, expectations are evaluated concurrently on a pool of up to this many threads. \
+                Results are still returned in suite order and are identical to a sequential validation. Useful \
+                when expectations spend most of their time waiting on a database or cluster. \
+            max_processes (int or None): \
+                If greater than 1, data assets that support it (currently PandasDataset) shard the suite by column \
+                and evaluate the shards in up to this many worker processes. Useful for CPU-bound validation of \
+                large in-memory data. Other data assets ignore this argument. \
 
         Returns:
             A JSON-formatted dictionary containing a list of the validation results. \
@@ -863,59 +883,48 @@ class DataAsset(object):
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            # Resolve evaluation parameters for the whole suite before evaluating anything, so that the metric
+            # planner sees the kwargs each expectation will actually run with
+            resolved_expectations = []
             for expectation in expectations_to_evaluate:
+                resolved_expectations.append(self._resolve_expectation_for_validation(
+                    expectation,
+                    runtime_evaluation_parameters,
+                    result_format,
+                    catch_exceptions
+                ))
+
+            results = None
+            if max_processes is not None and max_processes > 1 and len(resolved_expectations) > 1:
+                # Worker processes plan and prefetch the metrics for their own shard
+                results = self._evaluate_expectations_in_processes(
+                    resolved_expectations,
+                    catch_exceptions,
+                    max_processes
+                )
 
-                try:
-                    # copy the config so we can modify it below if needed
-                    expectation = copy.deepcopy(expectation)
-
-                    expectation_method = getattr(self, expectation.expectation_type)
-
-                    if result_format is not None:
-                        expectation.kwargs.update({'result_format': result_format})
-
-                    # A missing parameter will raise an EvaluationParameterError
-                    evaluation_args = build_evaluation_parameters(
-                        expectation.kwargs,
-                        runtime_evaluation_parameters,
-                        self._config.get("interactive_evaluation", True)
-                    )
-
-                    result = expectation_method(
-                        catch_exceptions=catch_exceptions,
-                        include_config=True,
-                        **evaluation_args
+            if results is None:
+                self._prefetch_metrics([
+                    (expectation.expectation_type, evaluation_args)
+                    for (expectation, evaluation_args, resolution_error) in resolved_expectations
+                    if resolution_error is None
+                ])
+
+                def evaluate(resolved_expectation):
+                    expectation, evaluation_args, resolution_error = resolved_expectation
+                    return self._evaluate_expectation_for_validation(
+                        expectation,
+                        evaluation_args,
+                        resolution_error,
+                        catch_exceptions
                     )
 
-                except Exception as err:
-                    if catch_exceptions:
-                        raised_exception = True
-                        exception_traceback = traceback.format_exc()
-
-                        result = ExpectationValidationResult(
-                            success=False,
-                            exception_info={
-                                "raised_exception": raised_exception,
-                                "exception_traceback": exception_traceback,
-                                "exception_message": str(err)
-                            }
-                        )
-
-                    else:
-                        raise err
-
-                # if include_config:
-                result.expectation_config = expectation
-
-                # Add an empty exception_info object if no exception was caught
-                if catch_exceptions and result.exception_info is None:
-                    result.exception_info = {
-                        "raised_exception": False,
-                        "exception_traceback": None,
-                        "exception_message": None
-                    }
-
-                results.append(result)
+                if self._use_concurrent_validation(max_workers, len(resolved_expectations)):
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        # map yields results in submission order, so the report matches a sequential run
+                        results = list(executor.map(evaluate, resolved_expectations))
+                else:
+                    results = [evaluate(resolved_expectation) for resolved_expectation in resolved_expectations]
 
             statistics = _calc_validation_statistics(results)
 
@@ -959,6 +968,131 @@ class DataAsset(object):
 
         return result
 
+    def _evaluate_expectations_in_processes(self, resolved_expectations, catch_exceptions, max_processes):
+        """Evaluate resolved expectations in worker processes.
+
+        Returns:
+            A list of ExpectationValidationResults in the order of resolved_expectations, or None if this data asset
+            does not support process-based validation, in which case validate evaluates the expectations itself.
+        """
+        logger.warning("%s does not support evaluating expectations in worker processes; validating in-process."
+                       % self.__class__.__name__)
+        return None
+
+    def _use_concurrent_validation(self, max_workers, n_expectations):
+        """Decide whether validate should evaluate expectations on a thread pool."""
+        if max_workers is None or max_workers <= 1 or n_expectations <= 1:
+            return False
+        if ThreadPoolExecutor is None:
+            logger.warning("concurrent.futures is not available; validating expectations sequentially.")
+            return False
+        if not self._supports_concurrent_validation():
+            logger.warning("%s does not support concurrent evaluation of expectations; validating sequentially."
+                           % self.__class__.__name__)
+            return False
+        return True
+
+    def _supports_concurrent_validation(self):
+        """Whether expectations on this data asset can safely be evaluated from several threads at once.
+
+        Subclasses backed by a resource that cannot be shared between threads should override this.
+        """
+        return True
+
+    def _resolve_expectation_for_validation(self, expectation, runtime_evaluation_parameters, result_format,
+                                            catch_exceptions):
+        """Copy an expectation configuration and substitute its evaluation parameters.
+
+        Returns:
+            tuple(expectation, evaluation_args, resolution_error), where resolution_error is None or a tuple of the
+            exception raised while resolving parameters and its formatted traceback
+        """
+        try:
+            # copy the config so we can modify it below if needed; nested kwargs values are shared with the suite
+            # and never modified in place, so a shallow copy of the kwargs is enough
+            expectation = ExpectationConfiguration(
+                expectation_type=expectation.expectation_type,
+                kwargs=expectation.kwargs,
+                meta=copy.deepcopy(expectation.meta),
+                success_on_last_run=expectation.success_on_last_run
+            )
+
+            if result_format is not None:
+                expectation.kwargs.update({'result_format': result_format})
+
+            # A missing parameter will raise an EvaluationParameterError
+            evaluation_args = build_evaluation_parameters(
+                expectation.kwargs,
+                runtime_evaluation_parameters,
+                self._config.get("interactive_evaluation", True)
+            )
+            return expectation, evaluation_args, None
+
+        except Exception as err:
+            if catch_exceptions:
+                return expectation, None, (err, traceback.format_exc())
+            else:
+                raise err
+
+    def _evaluate_expectation_for_validation(self, expectation, evaluation_args, resolution_error, catch_exceptions):
+        """Run a single resolved expectation as part of validate and return its ExpectationValidationResult."""
+        try:
+            if resolution_error is not None:
+                raise resolution_error[0]
+
+            expectation_method = getattr(self, expectation.expectation_type)
+
+            result = expectation_method(
+                catch_exceptions=catch_exceptions,
+                include_config=True,
+                **evaluation_args
+            )
+
+        except Exception as err:
+            if catch_exceptions:
+                raised_exception = True
+                if resolution_error is not None:
+                    exception_traceback = resolution_error[1]
+                else:
+                    exception_traceback = traceback.format_exc()
+
+                result = ExpectationValidationResult(
+                    success=False,
+                    exception_info={
+                        "raised_exception": raised_exception,
+                        "exception_traceback": exception_traceback,
+                        "exception_message": str(err)
+                    }
+                )
+
+            else:
+                raise err
+
+        # if include_config:
+        result.expectation_config = expectation
+
+        # Add an empty exception_info object if no exception was caught
+        if catch_exceptions and result.exception_info is None:
+            result.exception_info = {
+                "raised_exception": False,
+                "exception_traceback": None,
+                "exception_message": None
+            }
+
+        return result
+
+    def _prefetch_metrics(self, expectations):
+        """Compute metrics needed by a suite before its expectations are evaluated.
+
+        validate calls this hook once, after evaluation parameters have been resolved and before any expectation is
+        run. Subclasses that can compute several metrics in a single pass over their data override it to populate
+        their metric caches; the default implementation does nothing.
+
+        Args:
+            expectations (list): (expectation_type, evaluation_args) tuples in evaluation order
+        """
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
@@ -1033,6 +1167,7 @@ class DataAsset(object):
         unexpected_count,
         unexpected_list,
         unexpected_index_list,
+        unexpected_value_counts=None,
     ):
         """Helper function to construct expectation result objects for map_expectations (such as column_map_expectation
         and file_lines_map_expectation).
@@ -1042,6 +1177,10 @@ class DataAsset(object):
         See :ref:`result_format` for more information.
 
         This function handles the logic for mapping those fields for column_map_expectations.
+
+        Implementations that can count values without materializing them may pass unexpected_value_counts, a list of
+        (value, count) tuples for the most common unexpected values as returned by Counter.most_common; unexpected_list
+        then only needs to hold the values the result_format reports.
         """
         # NB: unexpected_count parameter is explicit some implementing classes may limit the length of unexpected_list
 
@@ -1088,12 +1227,13 @@ class DataAsset(object):
         # Try to return the most common values, if possible.
         if 0 < result_format.get('partial_unexpected_count'):
             try:
+                if unexpected_value_counts is None:
+                    unexpected_value_counts = Counter(unexpected_list).most_common(
+                        result_format['partial_unexpected_count'])
                 partial_unexpected_counts = [
                     {'value': key, 'count': value}
                     for key, value
-                    in sorted(
-                        Counter(unexpected_list).most_common(result_format['partial_unexpected_count']),
-                        key=lambda x: (-x[1], x[0]))
+                    in sorted(unexpected_value_counts, key=lambda x: (-x[1], x[0]))
                 ]
             except TypeError:
                 partial_unexpected_counts = [
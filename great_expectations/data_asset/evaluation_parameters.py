@@ -159,8 +159,11 @@ def build_evaluation_parameters(expectation_args, evaluation_parameters=None, in
     """Build a dictionary of parameters to evaluate, using the provided evaluation_parameters,
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
+
+    Only top-level arguments are replaced, so evaluation_args is a shallow copy of expectation_args: argument values
+    that are not $PARAMETER references are shared between the two and must not be modified in place.
     """
-    evaluation_args = copy.deepcopy(expectation_args)
+    evaluation_args = copy.copy(expectation_args)
 
     # Iterate over arguments, and replace $PARAMETER-defined args with their
     # specified parameters.
@@ -173,10 +176,10 @@ def build_evaluation_parameters(expectation_args, evaluation_parameters=None, in
             # First, check to see whether an argument was supplied at runtime
             # If it was, use that one, but remove it from the stored config
             if "$PARAMETER." + value["$PARAMETER"] in value:
-                evaluation_args[key] = evaluation_args[key]["$PARAMETER." +
-                                                            value["$PARAMETER"]]
-                del expectation_args[key]["$PARAMETER." +
-                                          value["$PARAMETER"]]
+                evaluation_args[key] = value["$PARAMETER." + value["$PARAMETER"]]
+                # Copy on write: the parameter dict may be shared with other configurations
+                expectation_args[key] = copy.copy(value)
+                del expectation_args[key]["$PARAMETER." + value["$PARAMETER"]]
 
             elif evaluation_parameters is not None:
                 # parse_evaluation_parameter will raise EvaluationParameterError if we cannot find a suitable value
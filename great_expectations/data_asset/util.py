@@ -107,6 +107,10 @@ def recursively_convert_to_json_serializable(test_obj):
                              ExpectationSuiteValidationResult)):
         return test_obj
 
+    # Fast path for strings and integers, which make up most of large argument lists (e.g. value sets);
+    # floats still need the nan check below
+    if isinstance(test_obj, (string_types, integer_types)):
+        return test_obj
 
     # Validate that all aruguments are of approved types, coerce if it's easy, else exception
     # print(type(test_obj), test_obj)
@@ -2,6 +2,7 @@ import logging
 
 from .dataset import Dataset
 from .pandas_dataset import MetaPandasDataset, PandasDataset
+from .chunked_pandas_dataset import ChunkedPandasDataset
 
 logger = logging.getLogger(__name__)
 
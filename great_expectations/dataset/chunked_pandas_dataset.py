@@ -0,0 +1,559 @@
+from __future__ import division
+
+import inspect
+import json
+import logging
+import traceback
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+from six import string_types
+
+from great_expectations.core import ExpectationValidationResult
+from great_expectations.data_asset import DataAsset
+from great_expectations.data_asset.util import parse_result_format
+from .dataset import Dataset, MetricRequest
+from .pandas_dataset import MetaPandasDataset, PandasDataset
+from .sketches import HyperLogLog, KLLSketch, SpaceSavingSketch, get_relative_error
+
+logger = logging.getLogger(__name__)
+
+# Metrics sharing the per-chunk value counts of a column
+VALUE_COUNTS_METRICS = ['get_column_value_counts', 'get_column_unique_count', 'get_column_modes']
+
+# Candidates tracked per partial_unexpected_count when counting the most common unexpected values of a map
+# expectation across chunks; values more frequent than 1 / (UNEXPECTED_VALUE_COUNTS_FACTOR *
+# partial_unexpected_count) of the unexpected values are always found
+UNEXPECTED_VALUE_COUNTS_FACTOR = 10
+
+# Expectations that read a sketch of their column when allow_relative_error is set
+SKETCH_EXPECTATIONS = {
+    'expect_column_quantile_values_to_be_between': KLLSketch,
+    'expect_column_median_to_be_between': KLLSketch,
+    'expect_column_unique_value_count_to_be_between': HyperLogLog,
+    'expect_column_proportion_of_unique_values_to_be_between': HyperLogLog,
+    'expect_column_most_common_value_to_be_in_set': SpaceSavingSketch,
+}
+
+
+class ChunkedPandasDataset(Dataset):
+    """ChunkedPandasDataset validates pandas data provided as a sequence of DataFrames (for example, a csv file read
+    with chunksize, or the row groups of a parquet file) without holding more than one chunk in memory.
+
+    validate reads the chunks once for the whole suite. Map expectations are evaluated on each chunk, and their
+    counts and unexpected values are merged. Aggregate expectations are evaluated from metrics whose per-chunk
+    values can be merged exactly: row and nonnull counts, sum, min, max, mean, standard deviation, and value counts
+    (from which unique counts and modes follow). When allow_relative_error is set, the median, quantiles, unique
+    counts and most common values are estimated with mergeable sketches. Expectations that need other metrics, such as the exact median,
+    raise NotImplementedError.
+
+    Expectations and metric getters can also be called interactively; each call reads the chunks once (metrics are
+    then kept in the metric cache), so this requires a re-iterable sequence of chunks.
+
+    Args:
+        chunks (iterable of DataFrame): the chunks of the data, all with the same columns. Each validation \
+            iterates over chunks once, so a one-shot iterator (such as a pandas TextFileReader) can only be \
+            validated once.
+        dataset_class (PandasDataset subclass): the class used to evaluate expectations on each chunk
+    """
+
+    # Map expectations whose result for a row depends on other rows, so that they cannot be evaluated chunk by chunk
+    cross_row_map_expectations = [
+        'expect_column_values_to_be_unique',
+        'expect_column_values_to_be_increasing',
+        'expect_column_values_to_be_decreasing',
+        'expect_multicolumn_values_to_be_unique',
+    ]
+
+    def __init__(self, chunks, dataset_class=PandasDataset, *args, **kwargs):
+        # Aggregate expectations read the metrics merged across chunks from the metric cache
+        kwargs["caching"] = True
+        super(ChunkedPandasDataset, self).__init__(*args, **kwargs)
+        self._chunks = chunks
+        self._dataset_class = dataset_class
+        self._columns = None
+        self._pending_chunk = None
+        self._chunks_consumed = False
+        self._map_expectation_results = {}
+        self._column_sketches = {}
+
+    def _iter_chunks(self):
+        if iter(self._chunks) is not self._chunks:
+            return iter(self._chunks)
+        # A one-shot iterator, which may already have been read to find the columns
+        if self._chunks_consumed:
+            raise ValueError("The chunks of this ChunkedPandasDataset have already been read; provide a re-iterable "
+                             "sequence of chunks to validate more than once.")
+        self._chunks_consumed = True
+        if self._pending_chunk is not None:
+            pending_chunk, self._pending_chunk = self._pending_chunk, None
+            return chain([pending_chunk], self._chunks)
+        return self._chunks
+
+    def _get_chunk_dataset(self, chunk):
+        chunk_dataset = self._dataset_class(chunk)
+        # Chunk datasets only evaluate expectations; they do not need to record them in their own suite
+        chunk_dataset._active_validation = True
+        return chunk_dataset
+
+    def get_table_columns(self):
+        if self._columns is None and hasattr(self._chunks, "get_columns"):
+            # Readers such as PandasChunkReader know their columns without reading a chunk
+            self._columns = list(self._chunks.get_columns())
+        if self._columns is None:
+            chunk_iterator = iter(self._chunks)
+            first_chunk = next(chunk_iterator, None)
+            if first_chunk is None:
+                raise ValueError("ChunkedPandasDataset requires at least one chunk.")
+            if chunk_iterator is self._chunks:
+                self._pending_chunk = first_chunk
+            self._columns = list(first_chunk.columns)
+        return self._columns
+
+    def get_column_count(self):
+        return len(self.get_table_columns())
+
+    def _get_merged_metric(self, metric, column=None):
+        """Compute a metric by merging its values over the chunks, or read it from the metric cache."""
+        metric_request = MetricRequest(metric, column)
+        metrics = self.get_metrics([metric_request])
+        if metric_request not in metrics:
+            raise ValueError("Unable to compute %s%s across chunks." % (
+                metric, "" if column is None else " of column %s" % column))
+        return metrics[metric_request]
+
+    def get_row_count(self):
+        return self._get_merged_metric('get_row_count')
+
+    def get_column_nonnull_count(self, column):
+        return self._get_merged_metric('get_column_nonnull_count', column)
+
+    def get_column_sum(self, column):
+        return self._get_merged_metric('get_column_sum', column)
+
+    def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if parse_strings_as_datetimes:
+            raise NotImplementedError("ChunkedPandasDataset does not parse strings as datetimes in aggregate metrics.")
+        return self._get_merged_metric('get_column_min', column)
+
+    def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if parse_strings_as_datetimes:
+            raise NotImplementedError("ChunkedPandasDataset does not parse strings as datetimes in aggregate metrics.")
+        return self._get_merged_metric('get_column_max', column)
+
+    def get_column_mean(self, column):
+        return self._get_merged_metric('get_column_mean', column)
+
+    def get_column_stdev(self, column):
+        return self._get_merged_metric('get_column_stdev', column)
+
+    def get_column_value_counts(self, column, sort="value", collate=None):
+        if sort != "value" or collate is not None:
+            raise NotImplementedError("ChunkedPandasDataset only sorts value counts by value, without collation.")
+        return self._get_merged_metric('get_column_value_counts', column)
+
+    def get_column_modes(self, column, allow_relative_error=False):
+        if get_relative_error(allow_relative_error):
+            # The values whose estimated count is the largest, rather than every value counted exactly
+            most_common = self._get_column_sketch(SpaceSavingSketch, column, allow_relative_error).most_common()
+            if len(most_common) == 0:
+                return []
+            return [value for value, count, _ in most_common if count == most_common[0][1]]
+        return self._get_merged_metric('get_column_modes', column)
+
+    def get_column_median(self, column):
+        raise NotImplementedError("ChunkedPandasDataset cannot compute the exact median of a column across chunks; "
+                                  "set allow_relative_error to estimate it.")
+
+    def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
+        if not get_relative_error(allow_relative_error):
+            raise NotImplementedError("ChunkedPandasDataset cannot compute exact quantiles of a column across chunks; "
+                                      "set allow_relative_error to estimate them.")
+        return self._get_column_sketch(KLLSketch, column, allow_relative_error).quantiles(quantiles)
+
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        if get_relative_error(allow_relative_error):
+            return self._get_column_sketch(HyperLogLog, column, allow_relative_error).count()
+        return self._get_merged_metric('get_column_unique_count', column)
+
+    def _get_column_sketch(self, sketch_class, column, allow_relative_error):
+        sketch_key = (sketch_class, column, get_relative_error(allow_relative_error))
+        if sketch_key not in self._column_sketches:
+            _, _, sketches = self._scan_chunks([], [], [sketch_key])
+            self._column_sketches.update(sketches)
+        sketch = self._column_sketches[sketch_key]
+        if isinstance(sketch, Exception):
+            raise sketch
+        return sketch
+
+    def _compute_metrics(self, metric_requests):
+        metrics, _, _ = self._scan_chunks(metric_requests, [])
+        return metrics
+
+    def _prefetch_metrics(self, expectations):
+        self._map_expectation_results = {}
+        map_expectations = [
+            (expectation_type, evaluation_args) for expectation_type, evaluation_args in expectations
+            if expectation_type not in self.cross_row_map_expectations and
+            getattr(getattr(self._dataset_class, expectation_type, None), "_map_expectation", False)
+        ]
+        metric_requests = [
+            metric_request for metric_request in self._plan_metrics(expectations)
+            if metric_request.metric not in ['get_column_count', 'get_table_columns']
+        ]
+        sketch_requests = []
+        for expectation_type, evaluation_args in expectations:
+            column = evaluation_args.get("column")
+            if expectation_type in SKETCH_EXPECTATIONS and evaluation_args.get("allow_relative_error") and \
+                    isinstance(column, string_types) and column in self.get_table_columns():
+                sketch_key = (SKETCH_EXPECTATIONS[expectation_type], column,
+                              get_relative_error(evaluation_args["allow_relative_error"]))
+                if sketch_key not in self._column_sketches and sketch_key not in sketch_requests:
+                    sketch_requests.append(sketch_key)
+        metrics, self._map_expectation_results, sketches = self._scan_chunks(
+            metric_requests, map_expectations, sketch_requests)
+        self._column_sketches.update(sketches)
+        for metric_request, value in metrics.items():
+            self._cache_metric(metric_request, value)
+
+    def _scan_chunks(self, metric_requests, map_expectations, sketch_requests=()):
+        """Read the chunks once, computing metrics, evaluating map expectations and building sketches on each of them.
+
+        Args:
+            metric_requests (list of MetricRequest): the metrics to compute
+            map_expectations (list): (expectation_type, evaluation_args) tuples of map expectations to evaluate
+            sketch_requests (list): (sketch class, column, relative error) tuples of the column sketches to build
+
+        Returns:
+            tuple(dict, dict, dict): the metrics that could be computed, keyed by MetricRequest, the merged state of
+            each map expectation, keyed by _get_map_expectation_key, and each sketch (or the exception raised
+            building it), keyed by its request
+        """
+        # Metrics sharing their partial values (such as unique counts and modes) are computed once per chunk
+        partial_metric_requests = OrderedDict()
+        for metric_request in metric_requests:
+            partial_metric_requests.setdefault(self._get_partial_metric_key(metric_request), metric_request)
+        partial_metrics = {}
+        failed_metrics = set()
+        map_states = {}
+        sketches = {}
+        for sketch_class, column, relative_error in sketch_requests:
+            sketches[(sketch_class, column, relative_error)] = sketch_class.from_relative_error(relative_error)
+        for expectation_type, evaluation_args in map_expectations:
+            map_states[self._get_map_expectation_key(expectation_type, evaluation_args)] = \
+                self._init_map_state(expectation_type, evaluation_args)
+
+        for chunk in self._iter_chunks():
+            chunk_dataset = self._get_chunk_dataset(chunk)
+
+            for state_key, metric_request in partial_metric_requests.items():
+                if state_key in failed_metrics:
+                    continue
+                try:
+                    partial = self._get_partial_metric(chunk_dataset, metric_request)
+                    if state_key in partial_metrics:
+                        partial = self._merge_partial_metrics(
+                            metric_request.metric, partial_metrics[state_key], partial)
+                    partial_metrics[state_key] = partial
+                except Exception as e:
+                    logger.debug("Unable to compute metric %s: %s" % (str(metric_request), str(e)))
+                    failed_metrics.add(state_key)
+                    partial_metrics.pop(state_key, None)
+
+            for sketch_key, sketch in sketches.items():
+                if isinstance(sketch, Exception):
+                    continue
+                try:
+                    sketch.update(chunk[sketch_key[1]].dropna().values)
+                except Exception as e:
+                    sketches[sketch_key] = e
+
+            for expectation_type, evaluation_args in map_expectations:
+                state = map_states[self._get_map_expectation_key(expectation_type, evaluation_args)]
+                if state["exception"] is not None:
+                    continue
+                try:
+                    chunk_evaluation_args = dict(evaluation_args)
+                    chunk_evaluation_args["result_format"] = state["chunk_result_format"]
+                    chunk_result = getattr(chunk_dataset, expectation_type)(
+                        catch_exceptions=False,
+                        include_config=False,
+                        **chunk_evaluation_args
+                    )
+                    self._merge_map_result(state, chunk_result.result)
+                except Exception as e:
+                    state["exception"] = (e, traceback.format_exc())
+
+        metrics = {}
+        for metric_request in metric_requests:
+            state_key = self._get_partial_metric_key(metric_request)
+            if state_key in partial_metrics:
+                metrics[metric_request] = self._finalize_metric(metric_request.metric, partial_metrics[state_key])
+        return metrics, map_states, sketches
+
+    @staticmethod
+    def _get_partial_metric_key(metric_request):
+        if metric_request.metric in VALUE_COUNTS_METRICS:
+            return "value_counts", metric_request.column
+        return metric_request.metric, metric_request.column
+
+    @staticmethod
+    def _get_partial_metric(chunk_dataset, metric_request):
+        metric = metric_request.metric
+        column = metric_request.column
+        if metric == 'get_row_count':
+            return chunk_dataset.get_row_count()
+        elif metric == 'get_column_nonnull_count':
+            return chunk_dataset.get_column_nonnull_count(column)
+        elif metric == 'get_column_sum':
+            return chunk_dataset.get_column_sum(column)
+        elif metric == 'get_column_min':
+            return chunk_dataset.get_column_min(column)
+        elif metric == 'get_column_max':
+            return chunk_dataset.get_column_max(column)
+        elif metric == 'get_column_mean':
+            return chunk_dataset.get_column_nonnull_count(column), chunk_dataset.get_column_mean(column)
+        elif metric == 'get_column_stdev':
+            values = chunk_dataset[column].dropna()
+            if len(values) == 0:
+                return 0, 0.0, 0.0
+            mean = values.mean()
+            return len(values), mean, ((values - mean) ** 2).sum()
+        elif metric in VALUE_COUNTS_METRICS:
+            return chunk_dataset[column].value_counts()
+        raise NotImplementedError("ChunkedPandasDataset cannot merge %s across chunks." % metric)
+
+    @staticmethod
+    def _merge_partial_metrics(metric, left, right):
+        if metric in ['get_row_count', 'get_column_nonnull_count', 'get_column_sum']:
+            return left + right
+        elif metric in ['get_column_min', 'get_column_max']:
+            if pd.isnull(left):
+                return right
+            if pd.isnull(right):
+                return left
+            return min(left, right) if metric == 'get_column_min' else max(left, right)
+        elif metric == 'get_column_mean':
+            left_count, left_mean = left
+            right_count, right_mean = right
+            if left_count == 0:
+                return right
+            if right_count == 0:
+                return left
+            count = left_count + right_count
+            return count, left_mean + (right_mean - left_mean) * right_count / count
+        elif metric == 'get_column_stdev':
+            # Chan et al.'s pairwise update of the count, mean and sum of squared deviations
+            left_count, left_mean, left_m2 = left
+            right_count, right_mean, right_m2 = right
+            if left_count == 0:
+                return right
+            if right_count == 0:
+                return left
+            count = left_count + right_count
+            delta = right_mean - left_mean
+            return (
+                count,
+                left_mean + delta * right_count / count,
+                left_m2 + right_m2 + delta ** 2 * left_count * right_count / count
+            )
+        elif metric in VALUE_COUNTS_METRICS:
+            return pd.concat([left, right]).groupby(level=0, sort=False).sum()
+        raise NotImplementedError("ChunkedPandasDataset cannot merge %s across chunks." % metric)
+
+    @staticmethod
+    def _finalize_metric(metric, partial):
+        if metric == 'get_column_mean':
+            count, mean = partial
+            return mean if count > 0 else np.nan
+        elif metric == 'get_column_stdev':
+            count, _, m2 = partial
+            return np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+        elif metric == 'get_column_value_counts':
+            counts = partial.copy()
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                # Values of multiple types in an object column cannot be compared; sort them as strings, as
+                # PandasDataset does
+                if counts.index.dtype == object:
+                    counts.index = counts.index.astype(str)
+                    counts.sort_index(inplace=True)
+            counts.name = "count"
+            counts.index.name = "value"
+            return counts
+        elif metric == 'get_column_unique_count':
+            return len(partial)
+        elif metric == 'get_column_modes':
+            if len(partial) == 0:
+                return []
+            modes = list(partial[partial == partial.max()].index.values)
+            try:
+                return sorted(modes)
+            except TypeError:
+                return modes
+        return partial
+
+    @staticmethod
+    def _get_map_expectation_key(expectation_type, evaluation_args):
+        return expectation_type, json.dumps(evaluation_args, sort_keys=True, default=str)
+
+    def _init_map_state(self, expectation_type, evaluation_args):
+        result_format = parse_result_format(
+            evaluation_args.get("result_format") or self.default_expectation_args["result_format"])
+        if expectation_type in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
+            # Null expectations do not report unexpected values, except in the COMPLETE result_format
+            result_format['partial_unexpected_count'] = 0
+
+        if result_format['result_format'] == 'COMPLETE' or (
+                result_format['result_format'] == 'SUMMARY' and result_format['partial_unexpected_count'] > 0):
+            # The most common unexpected values can only be counted from all of them
+            chunk_result_format = {'result_format': 'COMPLETE'}
+        else:
+            chunk_result_format = {
+                'result_format': 'SUMMARY',
+                'partial_unexpected_count': result_format['partial_unexpected_count']
+            }
+
+        return {
+            "expectation_type": expectation_type,
+            "result_format": result_format,
+            "chunk_result_format": chunk_result_format,
+            "element_count": 0,
+            "nonnull_count": 0,
+            "unexpected_count": 0,
+            "unexpected_list": [],
+            "unexpected_index_list": [],
+            # The most common unexpected values are estimated with a bounded sketch rather than counted exactly, so
+            # that the state does not grow with the number of distinct unexpected values
+            "unexpected_value_counts": SpaceSavingSketch(
+                max(1, UNEXPECTED_VALUE_COUNTS_FACTOR * result_format['partial_unexpected_count'])
+            ) if result_format['result_format'] == 'SUMMARY' else None,
+            "exception": None,
+        }
+
+    @staticmethod
+    def _merge_map_result(state, chunk_result):
+        state["element_count"] += chunk_result["element_count"]
+        state["nonnull_count"] += chunk_result["element_count"] - chunk_result.get("missing_count", 0)
+        state["unexpected_count"] += chunk_result["unexpected_count"]
+
+        if state["chunk_result_format"]['result_format'] == 'COMPLETE':
+            unexpected_list = chunk_result["unexpected_list"]
+            unexpected_index_list = chunk_result["unexpected_index_list"]
+        else:
+            unexpected_list = chunk_result.get("partial_unexpected_list", [])
+            unexpected_index_list = chunk_result.get("partial_unexpected_index_list", [])
+
+        result_format = state["result_format"]
+        if result_format['result_format'] == 'COMPLETE':
+            state["unexpected_list"].extend(unexpected_list)
+            state["unexpected_index_list"].extend(unexpected_index_list)
+        else:
+            remaining = result_format['partial_unexpected_count'] - len(state["unexpected_list"])
+            if remaining > 0:
+                state["unexpected_list"].extend(unexpected_list[:remaining])
+                state["unexpected_index_list"].extend(unexpected_index_list[:remaining])
+
+        if state["unexpected_value_counts"] is not None and result_format['partial_unexpected_count'] > 0:
+            try:
+                state["unexpected_value_counts"].update(unexpected_list)
+            except TypeError:
+                state["unexpected_value_counts"] = None
+                state["unhashable_values"] = True
+
+    def _get_merged_map_result(self, state, evaluation_args):
+        result_format = state["result_format"]
+        success, _ = self._calc_map_expectation_success(
+            state["nonnull_count"] - state["unexpected_count"],
+            state["nonnull_count"],
+            evaluation_args.get("mostly")
+        )
+        unexpected_value_counts = None
+        if state["unexpected_value_counts"] is not None:
+            unexpected_value_counts = [
+                (value, count) for value, count, _ in
+                state["unexpected_value_counts"].most_common(result_format['partial_unexpected_count'])
+            ]
+
+        return_obj = self._format_map_output(
+            result_format,
+            success,
+            state["element_count"],
+            state["nonnull_count"],
+            state["unexpected_count"],
+            state["unexpected_list"],
+            state["unexpected_index_list"],
+            unexpected_value_counts=unexpected_value_counts
+        )
+        if state.get("unhashable_values") and 'partial_unexpected_counts' in return_obj.get('result', {}):
+            return_obj['result']['partial_unexpected_counts'] = [
+                'partial_exception_counts requires a hashable type']
+        if state["expectation_type"] in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
+            MetaPandasDataset._remove_null_expectation_result_fields(return_obj)
+        return ExpectationValidationResult(**return_obj)
+
+    def _evaluate_expectation_for_validation(self, expectation, evaluation_args, resolution_error, catch_exceptions):
+        state = None
+        if resolution_error is None:
+            state = self._map_expectation_results.get(
+                self._get_map_expectation_key(expectation.expectation_type, evaluation_args))
+        if state is None:
+            return super(ChunkedPandasDataset, self)._evaluate_expectation_for_validation(
+                expectation, evaluation_args, resolution_error, catch_exceptions)
+
+        try:
+            if state["exception"] is not None:
+                raise state["exception"][0]
+            result = self._get_merged_map_result(state, evaluation_args)
+        except Exception as err:
+            # Report the error as the base implementation reports errors resolving an expectation
+            exception_traceback = state["exception"][1] if state["exception"] is not None else traceback.format_exc()
+            return super(ChunkedPandasDataset, self)._evaluate_expectation_for_validation(
+                expectation, evaluation_args, (err, exception_traceback), catch_exceptions)
+
+        result.expectation_config = expectation
+        if catch_exceptions:
+            result.exception_info = {
+                "raised_exception": False,
+                "exception_traceback": None,
+                "exception_message": None
+            }
+        return result
+
+    def _evaluate_map_expectation(self, expectation_type, evaluation_args):
+        """Evaluate a map expectation called interactively, reading the chunks once."""
+        _, map_states, _ = self._scan_chunks([], [(expectation_type, evaluation_args)])
+        state = map_states[self._get_map_expectation_key(expectation_type, evaluation_args)]
+        if state["exception"] is not None:
+            raise state["exception"][0]
+        return self._get_merged_map_result(state, evaluation_args)
+
+
+def _build_chunked_map_expectation(expectation_type, dataset_class):
+    """Build the interactive version of a map expectation of dataset_class for ChunkedPandasDataset."""
+    expectation = getattr(dataset_class, expectation_type)
+    method_arg_names = [
+        name for name, parameter in inspect.signature(expectation).parameters.items()
+        if name != "self" and parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    ]
+
+    def evaluate(self, result_format=None, **evaluation_args):
+        if expectation_type in self.cross_row_map_expectations:
+            raise NotImplementedError("%s compares rows across chunks, which ChunkedPandasDataset cannot do."
+                                      % expectation_type)
+        evaluation_args["result_format"] = result_format
+        return self._evaluate_map_expectation(expectation_type, evaluation_args)
+
+    evaluate.__name__ = expectation_type
+    evaluate.__doc__ = expectation.__doc__
+    return DataAsset.expectation(method_arg_names)(evaluate)
+
+
+for _expectation_type in dir(PandasDataset):
+    if _expectation_type.startswith("expect_") and \
+            getattr(getattr(PandasDataset, _expectation_type), "_map_expectation", False):
+        setattr(ChunkedPandasDataset, _expectation_type,
+                _build_chunked_map_expectation(_expectation_type, PandasDataset))
@@ -1,7 +1,9 @@
 from __future__ import division
 
 import inspect
+import logging
 import sys
+from collections import namedtuple
 from six import PY3, string_types
 from functools import wraps
 from numbers import Number
@@ -10,13 +12,12 @@ from datetime import datetime, timedelta
 
 if sys.version_info.major == 2:  # If python 2
     from itertools import izip_longest as zip_longest
-    from backports.functools_lru_cache import lru_cache
 elif sys.version_info.major == 3:  # If python 3
     from itertools import zip_longest
-    from functools import lru_cache
 
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.metric_cache import BoundedMetricCache, DEFAULT_METRIC_CACHE_MAX_BYTES
 from great_expectations.dataset.util import (
     build_continuous_partition_object,
     build_categorical_partition_object,
@@ -28,6 +29,14 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+logger = logging.getLogger(__name__)
+
+# A metric that the validation planner asks a Dataset to compute; column is None for table-level metrics
+MetricRequest = namedtuple("MetricRequest", ["metric", "column"])
+
+# Mirrors functools.lru_cache's cache_info() for the metric getters
+MetricCacheInfo = namedtuple("MetricCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
 
 class MetaDataset(DataAsset):
     """
@@ -150,6 +159,10 @@ class Dataset(MetaDataset):
     # That way, multiple backends can implement the same data_asset_type
     _data_asset_type = "Dataset"
 
+    # Whether get_column_quantiles can estimate quantiles with an allowed relative error more cheaply than the exact
+    # median is computed; backends holding their data in memory compute the exact median instead
+    _estimates_quantiles = True
+
     # getter functions with hashable arguments - can be cached
     hashable_getters = [
         'get_column_min',
@@ -167,19 +180,357 @@ class Dataset(MetaDataset):
         'get_column_count',
         'get_table_columns',
         'get_column_count_in_range',
+        'get_column_hist',
     ]
 
+    # Metrics read by aggregate expectations. During validate, the planner collects these for the whole suite and
+    # computes them with get_metrics before any expectation runs, so that backends able to compute several metrics
+    # in one pass over the data can do so.
+    expectation_metric_dependencies = {
+        'expect_table_row_count_to_be_between': ['get_row_count'],
+        'expect_table_row_count_to_equal': ['get_row_count'],
+        'expect_table_column_count_to_be_between': ['get_column_count'],
+        'expect_table_column_count_to_equal': ['get_column_count'],
+        'expect_column_distinct_values_to_be_in_set': ['get_column_value_counts'],
+        'expect_column_distinct_values_to_equal_set': ['get_column_value_counts'],
+        'expect_column_distinct_values_to_contain_set': ['get_column_value_counts'],
+        'expect_column_mean_to_be_between': ['get_column_mean'],
+        'expect_column_median_to_be_between': ['get_column_median'],
+        'expect_column_stdev_to_be_between': ['get_column_stdev'],
+        'expect_column_unique_value_count_to_be_between': ['get_column_unique_count'],
+        'expect_column_proportion_of_unique_values_to_be_between': ['get_column_unique_count'],
+        'expect_column_most_common_value_to_be_in_set': ['get_column_modes'],
+        'expect_column_sum_to_be_between': ['get_column_sum'],
+        'expect_column_min_to_be_between': ['get_column_min'],
+        'expect_column_max_to_be_between': ['get_column_max'],
+    }
+
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        # A MetricCache (or its configuration) that keeps metrics beyond the lifetime of this dataset
+        metric_cache = kwargs.pop("metric_cache", None)
+        # Bounds of the metrics held in memory by this dataset
+        metric_cache_max_bytes = kwargs.pop("metric_cache_max_bytes", DEFAULT_METRIC_CACHE_MAX_BYTES)
+        metric_cache_maxsize = kwargs.pop("metric_cache_maxsize", None)
+        metric_cache_eviction_policy = kwargs.pop("metric_cache_eviction_policy", "lru")
 
         super(Dataset, self).__init__(*args, **kwargs)
 
+        self._metric_cache = BoundedMetricCache(
+            max_bytes=metric_cache_max_bytes,
+            maxsize=metric_cache_maxsize,
+            eviction_policy=metric_cache_eviction_policy
+        )
+        self._data_modified = False
+        self._metric_cache_signatures = {}
+        self._persistent_metric_cache = self._build_persistent_metric_cache(metric_cache)
+        self._metric_cache_batch_key = None
         if self.caching:
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
-                setattr(self, func, caching_func)
+                setattr(self, func, self._build_caching_getter(func))
+
+    @staticmethod
+    def _build_persistent_metric_cache(metric_cache):
+        if not isinstance(metric_cache, dict):
+            return metric_cache
+        from great_expectations.util import load_class
+
+        config = dict(metric_cache)
+        metric_cache_class = load_class(
+            config.pop("class_name"),
+            config.pop("module_name", "great_expectations.dataset.metric_cache")
+        )
+        return metric_cache_class(**config)
+
+    def _get_data_fingerprint(self):
+        """Return a fingerprint of the data that changes when the data changes, or None if it is not available."""
+        if self._data_modified:
+            # The batch markers describe the data as it was loaded
+            return None
+        return self.batch_markers.get("pandas_data_fingerprint")
+
+    def invalidate_metric_cache(self, columns=None):
+        """Discard cached metrics after the data of the dataset has been modified.
+
+        Caching assumes that the data does not change over the lifetime of the dataset. Call this method after
+        modifying it, for example after assigning to a column of a PandasDataset, so that later expectations
+        recompute the metrics they read.
+
+        Args:
+            columns (list or None): the modified columns, or None to discard all cached metrics. Table-level metrics, \
+                such as the row count, are always discarded.
+        """
+        if columns is None:
+            self._metric_cache.invalidate()
+        else:
+            for column in columns:
+                self._metric_cache.invalidate(column=column)
+        self._data_modified = True
+        self._metric_cache_batch_key = None
+
+    def get_metric_cache_info(self):
+        """Return the counters and the size of the metric cache of the dataset.
+
+        Returns:
+            BoundedMetricCacheInfo: a named tuple with hits, misses, evictions, maxsize, currsize, max_bytes and \
+            currbytes (the estimated size in bytes of the cached metrics)
+        """
+        return self._metric_cache.info()
+
+    def _get_metric_cache_batch_key(self):
+        if self._metric_cache_batch_key is None:
+            fingerprint = self._get_data_fingerprint()
+            if fingerprint is not None:
+                self._metric_cache_batch_key = "fingerprint:" + fingerprint
+            elif not self._persistent_metric_cache.fingerprinted_batches_only:
+                self._metric_cache_batch_key = "batch_id:" + self.batch_id
+        return self._metric_cache_batch_key
+
+    def _load_persisted_metric(self, key):
+        """Look up a metric cache key in the persistent metric cache, raising KeyError if it is not there."""
+        if self._persistent_metric_cache is None:
+            raise KeyError(key)
+        batch_key = self._get_metric_cache_batch_key()
+        if batch_key is None:
+            raise KeyError(key)
+        try:
+            return self._persistent_metric_cache.get(batch_key, key[0], key[1])
+        except KeyError:
+            raise
+        except Exception as e:
+            # The persistent cache is an optimization only; compute the metric instead
+            logger.warning("Unable to read metric %s from the metric cache: %s" % (key[0], str(e)))
+            raise KeyError(key)
+
+    def _persist_metric(self, key, value):
+        if self._persistent_metric_cache is None:
+            return
+        batch_key = self._get_metric_cache_batch_key()
+        if batch_key is None:
+            return
+        try:
+            self._persistent_metric_cache.set(batch_key, key[0], key[1], value)
+        except Exception as e:
+            logger.warning("Unable to write metric %s to the metric cache: %s" % (key[0], str(e)))
+
+    def _build_caching_getter(self, metric):
+        """Wrap a metric getter so that its results are stored in the dataset metric cache.
+
+        Unlike functools.lru_cache, cache keys are normalized against the getter signature, so that
+        get_column_max(column) and get_column_max(column, False) share an entry, and entries can be primed by
+        get_metrics.
+        """
+        getter = getattr(self, metric)
+        if PY3:
+            argspec = inspect.getfullargspec(getter)
+        else:
+            argspec = inspect.getargspec(getter)
+        # Bound methods still report self as their first argument
+        arg_names = argspec[0][1:]
+        defaults = dict(zip(arg_names[len(arg_names) - len(argspec[3] or ()):], argspec[3] or ()))
+        self._metric_cache_signatures[metric] = (arg_names, defaults)
+        stats = {"hits": 0, "misses": 0}
+
+        @wraps(getter)
+        def caching_getter(*args, **kwargs):
+            key = self._get_metric_cache_key(metric, args, kwargs)
+            if key is None:
+                return getter(*args, **kwargs)
+            try:
+                value = self._metric_cache.lookup(key)
+                stats["hits"] += 1
+                return value
+            except KeyError:
+                pass
+            try:
+                value = self._load_persisted_metric(key)
+                stats["hits"] += 1
+            except KeyError:
+                stats["misses"] += 1
+                value = getter(*args, **kwargs)
+                self._persist_metric(key, value)
+            self._metric_cache[key] = value
+            return value
+
+        def cache_info():
+            return MetricCacheInfo(
+                hits=stats["hits"],
+                misses=stats["misses"],
+                maxsize=self._metric_cache.maxsize,
+                currsize=len([key for key in self._metric_cache if key[0] == metric])
+            )
+
+        def cache_clear():
+            self._metric_cache.invalidate(metric=metric)
+            stats["hits"] = 0
+            stats["misses"] = 0
+
+        caching_getter.cache_info = cache_info
+        caching_getter.cache_clear = cache_clear
+        return caching_getter
+
+    def _get_metric_cache_key(self, metric, args, kwargs):
+        """Build the cache key for a getter call, or return None if the call cannot be cached."""
+        try:
+            arg_names, defaults = self._metric_cache_signatures[metric]
+        except KeyError:
+            return None
+        if len(args) > len(arg_names) or any(name not in arg_names for name in kwargs):
+            return None
+        values = list(args)
+        for name in arg_names[len(args):]:
+            if name in kwargs:
+                values.append(kwargs[name])
+            elif name in defaults:
+                values.append(defaults[name])
+            else:
+                # A required argument is missing; let the getter raise
+                return None
+        key = (metric, tuple(values))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get_metrics(self, metric_requests):
+        """Compute a collection of metrics, reusing values already held in the metric cache.
+
+        Metrics found neither in the metric cache nor in the persistent metric cache (if the dataset has one) are
+        passed together to _compute_metrics, which backends override to compute many metrics in a single pass over
+        the data. Computed values are stored in both caches, so later calls to the corresponding getters are served
+        without touching the data again.
+
+        Args:
+            metric_requests (list of MetricRequest): the metrics to compute, or (metric, column) tuples, with \
+                column None for table-level metrics
+
+        Returns:
+            dict: a dictionary mapping each MetricRequest that could be computed to its value
+        """
+        metrics = {}
+        missing = []
+        for metric_request in metric_requests:
+            metric_request = MetricRequest(*metric_request)
+            key = self._get_metric_cache_key(metric_request.metric, self._get_metric_request_args(metric_request), {})
+            if key is not None:
+                try:
+                    metrics[metric_request] = self._metric_cache.lookup(key)
+                    continue
+                except KeyError:
+                    pass
+            if key is not None and self.caching:
+                try:
+                    metrics[metric_request] = self._metric_cache[key] = self._load_persisted_metric(key)
+                    continue
+                except KeyError:
+                    pass
+            if metric_request not in missing:
+                missing.append(metric_request)
+
+        if len(missing) > 0:
+            computed = self._compute_metrics(missing)
+            for metric_request, value in computed.items():
+                metrics[metric_request] = value
+                self._cache_metric(metric_request, value)
+
+        return metrics
+
+    def _cache_metric(self, metric_request, value):
+        """Store a metric computed as a by-product of other work, so that its getter does not compute it again."""
+        if not self.caching:
+            return
+        key = self._get_metric_cache_key(metric_request.metric, self._get_metric_request_args(metric_request), {})
+        if key is not None:
+            self._store_metric(key, value)
+
+    def _store_metric(self, key, value):
+        """Store a metric value under a key built by _get_metric_cache_key in the metric caches."""
+        self._metric_cache[key] = value
+        self._persist_metric(key, value)
+
+    @staticmethod
+    def _get_metric_request_args(metric_request):
+        if metric_request.column is None:
+            return ()
+        return (metric_request.column,)
+
+    def _compute_metrics(self, metric_requests):
+        """Compute metrics that are not yet cached.
+
+        The default implementation calls each getter in turn. Metrics that raise are left out of the result, so that
+        the expectation that needs them raises (and reports) the error when it is evaluated.
+
+        Args:
+            metric_requests (list of MetricRequest): the metrics to compute
+
+        Returns:
+            dict: a dictionary mapping MetricRequest to value
+        """
+        metrics = {}
+        for metric_request in metric_requests:
+            try:
+                metrics[metric_request] = getattr(self, metric_request.metric)(
+                    *self._get_metric_request_args(metric_request))
+            except Exception as e:
+                logger.debug("Unable to compute metric %s: %s" % (str(metric_request), str(e)))
+        return metrics
+
+    def _plan_metrics(self, expectations):
+        """Collect the metrics needed to evaluate a list of expectations.
+
+        Args:
+            expectations (list): (expectation_type, evaluation_args) tuples
+
+        Returns:
+            list of MetricRequest, without duplicates and in the order they are first needed
+        """
+        metric_requests = []
+        table_columns = None
+
+        for expectation_type, evaluation_args in expectations:
+            metrics = self.expectation_metric_dependencies.get(expectation_type)
+            if metrics is None:
+                continue
+            column = evaluation_args.get("column")
+            if column is not None:
+                if not isinstance(column, string_types):
+                    continue
+                if table_columns is None:
+                    table_columns = self.get_table_columns()
+                if column not in table_columns:
+                    # The expectation will fail on its own; do not let it break the planned batch
+                    continue
+                if evaluation_args.get("parse_strings_as_datetimes"):
+                    continue
+                if evaluation_args.get("allow_relative_error"):
+                    # The expectation reads an approximate metric instead of the exact one
+                    metrics = []
+                # column_aggregate_expectation reports element and missing counts for every aggregate
+                metrics = ['get_row_count', 'get_column_nonnull_count'] + metrics
+
+            for metric in metrics:
+                if metric in ['get_row_count', 'get_column_count']:
+                    metric_request = MetricRequest(metric, None)
+                else:
+                    metric_request = MetricRequest(metric, column)
+                if metric_request not in metric_requests:
+                    metric_requests.append(metric_request)
+
+        return metric_requests
+
+    def _prefetch_metrics(self, expectations):
+        if not self.caching:
+            return
+        try:
+            metric_requests = self._plan_metrics(expectations)
+            if len(metric_requests) > 0:
+                self.get_metrics(metric_requests)
+        except Exception as e:
+            # Prefetching is an optimization only: expectations recompute anything missing from the cache
+            logger.warning("Unable to prefetch metrics for validation: %s" % str(e))
     
     @classmethod
     def from_dataset(cls, dataset=None):
@@ -224,6 +575,23 @@ class Dataset(MetaDataset):
         """
         raise NotImplementedError
 
+    def _get_column_value_counts_for_value_set(self, column, value_set, parse_strings_as_datetimes=False):
+        """Get the value counts a distinct values expectation compares to its value set.
+
+        The default implementation returns all value counts of the column. Backends may instead return the counts
+        of the values of value_set found in the column and of only some of the other values, which is enough to
+        decide whether the distinct values are in, equal to, or contain the set.
+
+        Args:
+            column: the column for which to obtain value_counts
+            value_set (list or None): the value set of the expectation
+            parse_strings_as_datetimes (boolean): whether the expectation parses values as datetimes
+
+        Returns:
+            pd.Series of value counts, sorted by value
+        """
+        return self.get_column_value_counts(column)
+
     def get_column_sum(self, column):
         """Returns: float"""
         raise NotImplementedError
@@ -236,12 +604,31 @@ class Dataset(MetaDataset):
         """Returns: any"""
         raise NotImplementedError
 
-    def get_column_unique_count(self, column):
-        """Returns: int"""
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        """Get the number of distinct non-null values in a column.
+
+        Args:
+            column (string): name of column
+            allow_relative_error (boolean or float): False for an exact count, or the relative error allowed on \
+                backends that can estimate the count more cheaply (True for the backend default)
+
+        Returns:
+            int
+        """
         raise NotImplementedError
 
-    def get_column_modes(self, column):
-        """Returns: List[any], list of modes (ties OK)"""
+    def get_column_modes(self, column, allow_relative_error=False):
+        """Get the most common non-null values of a column.
+
+        Args:
+            column (string): name of column
+            allow_relative_error (boolean or float): False for the exact modes, or the error allowed on the count of \
+                each value, as a fraction of the non-null values, on backends that can estimate the modes more \
+                cheaply (True for the backend default)
+
+        Returns:
+            List[any], list of modes (ties OK)
+        """
         raise NotImplementedError
 
     def get_column_median(self, column):
@@ -280,12 +667,9 @@ class Dataset(MetaDataset):
             A list of bins
         """
         if bins == 'uniform':
-            # TODO: in the event that we shift the compute model for
-            #  min and max to have a single pass, use that instead of
-            #  quantiles for clarity
-            # min_ = self.get_column_min(column)
-            # max_ = self.get_column_max(column)
-            min_, max_ = self.get_column_quantiles(column, (0.0, 1.0), allow_relative_error=allow_relative_error)
+            # The minimum and maximum are cheap aggregates on every backend, unlike quantiles
+            min_ = self.get_column_min(column)
+            max_ = self.get_column_max(column)
             # PRECISION NOTE: some implementations of quantiles could produce
             # varying levels of precision (e.g. a NUMERIC column producing
             # Decimal from a SQLAlchemy source, so we cast to float for numpy)
@@ -2083,7 +2467,8 @@ class Dataset(MetaDataset):
 
         """
 
-        observed_value_counts = self.get_column_value_counts(column)
+        observed_value_counts = self._get_column_value_counts_for_value_set(
+            column, value_set, parse_strings_as_datetimes)
 
         if value_set is None:
             # Vacuously true
@@ -2184,7 +2569,8 @@ class Dataset(MetaDataset):
         else:
             parsed_value_set = value_set
 
-        observed_value_counts = self.get_column_value_counts(column)
+        observed_value_counts = self._get_column_value_counts_for_value_set(
+            column, value_set, parse_strings_as_datetimes)
         expected_value_set = set(parsed_value_set)
         observed_value_set = set(observed_value_counts.index)
 
@@ -2272,7 +2658,8 @@ class Dataset(MetaDataset):
         else:
             parsed_value_set = value_set
 
-        observed_value_counts = self.get_column_value_counts(column)
+        observed_value_counts = self._get_column_value_counts_for_value_set(
+            column, value_set, parse_strings_as_datetimes)
         expected_value_set = set(parsed_value_set)
         observed_value_set = set(observed_value_counts.index)
 
@@ -2410,6 +2797,7 @@ class Dataset(MetaDataset):
         column,
         min_value=None, max_value=None,
         strict_min=False, strict_max=False,  # tolerance=1e-9,
+        allow_relative_error=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2430,6 +2818,9 @@ class Dataset(MetaDataset):
                 If True, the column median must be strictly larger than min_value, default=False
             strict_max (boolean):
                 If True, the column median must be strictly smaller than max_value, default=False
+            allow_relative_error (boolean or float): \
+                If set, backends that can estimate quantiles compute the median as the 0.5 quantile, with this \
+                relative error; in-memory backends compute the exact median.
 
         Other Parameters:
             result_format (str or None): \
@@ -2471,7 +2862,10 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_stdev_to_be_between>`
 
         """
-        column_median = self.get_column_median(column)
+        if allow_relative_error and self._estimates_quantiles:
+            column_median = self.get_column_quantiles(column, (0.5,), allow_relative_error=allow_relative_error)[0]
+        else:
+            column_median = self.get_column_median(column)
 
         if column_median is None:
             return {
@@ -2757,6 +3151,7 @@ class Dataset(MetaDataset):
         self,
         column,
         min_value=None, max_value=None,
+        allow_relative_error=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2772,6 +3167,9 @@ class Dataset(MetaDataset):
                 The minimum number of unique values allowed.
             max_value (int or None): \
                 The maximum number of unique values allowed.
+            allow_relative_error (boolean or float): \
+                Whether to allow an approximate number of unique values, with this relative error, on backends that \
+                support it.
 
         Other Parameters:
             result_format (str or None): \
@@ -2810,7 +3208,10 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_proportion_of_unique_values_to_be_between>`
 
         """
-        unique_value_count = self.get_column_unique_count(column)
+        if allow_relative_error:
+            unique_value_count = self.get_column_unique_count(column, allow_relative_error=allow_relative_error)
+        else:
+            unique_value_count = self.get_column_unique_count(column)
 
         if unique_value_count is None:
             return {
@@ -2847,6 +3248,7 @@ class Dataset(MetaDataset):
         column,
         min_value=0, max_value=1,
         strict_min=False, strict_max=False,  # tolerance=1e-9,
+        allow_relative_error=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2870,6 +3272,9 @@ class Dataset(MetaDataset):
                 If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
             strict_max (boolean):
                 If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+            allow_relative_error (boolean or float): \
+                Whether to allow an approximate number of unique values, with this relative error, on backends that \
+                support it.
 
         Other Parameters:
             result_format (str or None): \
@@ -2912,7 +3317,10 @@ class Dataset(MetaDataset):
         # Tolerance docstring for later use:
         # tolerance (float):
         #     tolerance for strict_min, strict_max, default=1e-9
-        unique_value_count = self.get_column_unique_count(column)
+        if allow_relative_error:
+            unique_value_count = self.get_column_unique_count(column, allow_relative_error=allow_relative_error)
+        else:
+            unique_value_count = self.get_column_unique_count(column)
         total_value_count = self.get_column_nonnull_count(column)
 
         if total_value_count > 0:
@@ -2961,6 +3369,7 @@ class Dataset(MetaDataset):
         column,
         value_set,
         ties_okay=None,
+        allow_relative_error=False,
         result_format=None, include_config=True, catch_exceptions=None,
         meta=None,
     ):
@@ -2979,6 +3388,9 @@ class Dataset(MetaDataset):
             ties_okay (boolean or None): \
                 If True, then the expectation will still succeed if values outside the designated set are as common \
                 (but not more common) than designated values
+            allow_relative_error (boolean or float): \
+                Whether to allow approximate most common values, whose counts may be off by this fraction of the \
+                non-null values, on backends that support it.
 
         Other Parameters:
             result_format (str or None): \
@@ -3013,7 +3425,10 @@ class Dataset(MetaDataset):
             `observed_value` will contain a single copy of each most common value.
 
         """
-        mode_list = self.get_column_modes(column)
+        if allow_relative_error:
+            mode_list = self.get_column_modes(column, allow_relative_error=allow_relative_error)
+        else:
+            mode_list = self.get_column_modes(column)
         intersection_count = len(set(value_set).intersection(mode_list))
 
         if ties_okay:
@@ -0,0 +1,296 @@
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Metrics held by a dataset are bounded to this many bytes unless configured otherwise
+DEFAULT_METRIC_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+BoundedMetricCacheInfo = namedtuple(
+    "BoundedMetricCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize", "max_bytes", "currbytes"]
+)
+
+
+def get_size_in_bytes(value):
+    """Estimate the memory held by a metric value, including the objects it contains."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        memory_usage = value.memory_usage(index=True, deep=True)
+        return int(memory_usage.sum()) if isinstance(memory_usage, pd.Series) else int(memory_usage)
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return value.nbytes + sum(get_size_in_bytes(item) for item in value.flat)
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(get_size_in_bytes(key) + get_size_in_bytes(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(get_size_in_bytes(item) for item in value)
+    return size
+
+
+class BoundedMetricCache(object):
+    """The in-memory cache of the metrics computed by a dataset, bounded in number of entries and in bytes.
+
+    Keys are the (metric, args) tuples built by Dataset._get_metric_cache_key. When adding a value would exceed a
+    bound, entries are evicted, least recently used first ("lru") or least frequently used first ("lfu", ties broken
+    by recency). A value larger than max_bytes on its own is not cached at all.
+
+    Args:
+        max_bytes (int or None): the maximum estimated size of the cached values, or None for no limit
+        maxsize (int or None): the maximum number of cached values, or None for no limit
+        eviction_policy (str): "lru" or "lfu"
+    """
+
+    eviction_policies = ("lru", "lfu")
+
+    def __init__(self, max_bytes=DEFAULT_METRIC_CACHE_MAX_BYTES, maxsize=None, eviction_policy="lru"):
+        if eviction_policy not in self.eviction_policies:
+            raise ValueError("eviction_policy must be one of %s" % ", ".join(self.eviction_policies))
+        self.max_bytes = max_bytes
+        self.maxsize = maxsize
+        self.eviction_policy = eviction_policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.currbytes = 0
+        # Least recently used first
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._uses = {}
+        # Validation may evaluate expectations on a thread pool
+        self._lock = threading.RLock()
+
+    def lookup(self, key):
+        """Return the value cached for key, counting a hit, or raise KeyError, counting a miss."""
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self._entries[key] = value
+            self._uses[key] += 1
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            self._uses[key] += 1
+            return value
+
+    def __setitem__(self, key, value):
+        size = get_size_in_bytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.maxsize is not None and self.maxsize < 1:
+                return
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug("Not caching metric %s of %d bytes, above the %d bytes limit" %
+                             (key[0], size, self.max_bytes))
+                return
+            while len(self._entries) > 0 and (
+                    (self.maxsize is not None and len(self._entries) >= self.maxsize) or
+                    (self.max_bytes is not None and self.currbytes + size > self.max_bytes)):
+                self._remove(self._get_eviction_candidate())
+                self.evictions += 1
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._uses[key] = 1
+            self.currbytes += size
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def _remove(self, key):
+        del self._entries[key]
+        self.currbytes -= self._sizes.pop(key)
+        del self._uses[key]
+
+    def _get_eviction_candidate(self):
+        if self.eviction_policy == "lru":
+            return next(iter(self._entries))
+        # Scanning is fine for the few hundred metrics a dataset computes; min returns the least recent of equals
+        return min(self._entries, key=lambda key: self._uses[key])
+
+    def invalidate(self, metric=None, column=None):
+        """Remove cached values.
+
+        Args:
+            metric (str or None): only remove values of this metric getter
+            column (str or None): only remove values of metrics of this column, as well as table-level metrics \
+                (such as the row count), which changes to a column may affect
+
+        Returns:
+            int: the number of values removed
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (metric is None or key[0] == metric) and
+                (column is None or len(key[1]) == 0 or key[1][0] == column)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        """Remove all cached values and reset the counters."""
+        with self._lock:
+            self._entries = OrderedDict()
+            self._sizes = {}
+            self._uses = {}
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Returns: BoundedMetricCacheInfo, the counters and the current size of the cache"""
+        return BoundedMetricCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+            max_bytes=self.max_bytes,
+            currbytes=self.currbytes
+        )
+
+
+class MetricCache(object):
+    """A MetricCache stores metrics computed by datasets beyond the lifetime of a single dataset object, so that
+    validating the same batch again (for example against a modified suite, or against the warning and failure suites
+    of a WarningAndFailureExpectationSuitesValidationOperator) reuses them instead of reading the data again.
+
+    Datasets consult their metric cache when a metric is not in their own metric cache, keyed by the batch, the
+    metric getter name and its arguments. Subclasses implement _get, _set and clear.
+
+    Args:
+        fingerprinted_batches_only (boolean): if True (the default), only cache metrics of batches with a data \
+            fingerprint (such as the pandas_data_fingerprint batch marker of PandasDatasource), which changes when \
+            the data changes. If False, batches without a fingerprint are identified by their batch_id, so cached \
+            metrics are only correct as long as the data behind the batch_kwargs does not change.
+    """
+
+    def __init__(self, fingerprinted_batches_only=True):
+        self.fingerprinted_batches_only = fingerprinted_batches_only
+
+    def get(self, batch_key, metric, metric_args):
+        """Return a cached metric value.
+
+        Args:
+            batch_key (str): the key identifying the data of the batch
+            metric (str): the name of the metric getter
+            metric_args (tuple): the arguments of the getter, including defaults
+
+        Returns:
+            the cached value
+
+        Raises:
+            KeyError: if the metric is not cached
+        """
+        return self._get(batch_key, metric, self._serialize_args(metric_args))
+
+    def set(self, batch_key, metric, metric_args, value):
+        """Store a metric value; see get for the arguments."""
+        self._set(batch_key, metric, self._serialize_args(metric_args), value)
+
+    @staticmethod
+    def _serialize_args(metric_args):
+        return repr(tuple(metric_args))
+
+    def _get(self, batch_key, metric, metric_args):
+        raise NotImplementedError
+
+    def _set(self, batch_key, metric, metric_args, value):
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all cached metrics."""
+        raise NotImplementedError
+
+
+class InMemoryMetricCache(MetricCache):
+    """A MetricCache shared by the datasets of a process."""
+
+    def __init__(self, fingerprinted_batches_only=True):
+        super(InMemoryMetricCache, self).__init__(fingerprinted_batches_only=fingerprinted_batches_only)
+        self._metrics = {}
+
+    def _get(self, batch_key, metric, metric_args):
+        return self._metrics[(batch_key, metric, metric_args)]
+
+    def _set(self, batch_key, metric, metric_args, value):
+        self._metrics[(batch_key, metric, metric_args)] = value
+
+    def clear(self):
+        self._metrics = {}
+
+
+class SqliteMetricCache(MetricCache):
+    """A MetricCache persisted in a SQLite database file, which survives across runs.
+
+    Values are stored pickled.
+
+    Args:
+        path (str): the path of the database file, created if it does not exist
+        table_name (str): the name of the table holding the metrics
+        fingerprinted_batches_only (boolean): see MetricCache
+    """
+
+    def __init__(self, path, table_name="ge_metric_cache", fingerprinted_batches_only=True):
+        super(SqliteMetricCache, self).__init__(fingerprinted_batches_only=fingerprinted_batches_only)
+        self.path = path
+        self.table_name = table_name
+        # Validation may compute metrics from several threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS %s (batch_key TEXT, metric TEXT, metric_args TEXT, value BLOB, "
+                "PRIMARY KEY (batch_key, metric, metric_args))" % self.table_name
+            )
+
+    def _get(self, batch_key, metric, metric_args):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM %s WHERE batch_key = ? AND metric = ? AND metric_args = ?" % self.table_name,
+                (batch_key, metric, metric_args)
+            ).fetchone()
+        if row is None:
+            raise KeyError((batch_key, metric, metric_args))
+        return pickle.loads(row[0])
+
+    def _set(self, batch_key, metric, metric_args, value):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO %s (batch_key, metric, metric_args, value) VALUES (?, ?, ?, ?)" %
+                self.table_name,
+                (batch_key, metric, metric_args, sqlite3.Binary(pickle.dumps(value)))
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM %s" % self.table_name)
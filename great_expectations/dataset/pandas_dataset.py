@@ -1,13 +1,14 @@
 from __future__ import division
 
+import hashlib
 import inspect
-import json
 from datetime import datetime, timedelta
 import logging
 import collections
+import pickle
+import threading
 from datetime import datetime
 from functools import wraps
-import jsonschema
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
@@ -18,12 +19,26 @@ from great_expectations.core import ExpectationConfiguration
 from great_expectations.data_asset import DataAsset
 from .dataset import Dataset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.sketches import get_relative_error
 from great_expectations.dataset.util import \
     is_valid_partition_object, is_valid_categorical_partition_object, is_valid_continuous_partition_object, \
-    _scipy_distribution_positional_args_from_dict, validate_distribution_parameters
+    _scipy_distribution_positional_args_from_dict, validate_distribution_parameters, match_regex_list, \
+    parse_datetimes, match_strftime_format, map_distinct_values, loads_json, is_json_parseable, \
+    get_json_schema_validator
 
 logger = logging.getLogger(__name__)
 
+try:
+    from collections.abc import Hashable
+except ImportError:  # Python 2.7
+    from collections import Hashable
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+except ImportError:  # Python 2.7 without the futures backport
+    ProcessPoolExecutor = None
+
 
 class MetaPandasDataset(Dataset):
     """MetaPandasDataset is a thin layer between Dataset and PandasDataset.
@@ -87,22 +102,23 @@ class MetaPandasDataset(Dataset):
                 self, nonnull_values, *args, **kwargs)
             success_count = np.count_nonzero(boolean_mapped_success_values)
 
-            unexpected_list = list(
-                nonnull_values[boolean_mapped_success_values == False])
-            unexpected_index_list = list(
-                nonnull_values[boolean_mapped_success_values == False].index)
+            unexpected_values = nonnull_values[boolean_mapped_success_values == False]
 
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
-                parsed_unexpected_list = []
-                for val in unexpected_list:
+
+                def value_formatter(val):
                     if val is None:
-                        parsed_unexpected_list.append(val)
-                    else:
-                        if isinstance(val, string_types):
-                            val = parse(val)
-                        parsed_unexpected_list.append(datetime.strftime(val, output_strftime_format))
-                unexpected_list = parsed_unexpected_list
+                        return val
+                    if isinstance(val, string_types):
+                        val = parse(val)
+                    return datetime.strftime(val, output_strftime_format)
+            else:
+                value_formatter = None
+
+            unexpected_list, unexpected_index_list, unexpected_value_counts = self._collect_unexpected_values(
+                result_format, unexpected_values, value_formatter
+            )
 
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly)
@@ -110,28 +126,91 @@ class MetaPandasDataset(Dataset):
             return_obj = self._format_map_output(
                 result_format, success,
                 element_count, nonnull_count,
-                len(unexpected_list),
-                unexpected_list, unexpected_index_list
+                len(unexpected_values),
+                unexpected_list, unexpected_index_list,
+                unexpected_value_counts=unexpected_value_counts
             )
 
             # FIXME Temp fix for result format
             if func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
-                del return_obj['result']['unexpected_percent_nonmissing']
-                del return_obj['result']['missing_count']
-                del return_obj['result']['missing_percent']
-                try:
-                    del return_obj['result']['partial_unexpected_counts']
-                    del return_obj['result']['partial_unexpected_list']
-                except KeyError:
-                    pass
+                cls._remove_null_expectation_result_fields(return_obj)
 
             return return_obj
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Lets chunked validation merge the results of this expectation across chunks
+        inner_wrapper._map_expectation = True
 
         return inner_wrapper
 
+    @staticmethod
+    def _remove_null_expectation_result_fields(return_obj):
+        """Drop result fields that do not apply to expect_column_values_to_(not_)be_null."""
+        if 'result' not in return_obj:
+            return
+        del return_obj['result']['unexpected_percent_nonmissing']
+        del return_obj['result']['missing_count']
+        del return_obj['result']['missing_percent']
+        try:
+            del return_obj['result']['partial_unexpected_counts']
+            del return_obj['result']['partial_unexpected_list']
+        except KeyError:
+            pass
+
+    def _collect_unexpected_values(self, result_format, unexpected_values, value_formatter=None):
+        """Materialize only the unexpected values that result_format reports.
+
+        BOOLEAN_ONLY needs no values, BASIC and SUMMARY only the first partial_unexpected_count values and indexes
+        (SUMMARY also counts the most common values without building a list of all of them), and COMPLETE all of them.
+
+        Args:
+            result_format (dict): a parsed result_format
+            unexpected_values (Series): the unexpected values, indexed as in the dataset
+            value_formatter (callable or None): applied to each reported value
+
+        Returns:
+            tuple(unexpected_list, unexpected_index_list, unexpected_value_counts) for _format_map_output
+        """
+        if result_format['result_format'] == 'BOOLEAN_ONLY':
+            return [], [], None
+        elif result_format['result_format'] == 'COMPLETE':
+            limit = None
+        else:
+            limit = result_format['partial_unexpected_count']
+
+        count_values = result_format['result_format'] == 'SUMMARY' and limit > 0
+
+        if value_formatter is not None:
+            if count_values:
+                # Values are counted after formatting, so all of them need to be formatted
+                unexpected_values = unexpected_values.map(value_formatter)
+            else:
+                unexpected_values = unexpected_values.iloc[:limit].map(value_formatter)
+
+        unexpected_value_counts = None
+        if count_values:
+            try:
+                unexpected_value_counts = self._get_most_common_values(unexpected_values, limit)
+            except TypeError:
+                # Unhashable values; _format_map_output reports that counts are unavailable
+                return list(unexpected_values), list(unexpected_values.index), None
+
+        return list(unexpected_values.iloc[:limit]), list(unexpected_values.index[:limit]), unexpected_value_counts
+
+    @staticmethod
+    def _get_most_common_values(values, n):
+        """Equivalent to Counter(list(values)).most_common(n), without building a Python object per value."""
+        codes, uniques = pd.factorize(values)
+        if len(codes) > 0 and codes.min() < 0:
+            # factorize drops missing values, which Counter would count
+            return collections.Counter(list(values)).most_common(n)
+
+        counts = np.bincount(codes, minlength=len(uniques))
+        # Counter breaks ties by first occurrence, which is the order of uniques; a stable sort preserves it
+        most_common = np.argsort(-counts, kind="stable")[:n]
+        return list(zip(pd.Series(uniques).iloc[most_common], counts[most_common].tolist()))
+
     @classmethod
     def column_pair_map_expectation(cls, func):
         """
@@ -204,6 +283,7 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._map_expectation = True
         return inner_wrapper
 
     @classmethod
@@ -260,9 +340,27 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._map_expectation = True
         return inner_wrapper
 
 
+def _evaluate_pandas_validation_shard(dataset_class, df, dataset_state, resolved_expectations, catch_exceptions):
+    """Evaluate a shard of a validation in a worker process; see PandasDataset._evaluate_expectations_in_processes."""
+    dataset = dataset_class(df, caching=dataset_state["caching"])
+    dataset._config = dataset_state["config"]
+    dataset.default_expectation_args = dataset_state["default_expectation_args"]
+    dataset._active_validation = True
+    dataset._converted_columns = {}
+    dataset._prefetch_metrics([
+        (expectation.expectation_type, evaluation_args)
+        for (expectation, evaluation_args, resolution_error) in resolved_expectations
+    ])
+    return [
+        dataset._evaluate_expectation_for_validation(expectation, evaluation_args, None, catch_exceptions)
+        for (expectation, evaluation_args, resolution_error) in resolved_expectations
+    ]
+
+
 class PandasDataset(MetaPandasDataset, pd.DataFrame):
     """
     PandasDataset instantiates the great_expectations Expectations API as a subclass of a pandas.DataFrame.
@@ -289,11 +387,21 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         '_expectation_suite',
         '_config',
         'caching',
+        '_metric_cache',
+        '_metric_cache_signatures',
+        '_persistent_metric_cache',
+        '_metric_cache_batch_key',
+        '_data_modified',
+        '_converted_columns',
+        '_converted_columns_lock',
         'default_expectation_args',
         'discard_subset_failing_expectations'
     ]
     _internal_names_set = set(_internal_names)
 
+    # Exact medians are cheap in memory, and the quantiles use the nearest value rather than the mean of the middle two
+    _estimates_quantiles = False
+
     # We may want to expand or alter support for subclassing dataframes in the future:
     # See http://pandas.pydata.org/pandas-docs/stable/extending.html#extending-subclassing-pandas
 
@@ -317,6 +425,157 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         super(PandasDataset, self).__init__(*args, **kwargs)
         self.discard_subset_failing_expectations = kwargs.get(
             'discard_subset_failing_expectations', False)
+        # Columns converted to strings or parsed as datetimes by expectations, shared for the duration of a validation
+        # by the threads of validate(max_workers=...)
+        self._converted_columns = None
+        self._converted_columns_lock = threading.Lock()
+
+    @DocInherit
+    def validate(self, *args, **kwargs):
+        self._converted_columns = {}
+        try:
+            return super(PandasDataset, self).validate(*args, **kwargs)
+        finally:
+            self._converted_columns = None
+
+    def _get_converted_column(self, column, conversion, convert):
+        """Convert a column passed to an expectation, converting each column once per validation."""
+        if self._converted_columns is None:
+            return convert(column)
+        key = (conversion, column.name)
+        with self._converted_columns_lock:
+            converted = self._converted_columns.get(key)
+        # Expectations ignoring different rows receive different subsets of the column
+        if converted is None or not converted.index.equals(column.index):
+            # Convert outside of the lock, so that threads converting different columns do not wait for each other
+            converted = convert(column)
+            with self._converted_columns_lock:
+                self._converted_columns[key] = converted
+        return converted
+
+    def _get_column_strings(self, column):
+        return self._get_converted_column(column, "str", lambda values: values.astype(str))
+
+    def _get_column_datetimes(self, column, errors="raise"):
+        return self._get_converted_column(
+            column, "datetime_" + errors, lambda values: parse_datetimes(values, errors=errors))
+
+    def _evaluate_expectations_in_processes(self, resolved_expectations, catch_exceptions, max_processes):
+        """Evaluate a validation in worker processes, sharded by the columns each expectation reads.
+
+        Expectations on the same column(s) are kept together so that each worker can share metrics between them, and
+        each worker receives only the columns its shard needs rather than the whole frame. Table-level expectations,
+        expectations on missing columns, and expectations whose parameters could not be resolved are evaluated in
+        this process while the workers run.
+
+        The dataset class must be importable by the worker processes and constructible from a DataFrame.
+        """
+        if ProcessPoolExecutor is None:
+            logger.warning("concurrent.futures is not available; validating in-process.")
+            return None
+        if not self.columns.is_unique:
+            logger.warning("Cannot shard a PandasDataset with duplicate column names; validating in-process.")
+            return None
+        try:
+            pickle.dumps(self.__class__)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.warning("%s cannot be sent to worker processes; validating in-process." % self.__class__.__name__)
+            return None
+
+        local_indexes = []
+        column_groups = collections.OrderedDict()
+        for idx, (expectation, evaluation_args, resolution_error) in enumerate(resolved_expectations):
+            columns = self._get_expectation_columns(evaluation_args)
+            if (resolution_error is not None or columns is None or not hasattr(self, expectation.expectation_type) or
+                    not all(column in self.columns for column in columns)):
+                local_indexes.append(idx)
+            else:
+                column_groups.setdefault(tuple(columns), []).append(idx)
+
+        if len(column_groups) < 2:
+            # No parallelism to gain
+            return None
+
+        # Assign the largest column groups first, each to the least loaded shard
+        n_shards = min(max_processes, len(column_groups))
+        shards = [{"columns": [], "indexes": []} for _ in range(n_shards)]
+        for group_columns, indexes in sorted(column_groups.items(), key=lambda item: -len(item[1])):
+            shard = min(shards, key=lambda shard: len(shard["indexes"]))
+            for column in group_columns:
+                if column not in shard["columns"]:
+                    shard["columns"].append(column)
+            shard["indexes"].extend(indexes)
+
+        dataset_state = {
+            "caching": self.caching,
+            "config": self._config,
+            "default_expectation_args": self.default_expectation_args,
+        }
+        results = [None] * len(resolved_expectations)
+        try:
+            with ProcessPoolExecutor(max_workers=n_shards) as executor:
+                futures = []
+                for shard in shards:
+                    shard["indexes"].sort()
+                    futures.append(executor.submit(
+                        _evaluate_pandas_validation_shard,
+                        self.__class__,
+                        pd.DataFrame(self)[shard["columns"]],
+                        dataset_state,
+                        [resolved_expectations[idx] for idx in shard["indexes"]],
+                        catch_exceptions
+                    ))
+
+                self._prefetch_metrics([
+                    (resolved_expectations[idx][0].expectation_type, resolved_expectations[idx][1])
+                    for idx in local_indexes if resolved_expectations[idx][2] is None
+                ])
+                for idx in local_indexes:
+                    results[idx] = self._evaluate_expectation_for_validation(
+                        resolved_expectations[idx][0],
+                        resolved_expectations[idx][1],
+                        resolved_expectations[idx][2],
+                        catch_exceptions
+                    )
+
+                for shard, future in zip(shards, futures):
+                    for idx, result in zip(shard["indexes"], future.result()):
+                        if self._data_context is not None:
+                            result = self._data_context.update_return_obj(self, result)
+                        results[idx] = result
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            logger.warning("Unable to validate in worker processes; validating in-process: %s" % str(e))
+            return None
+
+        return results
+
+    @staticmethod
+    def _get_expectation_columns(evaluation_args):
+        """Return the list of columns read by an expectation, or None if it is not restricted to named columns."""
+        if "column" in evaluation_args:
+            columns = [evaluation_args["column"]]
+        elif "column_A" in evaluation_args and "column_B" in evaluation_args:
+            columns = [evaluation_args["column_A"], evaluation_args["column_B"]]
+        elif "column_list" in evaluation_args and isinstance(evaluation_args["column_list"], list):
+            columns = evaluation_args["column_list"]
+        else:
+            return None
+
+        if not all(isinstance(column, Hashable) for column in columns):
+            return None
+        return columns
+
+    def _get_data_fingerprint(self):
+        fingerprint = super(PandasDataset, self)._get_data_fingerprint()
+        if fingerprint is None:
+            try:
+                data_hash = hashlib.md5(pd.util.hash_pandas_object(self, index=True).values)
+            except TypeError:
+                # Unhashable values, such as lists
+                return None
+            data_hash.update(repr([(column, str(dtype)) for column, dtype in self.dtypes.items()]).encode("utf-8"))
+            fingerprint = data_hash.hexdigest()
+        return fingerprint
 
     def get_row_count(self):
         return self.shape[0]
@@ -333,13 +592,13 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         temp_column = self[column].dropna()
         if parse_strings_as_datetimes:
-            temp_column = temp_column.map(parse)
+            temp_column = self._get_column_datetimes(temp_column)
         return temp_column.max()
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         temp_column = self[column].dropna()
         if parse_strings_as_datetimes:
-            temp_column = temp_column.map(parse)
+            temp_column = self._get_column_datetimes(temp_column)
         return temp_column.min()
 
     def get_column_mean(self, column):
@@ -376,18 +635,21 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         counts.index.name = "value"
         return counts
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        # Counting exactly is as cheap as estimating when the data is in memory
         return self.get_column_value_counts(column).shape[0]
 
-    def get_column_modes(self, column):
+    def get_column_modes(self, column, allow_relative_error=False):
+        # Exact modes satisfy any allowed relative error; only check that the argument is valid
+        get_relative_error(allow_relative_error)
         return list(self[column].mode().values)
 
     def get_column_median(self, column):
         return self[column].median()
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
-        if allow_relative_error is not False:
-            raise ValueError("PandasDataset does not support relative error in column quantiles.")
+        # Exact quantiles satisfy any allowed relative error; only check that the argument is valid
+        get_relative_error(allow_relative_error)
         return self[column].quantile(quantiles, interpolation='nearest').tolist()
 
     def get_column_stdev(self, column):
@@ -888,7 +1150,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
                 max_value = parse(max_value)
 
             try:
-                temp_column = column.map(parse)
+                temp_column = self._get_column_datetimes(column)
             except TypeError as e:
                 temp_column = column
 
@@ -984,7 +1246,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
                                               mostly=None,
                                               result_format=None, include_config=True, catch_exceptions=None, meta=None):
         if parse_strings_as_datetimes:
-            temp_column = column.map(parse)
+            temp_column = self._get_column_datetimes(column)
 
             col_diff = temp_column.diff()
 
@@ -1012,7 +1274,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
                                               mostly=None,
                                               result_format=None, include_config=True, catch_exceptions=None, meta=None):
         if parse_strings_as_datetimes:
-            temp_column = column.map(parse)
+            temp_column = self._get_column_datetimes(column)
 
             col_diff = temp_column.diff()
 
@@ -1056,7 +1318,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         except ValueError:
             raise ValueError("min_value and max_value must be integers")
 
-        column_lengths = column.astype(str).str.len()
+        column_lengths = self._get_column_strings(column).str.len()
 
         if min_value is not None and max_value is not None:
             return column_lengths.between(min_value, max_value)
@@ -1082,32 +1344,21 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
     def expect_column_values_to_match_regex(self, column, regex,
                                             mostly=None,
                                             result_format=None, include_config=True, catch_exceptions=None, meta=None):
-        return column.astype(str).str.contains(regex)
+        return self._get_column_strings(column).str.contains(regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_not_match_regex(self, column, regex,
                                                 mostly=None,
                                                 result_format=None, include_config=True, catch_exceptions=None, meta=None):
-        return ~column.astype(str).str.contains(regex)
+        return ~self._get_column_strings(column).str.contains(regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_match_regex_list(self, column, regex_list, match_on="any",
                                                  mostly=None,
                                                  result_format=None, include_config=True, catch_exceptions=None, meta=None):
-
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        if match_on == "any":
-            return regex_match_df.any(axis='columns')
-        elif match_on == "all":
-            return regex_match_df.all(axis='columns')
-        else:
-            raise ValueError("match_on must be either 'any' or 'all'")
+        return match_regex_list(self._get_column_strings(column), regex_list, match_on=match_on)
 
 
     @DocInherit
@@ -1115,12 +1366,7 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
     def expect_column_values_to_not_match_regex_list(self, column, regex_list,
                                                      mostly=None,
                                                      result_format=None, include_config=True, catch_exceptions=None, meta=None):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        return ~regex_match_df.any(axis='columns')
+        return ~match_regex_list(self._get_column_strings(column), regex_list, match_on="any")
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1147,7 +1393,10 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
             except ValueError as e:
                 return False
 
-        return column.map(is_parseable_by_format)
+        if pd.api.types.infer_dtype(column, skipna=False) != "string":
+            # Raise the TypeError above
+            return column.map(is_parseable_by_format)
+        return match_strftime_format(column, strftime_format)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1166,42 +1415,32 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        if any(type(val) != str for val in column):
+            # Raise the TypeError above
+            return column.map(is_parseable)
+        return self._get_column_datetimes(column, errors="coerce").notnull()
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_be_json_parseable(self, column,
                                                   mostly=None,
                                                   result_format=None, include_config=True, catch_exceptions=None, meta=None):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        return column.map(is_json)
+        # Identical payloads are decoded once
+        return map_distinct_values(column, is_json_parseable)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_match_json_schema(self, column, json_schema,
                                                   mostly=None,
                                                   result_format=None, include_config=True, catch_exceptions=None, meta=None):
+        # The schema is checked once, and raises jsonschema.SchemaError if it is not valid
+        validator = get_json_schema_validator(json_schema)
+
         def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+            # Values that are not JSON documents raise
+            return validator.is_valid(loads_json(val))
 
-        return column.map(matches_json_schema)
+        return map_distinct_values(column, matches_json_schema)
 
     @DocInherit
     @MetaPandasDataset.column_aggregate_expectation
@@ -1367,8 +1606,8 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
             raise NotImplementedError
 
         if parse_strings_as_datetimes:
-            temp_column_A = column_A.map(parse)
-            temp_column_B = column_B.map(parse)
+            temp_column_A = self._get_column_datetimes(column_A)
+            temp_column_B = self._get_column_datetimes(column_B)
 
         else:
             temp_column_A = column_A
@@ -0,0 +1,292 @@
+# Mergeable sketches for computing approximate metrics in a single pass over data read in pieces
+
+from __future__ import division
+
+import random
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+# Relative error used when allow_relative_error is True rather than a number
+DEFAULT_RELATIVE_ERROR = 0.01
+
+
+def get_relative_error(allow_relative_error):
+    """Interpret an allow_relative_error argument.
+
+    Args:
+        allow_relative_error (bool or float): False for exact values, True to allow approximate values with the \
+            default relative error, or the relative error to allow, between zero and one
+
+    Returns:
+        float: the relative error to allow, 0 for exact values
+    """
+    if allow_relative_error is False or allow_relative_error is None:
+        return 0.
+    if allow_relative_error is True:
+        return DEFAULT_RELATIVE_ERROR
+    if not isinstance(allow_relative_error, (float, int)) or not 0 <= allow_relative_error <= 1:
+        raise ValueError("allow_relative_error must be a boolean, or a number between 0 and 1.")
+    return float(allow_relative_error)
+
+
+class KLLSketch(object):
+    """A KLL sketch of the distribution of a numeric column, for approximate quantiles.
+
+    The sketch keeps a hierarchy of sorted buffers ("compactors"); when a buffer is full, every other item of it is
+    promoted to the next level with twice the weight. With parameter k, the rank error of the returned quantiles is
+    of the order of 1 / k with high probability, regardless of the number of values, and sketches of different parts
+    of the data can be merged into a sketch of the whole with the same guarantee (Karnin, Lang and Liberty, "Optimal
+    Quantile Approximation in Streams", 2016). The exact minimum and maximum are kept as well.
+
+    Args:
+        k (int): the capacity of the largest compactor; the memory used is about 3 * k values
+        seed (int): seed of the coin flips deciding which items a compaction keeps, for reproducible results
+    """
+
+    def __init__(self, k=200, seed=0):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._compactors = [np.array([], dtype=float)]
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_relative_error(cls, allow_relative_error, seed=0):
+        """Build a sketch whose quantiles are within allow_relative_error (as a rank fraction) of the exact ones."""
+        # k = 4 / error keeps every quantile of a 99 quantile query within the error in practice
+        relative_error = get_relative_error(allow_relative_error) or DEFAULT_RELATIVE_ERROR
+        return cls(k=max(8, int(np.ceil(4 / relative_error))), seed=seed)
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values (array-like): numeric values, without nulls
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        values_min, values_max = values.min(), values.max()
+        self.min = values_min if self.min is None else min(self.min, values_min)
+        self.max = values_max if self.max is None else max(self.max, values_max)
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """Add the values summarized by another KLLSketch to this one."""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append(np.array([], dtype=float))
+        for level, items in enumerate(other._compactors):
+            self._compactors[level] = np.concatenate([self._compactors[level], items])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self._compactors):
+            items = self._compactors[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._compactors):
+                    self._compactors.append(np.array([], dtype=float))
+                items = np.sort(items)
+                # An odd item out stays at this level
+                kept = items[len(items) - len(items) % 2:]
+                promoted = items[self._random.randint(0, 1):len(items) - len(items) % 2:2]
+                self._compactors[level] = kept
+                self._compactors[level + 1] = np.concatenate([self._compactors[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, quantiles):
+        """Return approximate quantiles of the values added to the sketch.
+
+        Like PandasDataset, quantiles are values of the data (the nearest to the requested rank), and the 0 and 1
+        quantiles are the exact minimum and maximum.
+
+        Args:
+            quantiles (list of float): quantiles to return, between 0 and 1
+
+        Returns:
+            list: the approximate quantiles, or None for each quantile if the sketch is empty
+        """
+        if self.count == 0:
+            return [None for _ in quantiles]
+        values = np.concatenate(self._compactors)
+        weights = np.concatenate([
+            np.full(len(items), 2 ** level, dtype=np.int64) for level, items in enumerate(self._compactors)
+        ])
+        order = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+        total_weight = cumulative_weights[-1]
+
+        result = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                result.append(self.min)
+            elif quantile >= 1:
+                result.append(self.max)
+            else:
+                rank = int(round(quantile * (total_weight - 1)))
+                result.append(values[min(np.searchsorted(cumulative_weights, rank, side="right"), len(values) - 1)])
+        return result
+
+
+class HyperLogLog(object):
+    """A HyperLogLog sketch, for approximate distinct counts.
+
+    Values are hashed to 64 bits; the first p bits select one of 2 ** p registers, which records the longest run of
+    leading zeros among the remaining bits of the values it receives. The standard error of the count is about
+    1.04 / sqrt(2 ** p), and sketches are merged by taking the maximum of each register (Flajolet et al.,
+    "HyperLogLog: the analysis of a near-optimal cardinality estimation algorithm", 2007).
+
+    Numeric values are hashed as floats, so that the same number read as an integer in one chunk and as a float in
+    another is counted once.
+
+    Args:
+        p (int): the number of bits selecting a register, between 4 and 18
+    """
+
+    def __init__(self, p=14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self.registers = np.zeros(2 ** p, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(cls, allow_relative_error):
+        """Build a sketch whose standard error is at most allow_relative_error."""
+        relative_error = get_relative_error(allow_relative_error) or DEFAULT_RELATIVE_ERROR
+        return cls(p=int(min(18, max(4, np.ceil(2 * np.log2(1.04 / relative_error))))))
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values (array-like): values, without nulls
+        """
+        values = np.asarray(values)
+        if len(values) == 0:
+            return
+        if values.dtype.kind in "iuf":
+            values = values.astype(float)
+        hashes = pd.util.hash_array(values)
+        registers = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        remaining_bits = 64 - self.p
+        remainders = hashes & np.uint64((1 << remaining_bits) - 1)
+        # The rank is the position of the first 1 bit among the remaining bits; frexp finds bit lengths exactly
+        # for 32 bit halves
+        high = (remainders >> np.uint64(32)).astype(float)
+        low = (remainders & np.uint64(0xffffffff)).astype(float)
+        bit_lengths = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        ranks = (remaining_bits - bit_lengths + 1).astype(np.uint8)
+        register_ranks = pd.Series(ranks).groupby(registers).max()
+        index = register_ranks.index.values
+        self.registers[index] = np.maximum(self.registers[index], register_ranks.values)
+
+    def merge(self, other):
+        """Add the values summarized by another HyperLogLog to this one."""
+        if other.p != self.p:
+            raise ValueError("Only HyperLogLog sketches with the same p can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """Returns: int, the approximate number of distinct values added to the sketch"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m ** 2 / np.sum(np.power(2.0, -self.registers.astype(float)))
+        zero_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zero_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zero_registers)
+        return int(round(estimate))
+
+
+class SpaceSavingSketch(object):
+    """A Space-Saving sketch of the most frequent values of a column.
+
+    The sketch keeps at most capacity counters. The count of a tracked value never underestimates its true count,
+    and overestimates it by at most the number of values added divided by capacity, so every value more frequent
+    than that is tracked. Sketches are merged by adding their counters and keeping the largest (Agarwal et al.,
+    "Mergeable Summaries", 2012).
+
+    Args:
+        capacity (int): the number of counters to keep
+    """
+
+    def __init__(self, capacity=100):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.count = 0
+        # Each tracked value maps to its (overestimated) count and the maximum overestimation
+        self.counters = OrderedDict()
+
+    @classmethod
+    def from_relative_error(cls, allow_relative_error):
+        """Build a sketch whose counts are overestimated by at most allow_relative_error of the number of values."""
+        relative_error = get_relative_error(allow_relative_error) or DEFAULT_RELATIVE_ERROR
+        return cls(capacity=int(np.ceil(1 / relative_error)))
+
+    def _min_count(self):
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(count for count, _ in self.counters.values())
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Args:
+            values (array-like): values, without nulls
+        """
+        value_counts = pd.Series(values).value_counts()
+        other = SpaceSavingSketch(self.capacity)
+        other.count = int(value_counts.sum())
+        # Counts beyond the capacity most frequent values are bounded by the smallest count kept
+        other.counters = OrderedDict(
+            (value, (int(count), 0)) for value, count in value_counts.iloc[:self.capacity].items()
+        )
+        self.merge(other)
+
+    def merge(self, other):
+        """Add the values summarized by another SpaceSavingSketch to this one."""
+        self_min, other_min = self._min_count(), other._min_count()
+        counters = OrderedDict()
+        # Values keep the order in which they were first added, so that ties are broken the same way on every run
+        for value in chain(self.counters, (value for value in other.counters if value not in self.counters)):
+            count, error = self.counters.get(value, (self_min, self_min))
+            other_count, other_error = other.counters.get(value, (other_min, other_min))
+            counters[value] = (count + other_count, error + other_error)
+        if len(counters) > self.capacity:
+            counters = OrderedDict(sorted(counters.items(), key=lambda item: -item[1][0])[:self.capacity])
+        self.counters = counters
+        self.count += other.count
+
+    def most_common(self, n=None):
+        """Return the most frequent values.
+
+        Args:
+            n (int or None): the number of values to return, or None for all tracked values
+
+        Returns:
+            list of tuple(value, count, lower_bound): tracked values with their estimated count and a lower bound of \
+            their true count, most frequent first
+        """
+        items = sorted(self.counters.items(), key=lambda item: -item[1][0])
+        if n is not None:
+            items = items[:n]
+        return [(value, count, count - error) for value, (count, error) in items]
@@ -3,6 +3,7 @@ from __future__ import division
 import copy
 import inspect
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 
@@ -13,14 +14,23 @@ from six import PY3, string_types
 
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
-from .dataset import Dataset
+from .dataset import Dataset, MetricRequest
 from .pandas_dataset import PandasDataset
+from .sketches import get_relative_error
+from .util import (
+    get_json_schema_validator,
+    is_json_parseable,
+    loads_json,
+    map_distinct_values,
+    match_strftime_format,
+    parse_datetimes,
+)
 
 logger = logging.getLogger(__name__)
 
 try:
     from pyspark.sql.functions import (
-        udf, col, lit,
+        udf, pandas_udf, col, lit,
         desc,
         stddev_samp,
         length as length_,
@@ -28,15 +38,161 @@ try:
         year,
         count,
         countDistinct,
-        monotonically_increasing_id
+        sum as sum_,
+        min as min_,
+        max as max_,
+        avg,
+        approx_count_distinct,
+        monotonically_increasing_id,
+        regexp_extract,
+        trim
     )
     import pyspark.sql.types as sparktypes
     from pyspark.ml.feature import Bucketizer
+    from pyspark import StorageLevel
     from pyspark.sql import Window
 except ImportError as e:
     logger.debug(str(e))
     logger.debug("Unable to load spark context; install optional spark dependency for support.")
 
+try:
+    import pyarrow
+except ImportError:
+    # pandas UDFs need pyarrow; without it, expectations fall back to Python UDFs
+    pyarrow = None
+
+
+def _parse_datetime_batch(values):
+    """Parse a batch of date strings in a pandas UDF, as dateutil.parser.parse would; nulls stay null."""
+    nonnull_values = values[values.notnull()]
+    parsed = parse_datetimes(nonnull_values) if len(nonnull_values) > 0 else nonnull_values
+    try:
+        parsed = pd.to_datetime(parsed)
+    except (TypeError, ValueError):
+        # Dates with different time zone offsets, or with and without one
+        parsed = pd.to_datetime(parsed, utc=True)
+    return parsed.reindex(values.index)
+
+
+def _batch_udf(batch_func, scalar_func, return_type):
+    """Wrap a function of a pandas Series in a pandas UDF or, when pyarrow is not installed, the equivalent function
+    of a single value in a Python UDF."""
+    if pyarrow is not None:
+        return pandas_udf(batch_func, return_type)
+    return udf(scalar_func, return_type)
+
+
+def _parse_datetime(val):
+    """Parse a date string in a Python UDF with dateutil.parser.parse; nulls stay null."""
+    if val is None:
+        return None
+    return parse(val)
+
+
+# Regular expressions of the strptime directives checked with native Spark expressions, as datetime.strptime
+# matches them; strptime also rejects year 0, seconds above 59 and days past the end of the month
+STRPTIME_DIRECTIVE_REGEXES = {
+    "d": r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]",
+    "f": r"[0-9]{1,6}",
+    "H": r"2[0-3]|[0-1]\d|\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "M": r"[0-5]\d|\d",
+    "S": r"6[0-1]|[0-5]\d|\d",
+    "y": r"\d\d",
+    "Y": r"\d\d\d\d",
+}
+
+
+def _get_strptime_regex(strftime_format):
+    """Translate a strftime format into the regular expression datetime.strptime matches values against.
+
+    Returns:
+        tuple(str, dict): the regular expression, which is valid in both Python and Java, and the index of the group \
+        of each directive; or None if the format has a directive without a native translation, or repeats one
+    """
+    regex = ""
+    group_indexes = {}
+    idx = 0
+    while idx < len(strftime_format):
+        char = strftime_format[idx]
+        if char == "%" and idx + 1 < len(strftime_format):
+            directive = strftime_format[idx + 1]
+            idx += 2
+            if directive == "%":
+                regex += "%"
+                continue
+            if directive not in STRPTIME_DIRECTIVE_REGEXES or directive in group_indexes:
+                return None
+            group_indexes[directive] = len(group_indexes) + 1
+            regex += "(" + STRPTIME_DIRECTIVE_REGEXES[directive] + ")"
+            continue
+        idx += 1
+        if char.isspace():
+            # strptime matches any run of whitespace for whitespace in the format
+            if not regex.endswith(r"\s+"):
+                regex += r"\s+"
+        elif char in "\\.^$*+?(){}[]|":
+            regex += "\\" + char
+        else:
+            regex += char
+    return regex, group_indexes
+
+
+def _get_strftime_format_condition(column, strftime_format):
+    """Build a native Spark condition, true where a string column can be parsed by datetime.strptime with
+    strftime_format, or None if the format has directives that are only checked by strptime itself.
+
+    Spark's own to_timestamp is not used, since it is lenient on Spark 2 and depends on timeParserPolicy on Spark 3.
+    """
+    strptime_regex = _get_strptime_regex(strftime_format)
+    if strptime_regex is None:
+        return None
+    regex, group_indexes = strptime_regex
+    # strptime ignores case and requires the whole value to match
+    regex = "(?i)^" + regex + r"\z"
+
+    def directive_value(directive):
+        return trim(regexp_extract(column, regex, group_indexes[directive])).cast("int")
+
+    condition = column.rlike(regex)
+    if "Y" in group_indexes:
+        year = directive_value("Y")
+        condition = condition & (year >= 1)
+    elif "y" in group_indexes:
+        year = when(directive_value("y") <= 68, directive_value("y") + 2000).otherwise(directive_value("y") + 1900)
+    else:
+        year = lit(1900)
+    if "S" in group_indexes:
+        condition = condition & (directive_value("S") <= 59)
+    if "d" in group_indexes:
+        month = directive_value("m") if "m" in group_indexes else lit(1)
+        is_leap_year = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+        days_in_month = when(month == 2, when(is_leap_year, 29).otherwise(28)) \
+            .when(month.isin(4, 6, 9, 11), 30).otherwise(31)
+        condition = condition & (directive_value("d") <= days_in_month)
+    return condition
+
+
+class _ColumnMapConditionRecorder(object):
+    """Stands in for the one column DataFrame passed to a Spark column map expectation, recording the "__success"
+    condition the expectation adds to it, so that validate can evaluate the conditions of a whole suite in one
+    aggregation."""
+
+    def __init__(self, column):
+        self.columns = [column]
+        self.condition = None
+
+    def __getitem__(self, item):
+        if item not in (0, self.columns[0]):
+            raise KeyError(item)
+        return col(self.columns[0])
+
+    def withColumn(self, col_name, condition):
+        if col_name != '__success':
+            raise NotImplementedError("Only the __success condition of a column map expectation can be recorded.")
+        self.condition = condition
+        return self
+
 
 class MetaSparkDFDataset(Dataset):
     """MetaSparkDFDataset is a thin layer between Dataset and SparkDFDataset.
@@ -69,13 +225,6 @@ class MetaSparkDFDataset(Dataset):
         @cls.expectation(argspec)
         @wraps(func)
         def inner_wrapper(self, column, mostly=None, result_format=None, *args, **kwargs):
-            """
-            This whole decorator is pending a re-write. Currently there is are huge performance issues
-            when the # of unexpected elements gets large (10s of millions). Additionally, there is likely
-            easy optimization opportunities by coupling result_format with how many different transformations
-            are done on the dataset, as is done in sqlalchemy_dataset.
-            """
-
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
@@ -91,37 +240,52 @@ class MetaSparkDFDataset(Dataset):
 
             col_df = self.spark_df.select(column)  # pyspark.sql.DataFrame
 
-            # a couple of tests indicate that caching here helps performance
-            col_df.cache()
-            element_count = self.get_row_count()
-
             # FIXME temporary fix for missing/ignored value
-            if func.__name__ not in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
+            null_expectation = func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']
+            if not null_expectation:
                 col_df = col_df.filter(col_df[0].isNotNull())
-                # these nonnull_counts are cached by SparkDFDataset
-                nonnull_count = self.get_column_nonnull_count(column)
-            else:
-                nonnull_count = element_count
 
             # success_df will have columns [column, '__success']
             # this feels a little hacky, so might want to change
             success_df = func(self, col_df, *args, **kwargs)
-            success_count = success_df.filter('__success = True').count()
+
+            count_results = self._get_fused_column_map_count_results(func, column, *args, **kwargs)
+            if count_results is not None:
+                element_count = count_results['element_count']
+                nonnull_count = count_results['nonnull_count']
+                success_count = count_results['success_count']
+            else:
+                # Count the evaluated values and the successes in a single job. The count is the nonnull count (or
+                # the row count for the null expectations), which later expectations on the column reuse.
+                counts = success_df.agg(
+                    count(lit(1)).alias('evaluated_count'),
+                    sum_(when(col('__success'), 1).otherwise(0)).alias('success_count')
+                ).collect()[0]
+                success_count = counts['success_count'] or 0
+                if null_expectation:
+                    element_count = nonnull_count = counts['evaluated_count']
+                    self._cache_metric(MetricRequest('get_row_count', None), element_count)
+                else:
+                    nonnull_count = counts['evaluated_count']
+                    self._cache_metric(MetricRequest('get_column_nonnull_count', column), nonnull_count)
+                    element_count = self.get_row_count()
 
             unexpected_count = nonnull_count - success_count
-            if unexpected_count == 0:
-                # save some computation time if no unexpected items
+            if unexpected_count == 0 or result_format['result_format'] == 'BOOLEAN_ONLY':
+                # save some computation time if no unexpected items, or if they will not be reported
                 maybe_limited_unexpected_list = []
             else:
-                # here's an example of a place where we could do optimizations if we knew result format: see
-                # comment block below
                 unexpected_df = success_df.filter('__success = False')
-                if unexpected_count_limit:
+                if unexpected_count_limit is not None:
                     unexpected_df = unexpected_df.limit(unexpected_count_limit)
+                    rows = unexpected_df.collect()
+                else:
+                    # Stream partitions to the driver one at a time rather than collecting them all at once
+                    rows = unexpected_df.toLocalIterator()
                 maybe_limited_unexpected_list = [
                     row[column]
                     for row
-                    in unexpected_df.collect()
+                    in rows
                 ]
 
                 if "output_strftime_format" in kwargs:
@@ -170,12 +334,12 @@ class MetaSparkDFDataset(Dataset):
                 except KeyError:
                     pass
 
-            col_df.unpersist()
-
             return return_obj
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Exposed so that validate can compile the conditions of a whole suite into a single aggregation
+        inner_wrapper._column_map_condition = func
 
         return inner_wrapper
 
@@ -329,12 +493,55 @@ class SparkDFDataset(MetaSparkDFDataset):
         else:
             raise ValueError("from_dataset requires a SparkDFDataset dataset")
 
+    # Column map expectations whose conditions are not evaluated in the aggregation of the whole suite: window
+    # functions are not allowed inside aggregate functions, and pandas UDFs expect nulls to be filtered out first
+    unfused_column_map_expectations = {
+        'expect_column_values_to_be_unique',
+        'expect_column_values_to_match_strftime_format',
+        'expect_column_values_to_be_json_parseable',
+        'expect_column_values_to_match_json_schema',
+    }
+
+    # Statistics that _describe_column computes for every numeric column at once
+    described_metrics = [
+        'get_column_nonnull_count',
+        'get_column_mean',
+        'get_column_stdev',
+        'get_column_min',
+        'get_column_max',
+        'get_column_sum',
+    ]
+
     def __init__(self, spark_df, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self.spark_df = spark_df
+        # When set, validate persists the columns read by its suite at this storage level (such as "MEMORY_AND_DISK"
+        # or "DISK_ONLY") and releases them when it is done, instead of persisting the whole DataFrame here; "NONE"
+        # disables persistence
+        self._persist_level = kwargs.pop("persist_level", None)
+        if self._persist_level is not None:
+            self._persist_level = self._persist_level.upper()
+            if self._persist_level != "NONE" and \
+                    not isinstance(getattr(StorageLevel, self._persist_level, None), StorageLevel):
+                raise ValueError("persist_level must be NONE or the name of a pyspark StorageLevel.")
+        # The DataFrame of the dataset while spark_df holds the columns persisted for a validation
+        self._unprojected_spark_df = None
         self._persist = kwargs.pop("persist", True)
-        if self._persist:
+        if self._persist and self._persist_level is None:
             self.spark_df.persist()
+        # When enabled, validate computes the planned metrics and the counts of every column_map_expectation in the
+        # suite with a single aggregation of the DataFrame
+        self._fuse_expectations = kwargs.pop("fuse_expectations", True)
+        # The relative error of medians and quantiles computed without an explicit allow_relative_error; exact
+        # quantiles require Spark to keep all the values of a column
+        self._default_relative_error = get_relative_error(kwargs.pop("default_relative_error", False))
+        # When set, distinct values expectations only collect this many values outside of their value set, and
+        # full value counts are streamed to the driver
+        self._value_counts_limit = kwargs.pop("value_counts_limit", None)
+        # Replaced as a whole when the suite aggregation completes, and only read while expectations are evaluated,
+        # so that validate(max_workers=...) threads can share it without a lock
+        self._column_map_count_results = {}
+        self._pending_column_map_conditions = OrderedDict()
         super(SparkDFDataset, self).__init__(*args, **kwargs)
 
     def head(self, n=5):
@@ -349,13 +556,213 @@ class SparkDFDataset(MetaSparkDFDataset):
             )
         )
 
+    @DocInherit
+    def validate(self, *args, **kwargs):
+        try:
+            return super(SparkDFDataset, self).validate(*args, **kwargs)
+        finally:
+            self._release_suite_columns()
+
+    def _get_suite_columns(self, expectations):
+        """Return the columns read by a list of expectations, or None if some of them may read any column."""
+        table_columns = self.get_table_columns()
+        columns = []
+        for expectation_type, evaluation_args in expectations:
+            expectation_columns = [
+                evaluation_args[arg] for arg in ["column", "column_A", "column_B"] if arg in evaluation_args
+            ]
+            expectation_columns += evaluation_args.get("column_list") or []
+            if len(expectation_columns) == 0 and not expectation_type.startswith("expect_table_"):
+                return None
+            for column in expectation_columns:
+                if isinstance(column, string_types) and column in table_columns and column not in columns:
+                    columns.append(column)
+        return columns
+
+    def _persist_suite_columns(self, expectations):
+        """Persist the columns read by the suite being validated at persist_level, for the duration of validate."""
+        if self._persist_level in [None, "NONE"] or self._unprojected_spark_df is not None:
+            return
+        columns = self._get_suite_columns(expectations)
+        if columns is not None and len(columns) == 0:
+            # Table level expectations only count rows
+            return
+        persisted_df = self.spark_df if columns is None else self.spark_df.select(*columns)
+        self._unprojected_spark_df = self.spark_df
+        self.spark_df = persisted_df.persist(getattr(StorageLevel, self._persist_level))
+        logger.debug("Persisted columns %s at %s for validation" %
+                     (", ".join(self.spark_df.columns), self._persist_level))
+
+    def _release_suite_columns(self):
+        if self._unprojected_spark_df is None:
+            return
+        self.spark_df.unpersist()
+        self.spark_df = self._unprojected_spark_df
+        self._unprojected_spark_df = None
+
+    def _evaluate_expectation_for_validation(self, expectation, evaluation_args, resolution_error, catch_exceptions):
+        cache_info = self._metric_cache.info()
+        result = super(SparkDFDataset, self)._evaluate_expectation_for_validation(
+            expectation, evaluation_args, resolution_error, catch_exceptions)
+        # Expectations evaluated concurrently share the counters
+        evaluated_cache_info = self._metric_cache.info()
+        logger.debug("%s on %s: %d metric cache hits, %d misses" % (
+            expectation.expectation_type,
+            evaluation_args.get("column", "the table"),
+            evaluated_cache_info.hits - cache_info.hits,
+            evaluated_cache_info.misses - cache_info.misses
+        ))
+        return result
+
+    def _get_column_map_condition(self, expectation_type, column, *args, **kwargs):
+        """Record the "__success" condition a column map expectation builds for a column, or return None if it
+        cannot be evaluated in an aggregation of the whole DataFrame."""
+        if expectation_type in self.unfused_column_map_expectations or kwargs.get("parse_strings_as_datetimes"):
+            return None
+        condition_func = getattr(getattr(self, expectation_type, None), "_column_map_condition", None)
+        if condition_func is None:
+            return None
+        return condition_func(self, _ColumnMapConditionRecorder(column), *args, **kwargs).condition
+
+    @staticmethod
+    def _get_column_map_condition_key(expectation_type, column, condition):
+        """Identify a column map evaluation by the expression of its condition, so that counts computed for the whole
+        suite can be matched to the expectation that needs them."""
+        null_expectation = expectation_type in ['expect_column_values_to_not_be_null',
+                                                'expect_column_values_to_be_null']
+        return column, null_expectation, str(condition)
+
+    def _get_fused_column_map_count_results(self, func, column, *args, **kwargs):
+        """Return the element, nonnull, and success counts of a column map expectation computed by the aggregation
+        of the suite during validate, or None if they have to be counted separately."""
+        if not (self._active_validation and self._column_map_count_results):
+            return None
+        try:
+            condition = self._get_column_map_condition(func.__name__, column, *args, **kwargs)
+            if condition is None:
+                return None
+            key = self._get_column_map_condition_key(func.__name__, column, condition)
+            return dict(self._column_map_count_results[key])
+        except Exception:
+            return None
+
+    def _prefetch_metrics(self, expectations):
+        self._persist_suite_columns(expectations)
+        self._column_map_count_results = {}
+        self._pending_column_map_conditions = OrderedDict()
+        if not self._fuse_expectations:
+            super(SparkDFDataset, self)._prefetch_metrics(expectations)
+            return
+
+        table_columns = self.get_table_columns()
+        for expectation_type, evaluation_args in expectations:
+            kwargs = dict(evaluation_args)
+            column = kwargs.pop("column", None)
+            if not isinstance(column, string_types) or column not in table_columns:
+                continue
+            for arg in ["mostly", "result_format", "include_config", "catch_exceptions", "meta"]:
+                kwargs.pop(arg, None)
+            try:
+                condition = self._get_column_map_condition(expectation_type, column, **kwargs)
+            except Exception as e:
+                # The expectation will report the error itself when it is evaluated
+                logger.debug("Not fusing %s on column %s: %s" % (expectation_type, column, str(e)))
+                continue
+            if condition is not None:
+                key = self._get_column_map_condition_key(expectation_type, column, condition)
+                self._pending_column_map_conditions[key] = condition
+
+        # The conditions are evaluated by _compute_metrics, in the aggregation computing the planned metrics
+        super(SparkDFDataset, self)._prefetch_metrics(expectations)
+        if len(self._pending_column_map_conditions) > 0:
+            # Every planned metric was already cached
+            self._compute_metrics([])
+
+    def _get_metric_aggregate(self, metric_request, column_types):
+        """Build the aggregate expression computing a metric, or return None if its getter must compute it."""
+        metric, column = metric_request
+        if metric == 'get_row_count':
+            return count(lit(1))
+        if column not in column_types:
+            return None
+        if metric == 'get_column_nonnull_count':
+            return count(col(column))
+        if metric == 'get_column_min':
+            return min_(col(column))
+        if metric == 'get_column_max':
+            return max_(col(column))
+        if metric == 'get_column_stdev':
+            return stddev_samp(col(column))
+        if metric == 'get_column_unique_count':
+            return countDistinct(col(column))
+        if metric == 'get_column_mean' and column_types[column].simpleString() in ('int', 'float', 'double', 'bigint'):
+            return avg(col(column))
+        if metric == 'get_column_sum' and isinstance(column_types[column], sparktypes.NumericType):
+            return sum_(col(column))
+        return None
+
+    def _compute_metrics(self, metric_requests):
+        """Compute the metrics that have an aggregate expression, together with the column map conditions pending
+        from _prefetch_metrics, in a single aggregation of the DataFrame; other metrics are computed by their
+        getters."""
+        conditions = self._pending_column_map_conditions
+        self._pending_column_map_conditions = OrderedDict()
+        column_types = {field.name: field.dataType for field in self.spark_df.schema.fields}
+
+        aggregates = [count(lit(1)).alias('__element_count')]
+        aggregated_requests = []
+        other_requests = []
+        for metric_request in metric_requests:
+            aggregate = self._get_metric_aggregate(metric_request, column_types)
+            if aggregate is None:
+                other_requests.append(metric_request)
+            else:
+                aggregates.append(aggregate.alias('__metric_%d' % len(aggregated_requests)))
+                aggregated_requests.append(metric_request)
+        for idx, ((column, null_expectation, _), condition) in enumerate(conditions.items()):
+            if null_expectation:
+                evaluated = lit(True)
+            else:
+                evaluated = col(column).isNotNull()
+            aggregates.append(sum_(when(evaluated, 1).otherwise(0)).alias('__evaluated_count_%d' % idx))
+            aggregates.append(sum_(when(evaluated & condition, 1).otherwise(0)).alias('__success_count_%d' % idx))
+
+        metrics = {}
+        if len(aggregates) > 1:
+            try:
+                row = self.spark_df.agg(*aggregates).collect()[0]
+            except Exception as e:
+                logger.warning("Unable to compute metrics in a single aggregation: %s" % str(e))
+                return super(SparkDFDataset, self)._compute_metrics(metric_requests)
+            element_count = row['__element_count']
+            for idx, metric_request in enumerate(aggregated_requests):
+                metrics[metric_request] = row['__metric_%d' % idx]
+            self._cache_metric(MetricRequest('get_row_count', None), element_count)
+            column_map_count_results = dict(self._column_map_count_results)
+            for idx, (key, _) in enumerate(conditions.items()):
+                column, null_expectation, _ = key
+                evaluated_count = row['__evaluated_count_%d' % idx] or 0
+                column_map_count_results[key] = {
+                    'element_count': element_count,
+                    'nonnull_count': evaluated_count,
+                    'success_count': row['__success_count_%d' % idx] or 0,
+                }
+                if not null_expectation:
+                    self._cache_metric(MetricRequest('get_column_nonnull_count', column), evaluated_count)
+            self._column_map_count_results = column_map_count_results
+
+        metrics.update(super(SparkDFDataset, self)._compute_metrics(other_requests))
+        return metrics
+
     def get_row_count(self):
         return self.spark_df.count()
 
     def get_column_count(self):
-        return len(self.spark_df.columns)
+        return len(self.get_table_columns())
 
     def get_table_columns(self):
+        if self._unprojected_spark_df is not None:
+            return self._unprojected_spark_df.columns
         return self.spark_df.columns
 
     def get_column_nonnull_count(self, column):
@@ -366,27 +773,59 @@ class SparkDFDataset(MetaSparkDFDataset):
         types = dict(self.spark_df.dtypes)
         if types[column] not in ('int', 'float', 'double', 'bigint'):
             raise TypeError('Expected numeric column type for function mean()')
-        result = self.spark_df.select(column).groupBy().mean().collect()[0]
-        return result[0] if len(result) > 0 else None
+        return self._describe_column(column)['get_column_mean']
 
     def get_column_sum(self, column):
+        if self._is_numeric_column(column):
+            return self._describe_column(column)['get_column_sum']
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
+    def _is_numeric_column(self, column):
+        return isinstance(self.spark_df.schema[column].dataType, sparktypes.NumericType)
+
     def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
+        """Compute the basic statistics of a numeric column in a single aggregation, along with those of every other
+        numeric column of the DataFrame when caching is enabled.
+
+        All statistics computed are stored in the metric cache, so that the first getter called for any numeric
+        column (for instance by a profiler) computes the values of all the others.
+
+        Args:
+            column (str): the numeric column to describe
+
+        Returns:
+            dict: the statistics of the column, keyed by the name of their metric getter
+        """
+        column_types = {field.name: field.dataType for field in self.spark_df.schema.fields}
+        columns = [column]
+        if self.caching:
+            columns += [
+                name for name, data_type in column_types.items()
+                if name != column and isinstance(data_type, sparktypes.NumericType)
+            ]
+
+        metric_requests = []
+        aggregates = []
+        for described_column in columns:
+            for metric in self.described_metrics:
+                metric_request = MetricRequest(metric, described_column)
+                aggregate = self._get_metric_aggregate(metric_request, column_types)
+                if aggregate is not None:
+                    aggregates.append(aggregate.alias('__metric_%d' % len(metric_requests)))
+                    metric_requests.append(metric_request)
+
+        row = self.spark_df.agg(*aggregates).collect()[0]
+        description = {}
+        for idx, metric_request in enumerate(metric_requests):
+            value = row['__metric_%d' % idx]
+            self._cache_metric(metric_request, value)
+            if metric_request.column == column:
+                description[metric_request.metric] = value
+        return description
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if not parse_strings_as_datetimes and self._is_numeric_column(column):
+            return self._describe_column(column)['get_column_max']
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
         if parse_strings_as_datetimes:
             temp_column = self._apply_dateutil_parse(temp_column)
@@ -396,6 +835,8 @@ class SparkDFDataset(MetaSparkDFDataset):
         return result[0][0]
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if not parse_strings_as_datetimes and self._is_numeric_column(column):
+            return self._describe_column(column)['get_column_min']
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
         if parse_strings_as_datetimes:
             temp_column = self._apply_dateutil_parse(temp_column)
@@ -413,53 +854,139 @@ class SparkDFDataset(MetaSparkDFDataset):
             raise ValueError(
                 "collate parameter is not supported in SparkDFDataset"
             )
-        value_counts = self.spark_df.select(column)\
-            .where(col(column).isNotNull())\
-            .groupBy(column)\
-            .count()
+        value_counts = self._get_grouped_value_counts(column)
         if sort == "value":
             value_counts = value_counts.orderBy(column)
         elif sort == "count":
             value_counts = value_counts.orderBy(desc("count"))
-        value_counts = value_counts.collect()
-        series = pd.Series(
-            [row['count'] for row in value_counts],
+        if self._value_counts_limit is not None:
+            # Stream partitions to the driver one at a time rather than collecting them all at once
+            value_counts = value_counts.toLocalIterator()
+        else:
+            value_counts = value_counts.collect()
+        return self._build_value_counts_series(column, value_counts)
+
+    def _get_grouped_value_counts(self, column):
+        return self.spark_df.select(column)\
+            .where(col(column).isNotNull())\
+            .groupBy(column)\
+            .count()
+
+    @staticmethod
+    def _build_value_counts_series(column, rows):
+        values = []
+        counts = []
+        for row in rows:
+            values.append(row[column])
+            counts.append(row['count'])
+        return pd.Series(
+            counts,
             index=pd.Index(
-                data=[row[column] for row in value_counts],
+                data=values,
                 name="value"
             ),
             name="count"
         )
-        return series
 
-    def get_column_unique_count(self, column):
+    def _get_column_value_counts_for_value_set(self, column, value_set, parse_strings_as_datetimes=False):
+        if self._value_counts_limit is None or parse_strings_as_datetimes:
+            return self.get_column_value_counts(column)
+        # Only the counts of the values of the set and of the value_counts_limit most frequent other values leave the
+        # executors, which is enough to compare the distinct values to the set
+        value_counts = self._get_grouped_value_counts(column)
+        if value_set is None:
+            rows = value_counts.orderBy(desc("count")).limit(self._value_counts_limit)
+        else:
+            value_set = list(value_set)
+            rows = value_counts.filter(col(column).isin(value_set)).union(
+                value_counts.filter(~col(column).isin(value_set)).orderBy(desc("count")).limit(
+                    self._value_counts_limit)
+            )
+        return self._build_value_counts_series(column, rows.orderBy(column).collect())
+
+    def _plan_metrics(self, expectations):
+        metric_requests = super(SparkDFDataset, self)._plan_metrics(expectations)
+        if self._value_counts_limit is not None:
+            # Distinct values expectations do not need all the value counts of a column
+            metric_requests = [
+                metric_request for metric_request in metric_requests
+                if metric_request.metric != 'get_column_value_counts'
+            ]
+        return metric_requests
+
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error > 0:
+            # Spark estimates the count with a HyperLogLog++ sketch
+            return self.spark_df.agg(approx_count_distinct(column, rsd=relative_error)).collect()[0][0]
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
-    def get_column_modes(self, column):
-        """leverages computation done in _get_column_value_counts"""
-        s = self.get_column_value_counts(column)
-        return list(s[s == s.max()].index)
+    def get_column_modes(self, column, allow_relative_error=False):
+        """leverages computation done in _get_column_value_counts if it is cached, and otherwise only collects the
+        modes"""
+        # Exact modes satisfy any allowed relative error; only check that the argument is valid
+        get_relative_error(allow_relative_error)
+        key = self._get_metric_cache_key('get_column_value_counts', (column,), {})
+        if self.caching and key in self._metric_cache:
+            s = self.get_column_value_counts(column)
+            return list(s[s == s.max()].index)
+        value_counts = self._get_grouped_value_counts(column)
+        max_count = value_counts.agg(max_("count")).collect()[0][0]
+        if max_count is None:
+            return []
+        return [row[column] for row in value_counts.filter(col("count") == max_count).orderBy(column).collect()]
 
     def get_column_median(self, column):
         # We will get the two middle values by choosing an epsilon to add
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
 
-        # Note that this can be an expensive computation; we are not exposing
-        # spark's ability to estimate.
+        # Note that this can be an expensive computation unless the dataset is
+        # given a default_relative_error, which lets spark estimate it.
         # We add two to 2 * n_values to maintain a legitimate quantile
         # in the degnerate case when n_values = 0
-        result = self.spark_df.approxQuantile(column, [0.5, 0.5 + (1 / (2 + (2 * self.get_row_count())))], 0)
+        if self._default_relative_error > 0:
+            # The dataset allows approximate quantiles
+            return self._get_column_quantiles(column, [0.5], self._default_relative_error)[0]
+        result = self._get_column_quantiles(column, [0.5, 0.5 + (1 / (2 + (2 * self.get_row_count())))], 0.)
         return np.mean(result)
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
         if allow_relative_error is False:
-            allow_relative_error = 0.
-        if not isinstance(allow_relative_error, float) or allow_relative_error < 0 or allow_relative_error > 1:
-            raise ValueError("SparkDFDataset requires relative error to be False or to be a float between 0 and 1.")
-        return self.spark_df.approxQuantile(column, list(quantiles), allow_relative_error)
+            relative_error = self._default_relative_error
+        else:
+            relative_error = get_relative_error(allow_relative_error)
+        return self._get_column_quantiles(column, list(quantiles), relative_error)
+
+    def _get_column_quantiles(self, column, quantiles, relative_error):
+        """Return quantiles of a column with a given relative error.
+
+        Quantiles already computed for the column with the same relative error are kept in the metric cache, and all
+        the others are computed with a single approxQuantile call, so that the median, quantile and partition
+        expectations of a column share their work.
+        """
+        key = ('_column_quantiles', (column, relative_error))
+        known = {}
+        if self.caching:
+            try:
+                known = self._metric_cache.lookup(key)
+            except KeyError:
+                pass
+        missing = [quantile for quantile in quantiles if quantile not in known]
+        if len(missing) > 0:
+            values = self.spark_df.approxQuantile(column, missing, relative_error)
+            if len(values) != len(missing):
+                # Spark returns no quantiles for a column without values
+                return values
+            known = dict(known)
+            known.update(zip(missing, values))
+            if self.caching:
+                self._metric_cache[key] = known
+        return [known[quantile] for quantile in quantiles]
 
     def get_column_stdev(self, column):
+        if self._is_numeric_column(column):
+            return self._describe_column(column)['get_column_stdev']
         return self.spark_df.select(stddev_samp(col(column))).collect()[0][0]
 
     def get_column_hist(self, column, bins):
@@ -545,7 +1072,7 @@ class SparkDFDataset(MetaSparkDFDataset):
     def _apply_dateutil_parse(column):
         assert len(column.columns) == 1, "Expected DataFrame with 1 column"
         col_name = column.columns[0]
-        _udf = udf(parse, sparktypes.TimestampType())
+        _udf = _batch_udf(_parse_datetime_batch, _parse_datetime, sparktypes.TimestampType())
         return column.withColumn(col_name, _udf(col_name))
 
     # Expectations
@@ -705,17 +1232,81 @@ class SparkDFDataset(MetaSparkDFDataset):
         except ValueError as e:
             raise ValueError("Unable to use provided strftime_format. " + e.message)
 
+        try:
+            is_string_column = isinstance(self.spark_df.schema[column.columns[0]].dataType, sparktypes.StringType)
+        except KeyError:
+            is_string_column = False
+        if is_string_column:
+            condition = _get_strftime_format_condition(column[0], strftime_format)
+            if condition is not None:
+                return column.withColumn('__success', condition)
+
+        type_error_message = "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
+
+        def are_parseable_by_format(values):
+            if pd.api.types.infer_dtype(values, skipna=False) != "string":
+                raise TypeError(type_error_message)
+            return match_strftime_format(values, strftime_format)
+
         def is_parseable_by_format(val):
             try:
                 datetime.strptime(val, strftime_format)
                 return True
-            except TypeError as e:
-                raise TypeError("Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format.")
-
-            except ValueError as e:
+            except TypeError:
+                raise TypeError(type_error_message)
+            except ValueError:
                 return False
 
-        success_udf = udf(is_parseable_by_format)
+        success_udf = _batch_udf(are_parseable_by_format, is_parseable_by_format, sparktypes.BooleanType())
+        return column.withColumn('__success', success_udf(column[0]))
+
+    @DocInherit
+    @MetaSparkDFDataset.column_map_expectation
+    def expect_column_values_to_be_json_parseable(
+        self,
+        column,
+        mostly=None,
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        def is_json(values):
+            # Identical payloads of a batch are decoded once
+            return map_distinct_values(values, is_json_parseable)
+
+        success_udf = _batch_udf(is_json, is_json_parseable, sparktypes.BooleanType())
+        return column.withColumn('__success', success_udf(column[0]))
+
+    @DocInherit
+    @MetaSparkDFDataset.column_map_expectation
+    def expect_column_values_to_match_json_schema(
+        self,
+        column,
+        json_schema,
+        mostly=None,
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        # Raise jsonschema.SchemaError on the driver if the schema is not valid
+        get_json_schema_validator(json_schema)
+
+        def matches_json_schema(values):
+            # The validator is built once per batch on the executors
+            validator = get_json_schema_validator(json_schema)
+            return map_distinct_values(values, lambda val: validator.is_valid(loads_json(val)))
+
+        validators = []
+
+        def value_matches_json_schema(val):
+            # The validator is built once per task on the executors
+            if len(validators) == 0:
+                validators.append(get_json_schema_validator(json_schema))
+            return validators[0].is_valid(loads_json(val))
+
+        success_udf = _batch_udf(matches_json_schema, value_matches_json_schema, sparktypes.BooleanType())
         return column.withColumn('__success', success_udf(column[0]))
 
     @DocInherit
@@ -1,10 +1,12 @@
 from __future__ import division
 from six import PY3, string_types
 
+from collections import OrderedDict
 import uuid
 from functools import wraps
 import inspect
 import logging
+import threading
 import warnings
 from datetime import datetime
 from importlib import import_module
@@ -14,13 +16,20 @@ import numpy as np
 
 from dateutil.parser import parse
 
-from .dataset import Dataset
+from .dataset import Dataset, MetricRequest
 from .pandas_dataset import PandasDataset
+from .sketches import get_relative_error
+from .util import is_valid_continuous_partition_object
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 
 logger = logging.getLogger(__name__)
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2.7 without the futures backport
+    ThreadPoolExecutor = None
+
 try:
     import sqlalchemy as sa
     from sqlalchemy.engine import reflection
@@ -55,6 +64,26 @@ except ImportError:
     pybigquery = None
 
 
+# Dialects with the percentile_cont and percentile_disc ordered-set aggregate functions
+PERCENTILE_DIALECTS = ["postgresql", "oracle", "snowflake"]
+# Dialects with an approx_percentile(column, quantile) aggregate function
+APPROX_PERCENTILE_DIALECTS = ["presto", "trino", "awsathena", "snowflake"]
+# Dialects with a percentile_approx(column, quantile, accuracy) aggregate function
+PERCENTILE_APPROX_DIALECTS = ["hive", "databricks"]
+# Dialects with an APPROX_COUNT_DISTINCT(column) aggregate function, estimating distinct counts with HyperLogLog
+APPROX_COUNT_DISTINCT_DIALECTS = ["snowflake", "bigquery", "mssql", "oracle"]
+# Dialects with an approx_distinct(column, max_standard_error) aggregate function
+APPROX_DISTINCT_DIALECTS = ["presto", "trino", "awsathena"]
+# Smallest standard error accepted by approx_distinct
+MIN_APPROX_DISTINCT_ERROR = 0.0040625
+# Dialects with a WIDTH_BUCKET(operand, low, high, count) function
+WIDTH_BUCKET_DIALECTS = ["postgresql", "oracle", "snowflake", "redshift", "presto", "trino"]
+# Largest random sample read to estimate quantiles on dialects without approximate percentile functions
+MAX_QUANTILE_SAMPLE_SIZE = 100000
+# Aggregates per SELECT when computing metrics in bulk, below the column limits of common databases
+MAX_METRICS_PER_QUERY = 1000
+
+
 class SqlAlchemyBatchReference(object):
 
     def __init__(self, engine, table_name=None, schema=None, query=None):
@@ -126,9 +155,8 @@ class MetaSqlAlchemyDataset(Dataset):
             expected_condition = func(self, column, *args, **kwargs)
 
             # Added to prepare for when an ignore_values argument is added to the expectation
-            ignore_values = [None]
+            ignore_values_condition = self._get_column_map_ignore_values_condition(func.__name__, column)
             if func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
-                ignore_values = []
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
                 # This only happens on expect_column_values_to_not_be_null expectations.
@@ -136,57 +164,23 @@ class MetaSqlAlchemyDataset(Dataset):
                 # we will instruct the result formatting method to skip this step.
                 result_format['partial_unexpected_count'] = 0
 
-            ignore_values_conditions = []
-            if len(ignore_values) > 0 and None not in ignore_values or len(ignore_values) > 1 and None in ignore_values:
-                ignore_values_conditions += [
-                    sa.column(column).in_([val for val in ignore_values if val is not None])
-                ]
-            if None in ignore_values:
-                ignore_values_conditions += [sa.column(column).is_(None)]
-
-            if len(ignore_values_conditions) > 1:
-                ignore_values_condition = sa.or_(*ignore_values_conditions)
-            elif len(ignore_values_conditions) == 1:
-                ignore_values_condition = ignore_values_conditions[0]
-            else:
-                ignore_values_condition = sa.literal(False)
-
-            count_query = sa.select([
-                sa.func.count().label('element_count'),
-                sa.func.sum(
-                    sa.case([(ignore_values_condition, 1)], else_=0)
-                ).label('null_count'),
-                sa.func.sum(
-                    sa.case([
-                        (
-                            sa.and_(
-                                sa.not_(expected_condition),
-                                sa.not_(ignore_values_condition)
-                            ),
-                            1
-                        )
-                    ], else_=0)
-                ).label('unexpected_count')
-            ]).select_from(self._table)
-
-            count_results = dict(self.engine.execute(count_query).fetchone())
-
-            # Handle case of empty table gracefully:
-            if "element_count" not in count_results or count_results["element_count"] is None:
-                count_results["element_count"] = 0
-            if "null_count" not in count_results or count_results["null_count"] is None:
-                count_results["null_count"] = 0
-            if "unexpected_count" not in count_results or count_results["unexpected_count"] is None:
-                count_results["unexpected_count"] = 0
+            count_results = self._get_column_map_count_results(column, expected_condition, ignore_values_condition)
 
             # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)]).select_from(self._table).where(
-                    sa.and_(sa.not_(expected_condition),
-                            sa.not_(ignore_values_condition)
-                            )
-                ).limit(unexpected_count_limit)
-            )
+            if count_results["unexpected_count"] == 0:
+                # No unexpected values to look for
+                unexpected_query_results = []
+            elif result_format['result_format'] == 'BOOLEAN_ONLY' or unexpected_count_limit == 0:
+                # The result will not report any unexpected values
+                unexpected_query_results = []
+            else:
+                unexpected_query_results = self._get_connection().execute(
+                    sa.select([sa.column(column)]).select_from(self._table).where(
+                        sa.and_(sa.not_(expected_condition),
+                                sa.not_(ignore_values_condition)
+                                )
+                    ).limit(unexpected_count_limit)
+                ).fetchall()
 
             nonnull_count = count_results['element_count'] - \
                 count_results['null_count']
@@ -194,14 +188,14 @@ class MetaSqlAlchemyDataset(Dataset):
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_query_results:
                     if isinstance(x[column], string_types):
                         col = parse(x[column])
                     else:
                         col = x[column]
                     maybe_limited_unexpected_list.append(datetime.strftime(col, output_strftime_format))
             else:
-                maybe_limited_unexpected_list = [x[column] for x in unexpected_query_results.fetchall()]
+                maybe_limited_unexpected_list = [x[column] for x in unexpected_query_results]
 
             success_count = nonnull_count - count_results['unexpected_count']
             success, percent_success = self._calc_map_expectation_success(
@@ -232,9 +226,88 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Exposed so that validate can compile the conditions of a whole suite into a single query
+        inner_wrapper._column_map_condition = func
 
         return inner_wrapper
 
+    def _get_column_map_ignore_values_condition(self, expectation_type, column):
+        """Build the condition identifying rows that a column_map_expectation does not evaluate."""
+        ignore_values = [None]
+        if expectation_type in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
+            ignore_values = []
+
+        ignore_values_conditions = []
+        if len(ignore_values) > 0 and None not in ignore_values or len(ignore_values) > 1 and None in ignore_values:
+            ignore_values_conditions += [
+                sa.column(column).in_([val for val in ignore_values if val is not None])
+            ]
+        if None in ignore_values:
+            ignore_values_conditions += [sa.column(column).is_(None)]
+
+        if len(ignore_values_conditions) > 1:
+            ignore_values_condition = sa.or_(*ignore_values_conditions)
+        elif len(ignore_values_conditions) == 1:
+            ignore_values_condition = ignore_values_conditions[0]
+        else:
+            ignore_values_condition = sa.literal(False)
+
+        return ignore_values_condition
+
+    def _get_column_map_condition_key(self, column, expected_condition, ignore_values_condition):
+        """Identify a column map evaluation by the SQL it compiles to, so that counts computed for the whole suite
+        can be matched to the expectation that needs them."""
+        key = [column]
+        for condition in [expected_condition, ignore_values_condition]:
+            compiled = sa.select([condition]).compile(dialect=self.engine.dialect)
+            key.append(str(compiled))
+            key.append(repr(sorted(compiled.params.items())))
+        return tuple(key)
+
+    def _get_column_map_count_results(self, column, expected_condition, ignore_values_condition):
+        """Return element, null, and unexpected counts for a column map condition.
+
+        During validate, counts for every column_map_expectation in the suite are computed together by
+        _prefetch_column_map_counts; otherwise (or if the condition was not part of that query) they are computed
+        here with a dedicated query.
+        """
+        if self._active_validation and self._column_map_count_results:
+            try:
+                key = self._get_column_map_condition_key(column, expected_condition, ignore_values_condition)
+                return dict(self._column_map_count_results[key])
+            except (KeyError, sa.exc.SQLAlchemyError, TypeError):
+                pass
+
+        count_query = sa.select([
+            sa.func.count().label('element_count'),
+            sa.func.sum(
+                sa.case([(ignore_values_condition, 1)], else_=0)
+            ).label('null_count'),
+            sa.func.sum(
+                sa.case([
+                    (
+                        sa.and_(
+                            sa.not_(expected_condition),
+                            sa.not_(ignore_values_condition)
+                        ),
+                        1
+                    )
+                ], else_=0)
+            ).label('unexpected_count')
+        ]).select_from(self._table)
+
+        count_results = dict(self._get_connection().execute(count_query).fetchone())
+
+        # Handle case of empty table gracefully:
+        if "element_count" not in count_results or count_results["element_count"] is None:
+            count_results["element_count"] = 0
+        if "null_count" not in count_results or count_results["null_count"] is None:
+            count_results["null_count"] = 0
+        if "unexpected_count" not in count_results or count_results["unexpected_count"] is None:
+            count_results["unexpected_count"] = 0
+
+        return count_results
+
 
 class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
@@ -273,6 +346,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             except Exception as err:
                 # Currently we do no error handling if the engine doesn't work out of the box.
                 raise err
+        # The connection validate checks out for the queries of the thread running it
+        self._validation_connection = threading.local()
 
         # Get the dialect **for purposes of identifying types**
         if self.engine.dialect.name.lower() in ["postgresql", "mysql", "sqlite", "oracle", "mssql", "oracle"]:
@@ -325,6 +400,18 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             # reflection will not find the temporary schema
             self.columns = self.column_reflection_fallback()
 
+        # When enabled, validate computes the counts of every column_map_expectation in the suite with one query
+        self._fuse_column_map_expectations = kwargs.pop("fuse_column_map_expectations", True)
+        # Replaced as a whole by _prefetch_metrics, and only read while expectations are evaluated, so that
+        # validate(max_workers=...) threads can share it without a lock
+        self._column_map_count_results = {}
+        # When enabled, histograms of evenly spaced bins are computed with WIDTH_BUCKET where the dialect has it
+        self._use_width_bucket = kwargs.pop("use_width_bucket", False)
+        # When greater than one, validate submits the metric queries of the suite on up to this many pooled
+        # connections at once, and gathers their results before evaluating the expectations
+        self._max_concurrent_queries = kwargs.pop("max_concurrent_queries", None)
+        self._query_executor = None
+
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super(SqlAlchemyDataset, self).__init__(*args, **kwargs)
 
@@ -363,10 +450,347 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             )
         )
 
+    def validate(self, *args, **kwargs):
+        """Validate the dataset, running all the queries of the validation on a single connection checked out of
+        the engine pool, instead of checking a connection out and in for every query.
+
+        Only the queries of the thread running validate use that connection; the dataset can still be queried from
+        other threads meanwhile. Validations evaluating expectations concurrently (max_workers greater than one) or
+        running metric queries concurrently (max_concurrent_queries greater than one) still check out a connection
+        per query, since a connection cannot be shared between threads.
+        """
+        max_workers = inspect.getcallargs(super(SqlAlchemyDataset, self).validate, *args, **kwargs).get("max_workers")
+        if isinstance(self.engine, sa.engine.Connection) or (max_workers is not None and max_workers > 1) or \
+                self._use_concurrent_queries() or getattr(self._validation_connection, "connection", None) is not None:
+            return super(SqlAlchemyDataset, self).validate(*args, **kwargs)
+
+        self._validation_connection.connection = self.engine.connect()
+        try:
+            return super(SqlAlchemyDataset, self).validate(*args, **kwargs)
+        finally:
+            connection = self._validation_connection.connection
+            self._validation_connection.connection = None
+            connection.close()
+
+    def _get_connection(self):
+        """The connectable queries run on: the connection checked out by validate when it runs in this thread, and
+        otherwise the engine (or the connection the dataset was built with)."""
+        connection = getattr(self._validation_connection, "connection", None)
+        return self.engine if connection is None else connection
+
+    def _supports_concurrent_validation(self):
+        # A single connection (used for sqlite so that temporary tables persist) cannot be shared between threads;
+        # an engine checks out a separate connection from its pool for each query
+        return not isinstance(self.engine, sa.engine.Connection)
+
+    def _prefetch_metrics(self, expectations):
+        self._column_map_count_results = {}
+        # Each step computes metrics of several expectations in one query; expectations compute anything a failed
+        # step leaves out themselves
+        steps = []
+        if self.caching:
+            steps += [
+                (self._prefetch_quantiles, "Unable to compute medians and quantiles in a single query"),
+                # Run before the planned metrics when sequential, since it computes the row and nonnull counts too
+                (self._prefetch_distributions, "Unable to compute column distributions in a single query"),
+            ]
+        if self._fuse_column_map_expectations:
+            steps.append((self._prefetch_column_map_counts, "Unable to compute column map counts in a single query"))
+
+        def run_step(step):
+            prefetch, message = step
+            try:
+                prefetch(expectations)
+            except Exception as e:
+                logger.warning("%s: %s" % (message, str(e)))
+
+        if not self._use_concurrent_queries():
+            for step in steps:
+                run_step(step)
+            super(SqlAlchemyDataset, self)._prefetch_metrics(expectations)
+            return
+
+        # The steps and the queries of the planned metrics (submitted by _compute_metrics) share the executor, so
+        # that no more than max_concurrent_queries statements run at once
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrent_queries)
+        self._query_executor = executor
+        try:
+            futures = [executor.submit(run_step, step) for step in steps]
+            super(SqlAlchemyDataset, self)._prefetch_metrics(expectations)
+            for future in futures:
+                future.result()
+        finally:
+            self._query_executor = None
+            executor.shutdown()
+
+    def _use_concurrent_queries(self):
+        """Whether validate should submit the metric queries of the suite concurrently."""
+        if self._max_concurrent_queries is None or self._max_concurrent_queries <= 1:
+            return False
+        if ThreadPoolExecutor is None:
+            logger.warning("concurrent.futures is not available; running metric queries sequentially.")
+            return False
+        # A single connection cannot run statements from several threads
+        return self._supports_concurrent_validation()
+
+    def _map_queries(self, func, items):
+        """Call func on each item, concurrently on the query executor when validate has started one.
+
+        Returns:
+            list: for each item, a (result, exception) pair, with exception None if func returned
+        """
+        def call(item):
+            try:
+                return func(item), None
+            except Exception as e:
+                return None, e
+
+        if self._query_executor is None:
+            return [call(item) for item in items]
+        return list(self._query_executor.map(call, items))
+
+    def _prefetch_quantiles(self, expectations):
+        """Compute the medians and quantiles read by the median and quantile expectations of a suite, for all their
+        columns, in one query, and store them in the metric cache.
+
+        Only metrics the dialect computes with aggregate functions are part of the query; the others are computed
+        by their getters when the expectations are evaluated.
+
+        Args:
+            expectations (list): (expectation_type, evaluation_args) pairs for the expectations about to be validated
+        """
+        table_columns = self.get_table_columns()
+        # Metric cache key -> the expressions computing the metric
+        metric_expressions = OrderedDict()
+        for expectation_type, evaluation_args in expectations:
+            column = evaluation_args.get("column")
+            if not isinstance(column, string_types) or column not in table_columns:
+                continue
+            allow_relative_error = evaluation_args.get("allow_relative_error", False)
+            if expectation_type == "expect_column_median_to_be_between" and not allow_relative_error:
+                key = self._get_metric_cache_key('get_column_median', (column,), {})
+                expressions = [self._get_quantile_expression(column, 0.5, interpolation=True)]
+            elif expectation_type in ["expect_column_median_to_be_between",
+                                      "expect_column_quantile_values_to_be_between"]:
+                if expectation_type == "expect_column_median_to_be_between":
+                    quantiles = (0.5,)
+                else:
+                    quantiles = tuple(evaluation_args.get("quantile_ranges", {}).get("quantiles", []))
+                try:
+                    relative_error = get_relative_error(allow_relative_error)
+                except ValueError:
+                    continue
+                if self.engine.dialect.name.lower() == "redshift" and relative_error == 0:
+                    continue
+                key = self._get_metric_cache_key('get_column_quantiles', (column, quantiles, allow_relative_error), {})
+                expressions = [self._get_quantile_expression(column, quantile, relative_error)
+                               for quantile in quantiles]
+            else:
+                continue
+            if key is None or key in self._metric_cache or len(expressions) == 0 or \
+                    any(expression is None for expression in expressions):
+                continue
+            metric_expressions[key] = expressions
+
+        if len(metric_expressions) == 0:
+            return
+
+        selects = []
+        for idx, expressions in enumerate(metric_expressions.values()):
+            selects += [expression.label("quantile_%d_%d" % (idx, quantile_idx))
+                        for quantile_idx, expression in enumerate(expressions)]
+        row = self._get_connection().execute(sa.select(selects).select_from(self._table)).fetchone()
+
+        for idx, (key, expressions) in enumerate(metric_expressions.items()):
+            values = [row["quantile_%d_%d" % (idx, quantile_idx)] for quantile_idx in range(len(expressions))]
+            self._store_metric(key, values[0] if key[0] == 'get_column_median' else values)
+
+    def _prefetch_distributions(self, expectations):
+        """Compute the distributions read by the KL divergence expectations of a suite with continuous partition
+        objects, for all their columns, in one query with get_column_distributions.
+
+        Args:
+            expectations (list): (expectation_type, evaluation_args) pairs for the expectations about to be validated
+        """
+        table_columns = self.get_table_columns()
+        column_bins = []
+        for expectation_type, evaluation_args in expectations:
+            if expectation_type != "expect_column_kl_divergence_to_be_less_than":
+                continue
+            column = evaluation_args.get("column")
+            partition_object = evaluation_args.get("partition_object")
+            if not isinstance(column, string_types) or column not in table_columns or \
+                    evaluation_args.get("bucketize_data") is False or \
+                    not is_valid_continuous_partition_object(partition_object):
+                continue
+            bins = tuple(partition_object["bins"])
+            key = self._get_metric_cache_key('get_column_hist', (column, bins), {})
+            if key is None or key in self._metric_cache or (column, bins) in column_bins:
+                continue
+            column_bins.append((column, bins))
+
+        if len(column_bins) > 0:
+            self.get_column_distributions(column_bins)
+
+    def _prefetch_column_map_counts(self, expectations):
+        """Compute element, null, and unexpected counts for all column_map_expectations in one query.
+
+        Each expectation contributes a pair of conditional sums to a single SELECT over the table; the results are
+        keyed by the compiled conditions so that the column_map_expectation decorator can pick them up while the
+        validation is active.
+
+        Args:
+            expectations (list): (expectation_type, evaluation_args) pairs for the expectations about to be validated
+        """
+        table_columns = self.get_table_columns()
+        conditions = OrderedDict()
+        for expectation_type, evaluation_args in expectations:
+            condition_func = getattr(getattr(self, expectation_type, None), "_column_map_condition", None)
+            if condition_func is None:
+                continue
+
+            kwargs = dict(evaluation_args)
+            column = kwargs.pop("column", None)
+            if not isinstance(column, string_types) or column not in table_columns:
+                continue
+            for arg in ["mostly", "result_format", "include_config", "catch_exceptions", "meta"]:
+                kwargs.pop(arg, None)
+
+            try:
+                expected_condition = condition_func(self, column, **kwargs)
+                ignore_values_condition = self._get_column_map_ignore_values_condition(expectation_type, column)
+                key = self._get_column_map_condition_key(column, expected_condition, ignore_values_condition)
+            except Exception as e:
+                # The expectation will report the error itself when it is evaluated
+                logger.debug("Not fusing %s on column %s: %s" % (expectation_type, column, str(e)))
+                continue
+            conditions[key] = (expected_condition, ignore_values_condition)
+
+        if len(conditions) < 2:
+            # Nothing to gain over the query the expectation would run itself
+            return
+
+        selects = [sa.func.count().label('element_count')]
+        for idx, (expected_condition, ignore_values_condition) in enumerate(conditions.values()):
+            selects.append(
+                sa.func.sum(
+                    sa.case([(ignore_values_condition, 1)], else_=0)
+                ).label('null_count_%d' % idx)
+            )
+            selects.append(
+                sa.func.sum(
+                    sa.case([
+                        (
+                            sa.and_(
+                                sa.not_(expected_condition),
+                                sa.not_(ignore_values_condition)
+                            ),
+                            1
+                        )
+                    ], else_=0)
+                ).label('unexpected_count_%d' % idx)
+            )
+
+        count_results = dict(self._get_connection().execute(sa.select(selects).select_from(self._table)).fetchone())
+
+        element_count = count_results['element_count'] or 0
+        self._column_map_count_results = {
+            key: {
+                'element_count': element_count,
+                'null_count': count_results['null_count_%d' % idx] or 0,
+                'unexpected_count': count_results['unexpected_count_%d' % idx] or 0,
+            }
+            for idx, key in enumerate(conditions.keys())
+        }
+
+    def _get_metric_aggregate(self, metric_request, column_types):
+        """Build the aggregate expression computing a metric, or return None if its getter must compute it."""
+        metric, column = metric_request
+        if metric == 'get_row_count':
+            return sa.func.count()
+        if column not in column_types:
+            return None
+        if metric == 'get_column_nonnull_count':
+            return sa.func.count(sa.column(column))
+        if metric == 'get_column_unique_count':
+            return sa.func.count(sa.func.distinct(sa.column(column)))
+        if metric == 'get_column_min':
+            return sa.func.min(sa.column(column))
+        if metric == 'get_column_max':
+            return sa.func.max(sa.column(column))
+        # Averages of non-numeric columns are an error on most dialects, which would fail the whole query
+        if not isinstance(column_types[column], (sa.types.Integer, sa.types.Numeric)):
+            return None
+        if metric == 'get_column_sum':
+            return sa.func.sum(sa.column(column))
+        if metric == 'get_column_mean':
+            return sa.func.avg(sa.column(column))
+        if metric == 'get_column_stdev' and self.engine.dialect.name.lower() != "sqlite":
+            return sa.func.stddev_samp(sa.column(column))
+        return None
+
+    def _compute_metrics(self, metric_requests):
+        """Compute the metrics that have an aggregate expression, for all their columns, in a single SELECT over the
+        table; other metrics are computed by their getters. During a validation with max_concurrent_queries, the
+        SELECT and the getters run concurrently.
+
+        Args:
+            metric_requests (list of MetricRequest): the metrics to compute
+
+        Returns:
+            dict: a dictionary mapping MetricRequest to value
+        """
+        column_types = {column['name']: column.get('type') for column in self.columns}
+        aggregated_requests = []
+        selects = []
+        other_requests = []
+        for metric_request in metric_requests:
+            aggregate = self._get_metric_aggregate(metric_request, column_types)
+            if aggregate is None:
+                other_requests.append(metric_request)
+            else:
+                selects.append(aggregate.label('metric_%d' % len(aggregated_requests)))
+                aggregated_requests.append(metric_request)
+
+        def compute(task):
+            if isinstance(task, MetricRequest):
+                return super(SqlAlchemyDataset, self)._compute_metrics([task])
+            return self._get_connection().execute(
+                sa.select(selects[task:task + MAX_METRICS_PER_QUERY]).select_from(self._table)
+            ).fetchone()
+
+        # A task is either the start of a chunk of aggregates or a metric computed by its getter
+        tasks = list(range(0, len(selects), MAX_METRICS_PER_QUERY)) + other_requests
+        metrics = {}
+        remaining_requests = []
+        for task, (result, error) in zip(tasks, self._map_queries(compute, tasks)):
+            if isinstance(task, MetricRequest):
+                metrics.update(result)
+                continue
+            chunk_requests = aggregated_requests[task:task + MAX_METRICS_PER_QUERY]
+            if error is not None:
+                logger.warning("Unable to compute metrics in a single query: %s" % str(error))
+                remaining_requests += chunk_requests
+                continue
+            for idx, metric_request in enumerate(chunk_requests):
+                value = result['metric_%d' % (task + idx)]
+                if metric_request.metric in ['get_row_count', 'get_column_nonnull_count']:
+                    value = int(value or 0)
+                elif metric_request.metric == 'get_column_stdev':
+                    if value is None:
+                        # Let the getter report the missing standard deviation
+                        remaining_requests.append(metric_request)
+                        continue
+                    value = float(value)
+                metrics[metric_request] = value
+
+        metrics.update(super(SqlAlchemyDataset, self)._compute_metrics(remaining_requests))
+        return metrics
+
     def get_row_count(self):
         count_query = sa.select([sa.func.count()]).select_from(
             self._table)
-        return int(self.engine.execute(count_query).scalar())
+        return int(self._get_connection().execute(count_query).scalar())
 
     def get_column_count(self):
         return len(self.columns)
@@ -386,13 +810,13 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     sa.column(column).is_(None) if None in ignore_values else False), 1)], else_=0)
             ).label('null_count'),
         ]).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
+        count_results = dict(self._get_connection().execute(count_query).fetchone())
         element_count = int(count_results.get('element_count') or 0)
         null_count = int(count_results.get('null_count') or 0)
         return element_count - null_count
 
     def get_column_sum(self, column):
-        return self.engine.execute(
+        return self._get_connection().execute(
             sa.select([sa.func.sum(sa.column(column))]).select_from(
                 self._table)
         ).scalar()
@@ -400,7 +824,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        return self._get_connection().execute(
             sa.select([sa.func.max(sa.column(column))]).select_from(
                 self._table)
         ).scalar()
@@ -408,7 +832,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        return self._get_connection().execute(
             sa.select([sa.func.min(sa.column(column))]).select_from(
                 self._table)
         ).scalar()
@@ -435,7 +859,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 query = query.order_by(sa.column(column))
         elif sort == "count":
             query = query.order_by(sa.column("count").desc())
-        results = self.engine.execute(query.select_from(self._table)).fetchall()
+        results = self._get_connection().execute(query.select_from(self._table)).fetchall()
         series = pd.Series(
             [row[1] for row in results],
             index=pd.Index(
@@ -447,20 +871,57 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
-        return self.engine.execute(
+        return self._get_connection().execute(
             sa.select([sa.func.avg(sa.column(column))]).select_from(
                 self._table)
         ).scalar()
 
-    def get_column_unique_count(self, column):
-        return self.engine.execute(
-            sa.select([sa.func.count(sa.func.distinct(sa.column(column)))]).select_from(
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        unique_count_expression = None
+        if relative_error > 0:
+            unique_count_expression = self._get_approximate_unique_count_expression(column, relative_error)
+        if unique_count_expression is None:
+            unique_count_expression = sa.func.count(sa.func.distinct(sa.column(column)))
+        return self._get_connection().execute(
+            sa.select([unique_count_expression]).select_from(
                 self._table)
         ).scalar()
 
+    def _get_approximate_unique_count_expression(self, column, relative_error):
+        """Build the aggregate estimating the number of distinct values of a column with the functions of the
+        dialect, without sorting or hashing every distinct value.
+
+        Args:
+            column (str): the column
+            relative_error (float): the relative error allowed, greater than 0
+
+        Returns:
+            a SQL expression, or None if the dialect has no function estimating the count
+        """
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name in APPROX_COUNT_DISTINCT_DIALECTS:
+            return sa.func.approx_count_distinct(sa.column(column))
+        if dialect_name in APPROX_DISTINCT_DIALECTS:
+            if relative_error < MIN_APPROX_DISTINCT_ERROR:
+                return None
+            return sa.func.approx_distinct(sa.column(column), relative_error)
+        if dialect_name == "databricks":
+            return sa.func.approx_count_distinct(sa.column(column), relative_error)
+        if dialect_name == "redshift":
+            return sa.literal_column("approximate " + str(
+                sa.func.count(sa.distinct(sa.column(column))).compile(dialect=self.engine.dialect)
+            ))
+        return None
+
     def get_column_median(self, column):
+        median_expression = self._get_quantile_expression(column, 0.5, interpolation=True)
+        if median_expression is not None:
+            return self._get_connection().execute(sa.select([median_expression]).select_from(self._table)).scalar()
+
+        # Without percentile functions, read the two center values in sorted order
         nonnull_count = self.get_column_nonnull_count(column)
-        element_values = self.engine.execute(
+        element_values = self._get_connection().execute(
             sa.select([sa.column(column)]).order_by(sa.column(column)).where(
                 sa.column(column) != None
             ).offset(max(nonnull_count // 2 - 1, 0)).limit(2).select_from(self._table)
@@ -482,26 +943,126 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return column_median
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
-        selects = [sa.func.percentile_disc(quantile).within_group(
-            sa.column(column).asc()) for quantile in quantiles]
-        try:
-            if isinstance(self.engine.dialect, sqlalchemy_redshift.dialect.RedshiftDialect):
+        relative_error = get_relative_error(allow_relative_error)
+        if self.engine.dialect.name.lower() == "redshift" and relative_error == 0:
+            raise ValueError("Redshift does not support computing quantiles without approximation error; "
+                             "set allow_relative_error to True to allow approximate quantiles.")
+
+        selects = [self._get_quantile_expression(column, quantile, relative_error) for quantile in quantiles]
+        if all(select is not None for select in selects):
+            return list(self._get_connection().execute(sa.select(selects).select_from(self._table)).fetchone())
+        if relative_error > 0:
+            return self._get_column_quantiles_from_sample(column, quantiles, relative_error)
+        return self._get_column_quantiles_from_sorted_values(column, quantiles)
+
+    def _get_quantile_expression(self, column, quantile, relative_error=0., interpolation=False):
+        """Build the aggregate computing a quantile of a column with the functions of the dialect.
+
+        Args:
+            column (str): the column
+            quantile (float): the quantile, between 0 and 1
+            relative_error (float): the relative error allowed, 0 for an exact quantile
+            interpolation (boolean): interpolate between the two nearest values (percentile_cont) rather than \
+                return a value of the column (percentile_disc), where the dialect supports both
+
+        Returns:
+            a SQL expression, or None if the dialect has no function computing the quantile
+        """
+        dialect_name = self.engine.dialect.name.lower()
+        if relative_error > 0:
+            if dialect_name in APPROX_PERCENTILE_DIALECTS:
+                return sa.func.approx_percentile(sa.column(column), quantile)
+            if dialect_name in PERCENTILE_APPROX_DIALECTS:
+                return sa.func.percentile_approx(sa.column(column), quantile, int(np.ceil(1 / relative_error)))
+            if dialect_name == "bigquery":
+                # APPROX_QUANTILES returns the n + 1 boundaries of n approximately equal parts
+                n = max(100, int(np.ceil(1 / relative_error)))
+                return sa.literal_column("APPROX_QUANTILES(%s, %d)[OFFSET(%d)]" % (
+                    sa.column(column).compile(dialect=self.engine.dialect), n, int(round(quantile * n))))
+            if dialect_name == "redshift":
                 # Redshift does not have a percentile_disc method, but does support an approximate version
-                if allow_relative_error is True:
-                    selects = [sa.text(
-                        ", ".join(["approximate " + str(stmt.compile(dialect=self.engine.dialect, compile_kwargs={
-                            'literal_binds': True})) for stmt in selects])
-                    )]
-                else:
-                    raise ValueError("Redshift does not support computing quantiles without approximation error; "
-                                     "set allow_relative_error to True to allow approximate quantiles.")
-        except (AttributeError, TypeError):
-            pass
-        quantiles = self.engine.execute(sa.select(selects).select_from(self._table)).fetchone()
-        return list(quantiles)
+                return sa.literal_column("approximate " + str(
+                    sa.func.percentile_disc(quantile).within_group(sa.column(column).asc()).compile(
+                        dialect=self.engine.dialect, compile_kwargs={'literal_binds': True})
+                ))
+        if dialect_name in PERCENTILE_DIALECTS:
+            percentile = sa.func.percentile_cont if interpolation else sa.func.percentile_disc
+            return percentile(quantile).within_group(sa.column(column).asc())
+        return None
+
+    def _get_column_quantiles_from_sorted_values(self, column, quantiles):
+        """Read the quantiles (the smallest value with at least that fraction of the values at or below it, as
+        percentile_disc) by their row numbers in sorted order, for dialects without percentile functions.
+
+        All the quantiles are read in one query, which sorts the column once and returns only the requested rows.
+        """
+        nonnull_count = self.get_column_nonnull_count(column)
+        if nonnull_count == 0:
+            return [None for _ in quantiles]
+        row_numbers = [max(int(np.ceil(quantile * nonnull_count)), 1) for quantile in quantiles]
+        ranked_values = sa.select([
+            sa.column(column).label("value"),
+            sa.func.row_number().over(order_by=sa.column(column)).label("row_number")
+        ]).where(sa.column(column) != None).select_from(self._table).alias("ranked_values")
+        values = dict((row["row_number"], row["value"]) for row in self._get_connection().execute(
+            sa.select([ranked_values.c.value, ranked_values.c.row_number])
+            .where(ranked_values.c.row_number.in_(sorted(set(row_numbers))))
+        ).fetchall())
+        return [values[row_number] for row_number in row_numbers]
+
+    def _get_column_quantiles_from_sample(self, column, quantiles, relative_error):
+        """Estimate quantiles as the order statistics of a random sample of the values of a column, for dialects
+        without approximate percentile functions.
+
+        The sample is large enough that, by the Dvoretzky-Kiefer-Wolfowitz inequality, the rank of every returned
+        quantile is within relative_error of the requested one with probability 99%, whatever the distribution of
+        the values. It is drawn with a filter keeping each row with the same probability, in a single scan of the
+        table without sorting it. When the sample would hold most of the values, the exact quantiles are read instead.
+        """
+        nonnull_count = self.get_column_nonnull_count(column)
+        if nonnull_count == 0:
+            return [None for _ in quantiles]
+        sample_size = int(np.ceil(np.log(2 / 0.01) / (2 * relative_error ** 2)))
+        # Three standard deviations above the sample size, so that the filter rarely keeps fewer values
+        sample_fraction = (sample_size + 3 * np.sqrt(sample_size)) / nonnull_count
+        if sample_fraction >= 1 or sample_size > MAX_QUANTILE_SAMPLE_SIZE:
+            return self._get_column_quantiles_from_sorted_values(column, quantiles)
+
+        sample = sorted(row[0] for row in self._get_connection().execute(
+            sa.select([sa.column(column)]).where(sa.and_(
+                sa.column(column) != None,
+                self._get_sample_filter(sample_fraction)
+            )).select_from(self._table)
+        ).fetchall())
+        if len(sample) == 0:
+            return self._get_column_quantiles_from_sorted_values(column, quantiles)
+
+        result = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                result.append(self.get_column_min(column))
+            elif quantile >= 1:
+                result.append(self.get_column_max(column))
+            else:
+                result.append(sample[max(int(np.ceil(quantile * len(sample))) - 1, 0)])
+        return result
+
+    def _get_sample_filter(self, sample_fraction):
+        """Build a condition keeping each row independently with probability sample_fraction."""
+        dialect_name = self.engine.dialect.name.lower()
+        resolution = 1000000
+        if dialect_name == "mysql":
+            return sa.func.rand() < sample_fraction
+        if dialect_name == "mssql":
+            # RAND() is evaluated once per query in SQL Server; NEWID() is evaluated for each row
+            return sa.func.abs(sa.func.checksum(sa.func.newid())) % resolution < int(sample_fraction * resolution)
+        if dialect_name == "sqlite":
+            # random() returns a signed 64-bit integer in sqlite
+            return sa.func.abs(sa.func.random()) % resolution < int(sample_fraction * resolution)
+        return sa.func.random() < sample_fraction
 
     def get_column_stdev(self, column):
-        res = self.engine.execute(sa.select([
+        res = self._get_connection().execute(sa.select([
                 sa.func.stddev_samp(sa.column(column))
             ]).select_from(self._table).where(sa.column(column) != None)).fetchone()
         return float(res[0])
@@ -513,6 +1074,88 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
+        return self.get_column_distributions([(column, bins)])[0]["hist"]
+
+    def get_column_distributions(self, column_bins):
+        """Compute the distributions of several columns in a single query.
+
+        For each column, the query computes the minimum, maximum and nonnull count, the histogram of the values in
+        the given bins (as get_column_hist), and the counts of values strictly below the first and strictly above
+        the last bin edge (as get_column_count_in_range). When caching is enabled, all of them, as well as the row
+        count, are stored in the metric cache, so that the getters called by
+        expect_column_kl_divergence_to_be_less_than do not query the table again.
+
+        If the dataset was created with use_width_bucket=True and the dialect has a WIDTH_BUCKET function, the
+        histograms of evenly spaced bins are computed from the bucket of each value instead of a pair of
+        comparisons per bin. The database computes the bucket boundaries itself, so values within rounding error of
+        a bin edge may be counted in the adjacent bin.
+
+        Args:
+            column_bins (list): (column, bins) pairs, with bins a tuple of bin edges
+
+        Returns:
+            list of dict: for each pair, the "min", "max", "nonnull_count", "hist", "below_count" and \
+            "above_count" of the column
+        """
+        source = self._table
+        bucket_expressions = []
+        for column, bins in column_bins:
+            bucket_expressions.append(self._get_bucket_expression(column, bins))
+        if any(expression is not None for expression in bucket_expressions):
+            source = sa.select(
+                [sa.column(column) for column in OrderedDict.fromkeys(column for column, _ in column_bins)] +
+                [expression.label("bucket_%d" % idx) for idx, expression in enumerate(bucket_expressions)
+                 if expression is not None]
+            ).select_from(self._table).alias("buckets")
+
+        selects = [sa.func.count().label("element_count")]
+        for idx, (column, bins) in enumerate(column_bins):
+            if bucket_expressions[idx] is not None:
+                hist_expressions = self._get_bucket_hist_expressions(column, bins, sa.column("bucket_%d" % idx))
+            else:
+                hist_expressions = self._get_hist_expressions(column, bins)
+            selects += [
+                sa.func.min(sa.column(column)).label("min_%d" % idx),
+                sa.func.max(sa.column(column)).label("max_%d" % idx),
+                sa.func.count(sa.column(column)).label("nonnull_count_%d" % idx),
+                sa.func.sum(sa.case([(sa.column(column) < bins[0], 1)], else_=0)).label("below_count_%d" % idx),
+                sa.func.sum(sa.case([(sa.column(column) > bins[-1], 1)], else_=0)).label("above_count_%d" % idx),
+            ]
+            selects += [expression.label("bin_%d_%d" % (idx, bin_idx))
+                        for bin_idx, expression in enumerate(hist_expressions)]
+
+        row = self._get_connection().execute(sa.select(selects).select_from(source)).fetchone()
+
+        distributions = []
+        if self.caching:
+            self._cache_metric(MetricRequest('get_row_count', None), int(row["element_count"] or 0))
+        for idx, (column, bins) in enumerate(column_bins):
+            distribution = {
+                "min": row["min_%d" % idx],
+                "max": row["max_%d" % idx],
+                "nonnull_count": int(row["nonnull_count_%d" % idx] or 0),
+                "hist": [int(row["bin_%d_%d" % (idx, bin_idx)] or 0) for bin_idx in range(len(bins) - 1)],
+                "below_count": int(row["below_count_%d" % idx] or 0),
+                "above_count": int(row["above_count_%d" % idx] or 0),
+            }
+            distributions.append(distribution)
+            if self.caching:
+                self._cache_metric(MetricRequest('get_column_min', column), distribution["min"])
+                self._cache_metric(MetricRequest('get_column_max', column), distribution["max"])
+                self._cache_metric(MetricRequest('get_column_nonnull_count', column), distribution["nonnull_count"])
+                for metric, args, kwargs, value in [
+                    ('get_column_hist', (column, tuple(bins)), {}, distribution["hist"]),
+                    ('get_column_count_in_range', (column,), {"max_val": bins[0], "strict_max": True},
+                     distribution["below_count"]),
+                    ('get_column_count_in_range', (column,), {"min_val": bins[-1], "strict_min": True},
+                     distribution["above_count"]),
+                ]:
+                    key = self._get_metric_cache_key(metric, args, kwargs)
+                    if key is not None:
+                        self._store_metric(key, value)
+        return distributions
+
+    def _get_hist_expressions(self, column, bins):
         case_conditions = []
         idx = 0
         bins = list(bins)
@@ -526,7 +1169,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                             (sa.column(column) < bins[idx+1], 1)
                         ], else_=0
                     )
-                ).label("bin_" + str(idx))
+                )
             )
             idx += 1
 
@@ -541,7 +1184,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                             ), 1)
                         ], else_=0
                     )
-                ).label("bin_" + str(idx))
+                )
             )
 
         if (bins[-1] == np.inf) or (bins[-1] == float("inf")):
@@ -552,7 +1195,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                             (bins[-2] <= sa.column(column), 1)
                         ], else_=0
                     )
-                ).label("bin_" + str(len(bins)-1))
+                )
             )
         else:
             case_conditions.append(
@@ -565,19 +1208,33 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                             ), 1)
                         ], else_=0
                     )
-                ).label("bin_" + str(len(bins)-1))
+                )
             )
-
-        query = sa.select(
-            case_conditions
-        )\
-        .where(
-            sa.column(column) != None,
-        )\
-        .select_from(self._table)
-
-        hist = list(self.engine.execute(query).fetchone())
-        return hist
+        return case_conditions
+
+    def _get_bucket_expression(self, column, bins):
+        """Build the WIDTH_BUCKET expression of a column for evenly spaced finite bins, or return None if the
+        histogram must be computed with comparisons."""
+        if not self._use_width_bucket or self.engine.dialect.name.lower() not in WIDTH_BUCKET_DIALECTS:
+            return None
+        bins = np.array(bins, dtype=float)
+        if len(bins) < 2 or not np.all(np.isfinite(bins)) or \
+                not np.allclose(bins, np.linspace(bins[0], bins[-1], len(bins))):
+            return None
+        return sa.func.width_bucket(sa.column(column), float(bins[0]), float(bins[-1]), len(bins) - 1)
+
+    @staticmethod
+    def _get_bucket_hist_expressions(column, bins, bucket):
+        # WIDTH_BUCKET numbers the bins from 1, and puts the last bin edge in the overflow bucket; the last bin of
+        # get_column_hist includes it
+        n_bins = len(bins) - 1
+        case_conditions = [
+            sa.func.sum(sa.case([(bucket == bin_idx + 1, 1)], else_=0)) for bin_idx in range(n_bins - 1)
+        ]
+        case_conditions.append(
+            sa.func.sum(sa.case([(sa.or_(bucket == n_bins, sa.column(column) == bins[-1]), 1)], else_=0))
+        )
+        return case_conditions
 
     def get_column_count_in_range(self, column, min_val=None, max_val=None, strict_min=False, strict_max=True):
         if min_val is None and max_val is None:
@@ -616,7 +1273,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 ) \
                 .select_from(self._table)
 
-        return self.engine.execute(query).scalar()
+        return self._get_connection().execute(query).scalar()
 
     def create_temporary_table(self, table_name, custom_sql, schema_name=None):
         """
@@ -667,12 +1324,12 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         else:
             stmt = "CREATE TEMPORARY TABLE \"{table_name}\" AS {custom_sql}".format(
                 table_name=table_name, custom_sql=custom_sql)
-        self.engine.execute(stmt)
+        self._get_connection().execute(stmt)
 
     def column_reflection_fallback(self):
         """If we can't reflect the table, use a query to at least get column names."""
         sql = sa.select([sa.text("*")]).select_from(self._table).limit(1)
-        col_names = self.engine.execute(sql).keys()
+        col_names = self._get_connection().execute(sql).keys()
         col_dict = [{'name': col_name} for col_name in col_names]
         return col_dict
 
@@ -2,11 +2,38 @@
 
 from __future__ import division
 
+import json
+import re
+from datetime import datetime
+
+import jsonschema
+from dateutil.parser import parse
+from six import string_types
 from scipy import stats
 import pandas as pd
 import numpy as np
 import warnings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Integers with this many digits may not fit in 64 bits
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    try:
+        from pandas.core.tools.datetimes import guess_datetime_format
+    except ImportError:
+        guess_datetime_format = None
+
+# Patterns that cannot be joined into an alternation: numbered backreferences and conditionals, whose group numbers
+# would shift, and inline flags, which apply to the whole expression
+_UNCOMBINABLE_REGEX = re.compile(r"\\[1-9]|\(\?\([0-9]|\(\?[aiLmsux]+\)")
+
 
 def is_valid_partition_object(partition_object):
     """Tests whether a given object is a valid continuous or categorical partition object.
@@ -529,3 +556,183 @@ def create_multiple_expectations(df, columns, expectation_type, *args, **kwargs)
         results.append(expectation(column, *args,  **kwargs))
 
     return results
+
+
+def combine_regex_list(regex_list):
+    """Join regular expressions into one that matches a string wherever any of them does.
+
+    :param regex_list: The regular expressions to combine
+    :return: The combined regular expression, or None if the expressions cannot be combined safely
+    """
+    if any(_UNCOMBINABLE_REGEX.search(regex) for regex in regex_list):
+        return None
+    combined = "|".join("(?:%s)" % regex for regex in regex_list)
+    try:
+        re.compile(combined)
+    except re.error:
+        return None
+    return combined
+
+
+def match_regex_list(strings, regex_list, match_on="any"):
+    """Test a Series of strings against a list of regular expressions.
+
+    For match_on="any", the expressions are combined into a single alternation, so each string is scanned once
+    rather than once per expression. For match_on="all", each expression is only tested against the strings that
+    matched all the previous ones.
+
+    :param strings: A Series of strings
+    :param regex_list: The regular expressions to search for
+    :param match_on: "any" to test whether a string matches any expression, "all" to test whether it matches all
+    :return: A boolean Series with the index of strings
+    """
+    if len(regex_list) == 0:
+        raise ValueError("regex_list must contain at least one regular expression")
+    if match_on == "any":
+        combined = combine_regex_list(regex_list)
+        if combined is not None:
+            return strings.str.contains(combined)
+        matches = np.zeros(len(strings), dtype=bool)
+        for regex in regex_list:
+            remaining = np.flatnonzero(~matches)
+            if len(remaining) == 0:
+                break
+            matches[remaining] = strings.iloc[remaining].str.contains(regex).values
+    elif match_on == "all":
+        matches = np.ones(len(strings), dtype=bool)
+        for regex in regex_list:
+            remaining = np.flatnonzero(matches)
+            if len(remaining) == 0:
+                break
+            matches[remaining] = strings.iloc[remaining].str.contains(regex).values
+    else:
+        raise ValueError("match_on must be either 'any' or 'all'")
+    return pd.Series(matches, index=strings.index)
+
+
+def _is_complete_date_format(date_format):
+    """Whether strings in date_format parse to the same datetime with pandas and dateutil: dateutil fills missing
+    fields from the current date, picks the century of two-digit years relative to the current year, reads
+    ambiguous numeric dates month first, and pandas handles time zone offsets differently."""
+    return (
+        date_format is not None and
+        "%Y" in date_format and
+        any(directive in date_format for directive in ("%m", "%b", "%B")) and
+        "%d" in date_format and
+        not ("%m" in date_format and date_format.index("%d") < date_format.index("%m")) and
+        not any(directive in date_format for directive in ("%y", "%z", "%Z"))
+    )
+
+
+def parse_datetimes(values, errors="raise"):
+    """Parse a Series of date strings, with the same results as values.map(dateutil.parser.parse).
+
+    The format of the first value is inferred, and the values in that format are parsed by pandas in a single
+    vectorized call. Only the remaining values are parsed one by one by dateutil.
+
+    :param values: A Series of non-null values
+    :param errors: "raise" to raise the dateutil error for values that are not dates, as parse would, or "coerce" to \
+        return None for them (values that are not strings always raise)
+    :return: A Series of datetimes with the index of values
+    """
+    def parse_value(val):
+        try:
+            return parse(val)
+        except (ValueError, OverflowError):
+            if errors == "coerce":
+                return None
+            raise
+
+    if len(values) == 0 or guess_datetime_format is None or \
+            pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return values.map(parse_value)
+    date_format = guess_datetime_format(values.iloc[0])
+    if not _is_complete_date_format(date_format):
+        return values.map(parse_value)
+    parsed = pd.to_datetime(values, format=date_format, errors="coerce")
+    residue = parsed.isnull().values
+    if not residue.any():
+        return parsed
+    parsed = parsed.astype(object).values
+    parsed[residue] = [parse_value(val) for val in values.values[residue]]
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
+def match_strftime_format(values, strftime_format):
+    """Test whether each string of a Series can be parsed by datetime.strptime with strftime_format.
+
+    strptime is called once per distinct value.
+
+    :param values: A Series of strings
+    :param strftime_format: The format to match
+    :return: A boolean Series with the index of values
+    """
+    def is_parseable_by_format(val):
+        try:
+            datetime.strptime(val, strftime_format)
+            return True
+        except ValueError:
+            return False
+
+    return map_distinct_values(values, is_parseable_by_format).astype(bool)
+
+
+def map_distinct_values(values, func):
+    """Apply a function to each value of a Series, calling it once per distinct value.
+
+    :param values: A Series of non-null values
+    :param func: The function to apply
+    :return: A Series of the results, with the index of values
+    """
+    try:
+        codes, distinct_values = pd.factorize(values)
+    except TypeError:
+        # Unhashable values
+        return values.map(func)
+    if (codes < 0).any():
+        return values.map(func)
+    results = pd.Series([func(value) for value in distinct_values])
+    return pd.Series(results.values[codes], index=values.index)
+
+
+def loads_json(document):
+    """Decode a JSON document like json.loads, with orjson when it is installed.
+
+    Documents orjson rejects are decoded by json, which also accepts NaN. orjson decodes integers beyond 64 bits as
+    floats, so documents with long runs of digits are decoded by json as well.
+
+    :param document: The JSON document
+    :return: The decoded value
+    """
+    if orjson is not None and isinstance(document, string_types) and not _LONG_DIGIT_RUN.search(document):
+        try:
+            return orjson.loads(document)
+        except (ValueError, TypeError):
+            pass
+    return json.loads(document)
+
+
+def is_json_parseable(document):
+    """Test whether a value is a valid JSON document.
+
+    :param document: The value to test
+    :return: Boolean
+    """
+    try:
+        loads_json(document)
+        return True
+    except Exception:
+        return False
+
+
+def get_json_schema_validator(json_schema):
+    """Build a validator for a JSON schema, to validate many documents without checking the schema for each one as
+    jsonschema.validate does.
+
+    :param json_schema: The JSON schema
+    :return: A jsonschema validator, whose is_valid method tests a decoded document
+    :raises jsonschema.SchemaError: if the schema is not valid
+    """
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema)
@@ -32,7 +32,7 @@ class PandasDatasource(Datasource):
     interacting with the local filesystem (the default subdir_reader generator), and from
     existing in-memory dataframes.
     """
-    recognized_batch_parameters = {'reader_method', 'reader_options', 'limit', 'dataset_options'}
+    recognized_batch_parameters = {'reader_method', 'reader_options', 'limit', 'dataset_options', 'chunksize'}
 
     @classmethod
     def build_configuration(cls, data_asset_type=None, generators=None, boto3_options=None, reader_method=None,
@@ -114,6 +114,7 @@ class PandasDatasource(Datasource):
                                  reader_options=None,
                                  limit=None,
                                  dataset_options=None,
+                                 chunksize=None,
                                  ):
         # Note that we do not pass limit up, since even that will be handled by PandasDatasource
         batch_kwargs = super(PandasDatasource, self).process_batch_parameters(dataset_options=dataset_options)
@@ -147,6 +148,9 @@ class PandasDatasource(Datasource):
         if reader_method is not None:
             batch_kwargs["reader_method"] = reader_method
 
+        if chunksize is not None:
+            batch_kwargs["chunksize"] = chunksize
+
         return batch_kwargs
 
     def get_batch(self, batch_kwargs, batch_parameters=None):
@@ -163,6 +167,25 @@ class PandasDatasource(Datasource):
             "ge_load_time": datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S.%fZ")
         })
 
+        if "chunksize" in batch_kwargs:
+            if "path" not in batch_kwargs:
+                raise BatchKwargsError("chunksize is only supported for batches read from a path", batch_kwargs)
+            path = batch_kwargs['path']
+            reader_method = batch_kwargs.get("reader_method")
+            if reader_method is None:
+                reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+            # The data is read chunk by chunk when the batch is validated; it is never loaded in full, so we do not
+            # compute a fingerprint for it
+            return Batch(
+                datasource_name=self.name,
+                batch_kwargs=batch_kwargs,
+                data=PandasChunkReader(path, self._get_reader_fn(batch_kwargs.get("reader_method"), path),
+                                       reader_method, batch_kwargs["chunksize"], reader_options),
+                batch_parameters=batch_parameters,
+                batch_markers=batch_markers,
+                data_context=self._data_context
+            )
+
         if "path" in batch_kwargs:
             path = batch_kwargs['path']
             reader_method = batch_kwargs.get("reader_method")
@@ -257,3 +280,66 @@ class PandasDatasource(Datasource):
         except AttributeError:
             raise BatchKwargsError("Unable to find reader_method %s in pandas." % reader_method, {"reader_method":
                                                                                                       reader_method})
+
+
+class PandasChunkReader(object):
+    """Reads a file as a sequence of DataFrames, for validation by a ChunkedPandasDataset.
+
+    Parquet files are read one row group at a time; other files are read with the chunksize option of their pandas
+    reader method (which read_csv, read_table and read_json with lines=True support). Each iteration reads the file
+    again from the start, and chunks keep the row numbers of the file as their index.
+
+    get_columns reads the column names from the parquet schema, or from the first row of other files, so that
+    they are known without reading a whole chunk.
+    """
+
+    def __init__(self, path, reader_fn, reader_method, chunksize, reader_options=None):
+        self.path = path
+        self.reader_fn = reader_fn
+        self.reader_method = reader_method
+        self.chunksize = chunksize
+        self.reader_options = reader_options or {}
+
+    def __iter__(self):
+        if self.reader_method == "read_parquet":
+            return self._iter_parquet_row_groups()
+        return iter(self.reader_fn(self.path, chunksize=self.chunksize, **self.reader_options))
+
+    def get_columns(self):
+        if self.reader_method == "read_parquet":
+            return self._get_parquet_columns()
+        reader = self.reader_fn(self.path, chunksize=1, **self.reader_options)
+        try:
+            first_row = next(iter(reader), None)
+        finally:
+            if hasattr(reader, "close"):
+                reader.close()
+        if first_row is None:
+            return []
+        return list(first_row.columns)
+
+    def _get_parquet_columns(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise BatchKwargsError("Unable to load pyarrow to read parquet row groups.", {"path": self.path})
+        schema = pq.ParquetFile(self.path).schema_arrow
+        # Index columns stored by pandas are restored as the index of each chunk, not as columns
+        index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+        columns = [name for name in schema.names if name not in index_columns]
+        if self.reader_options.get("columns") is not None:
+            columns = [name for name in columns if name in self.reader_options["columns"]]
+        return columns
+
+    def _iter_parquet_row_groups(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise BatchKwargsError("Unable to load pyarrow to read parquet row groups.", {"path": self.path})
+        parquet_file = pq.ParquetFile(self.path)
+        row_offset = 0
+        for row_group in range(parquet_file.num_row_groups):
+            chunk = parquet_file.read_row_group(row_group, columns=self.reader_options.get("columns")).to_pandas()
+            chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+            row_offset += len(chunk)
+            yield chunk
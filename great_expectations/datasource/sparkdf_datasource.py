@@ -30,7 +30,7 @@ class SparkDFDatasource(Datasource):
         - InMemoryBatchKwargs ("dataset" key)
         - QueryBatchKwargs ("query" key)
     """
-    recognized_batch_parameters = {'reader_method', 'reader_options', 'limit', 'dataset_options'}
+    recognized_batch_parameters = {'reader_method', 'reader_options', 'limit', 'dataset_options', 'persist_level'}
 
     @classmethod
     def build_configuration(cls, data_asset_type=None, generators=None, spark_config=None, **kwargs):
@@ -100,12 +100,18 @@ class SparkDFDatasource(Datasource):
 
         self._build_generators()
 
-    def process_batch_parameters(self, reader_method=None, reader_options=None, limit=None, dataset_options=None):
+    def process_batch_parameters(self, reader_method=None, reader_options=None, limit=None, dataset_options=None,
+                                 persist_level=None):
         batch_kwargs = super(SparkDFDatasource, self).process_batch_parameters(
             limit=limit,
             dataset_options=dataset_options,
         )
 
+        # The storage level at which validation persists the columns it reads, such as "MEMORY_AND_DISK",
+        # "DISK_ONLY", or "NONE"
+        if persist_level is not None:
+            batch_kwargs["persist_level"] = persist_level
+
         # Apply globally-configured reader options first
         if reader_options:
             # Then update with any locally-specified reader options
@@ -85,36 +85,79 @@ class SqlAlchemyDatasource(Datasource):
         else:
             credentials = {}
 
+        # Options of the engine connection pool, such as pool_size, max_overflow, pool_pre_ping, and pool_recycle
+        pool_options = kwargs.pop("pool_options", None) or {}
+        self._pool_events = {"connect": 0, "checkout": 0, "checkin": 0}
+
         try:
             # if an engine was provided, use that
             if "engine" in kwargs:
                 self.engine = kwargs.pop("engine")
+                self._count_pool_events()
 
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
-                self.engine = create_engine(connection_string, **kwargs)
-                self.engine.connect()
+                self.engine = create_engine(connection_string, **dict(kwargs, **pool_options))
+                self._count_pool_events()
+                # Check the connection, returning it to the pool for the first batch
+                self.engine.connect().close()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 # TODO perhaps we could carefully regex out the driver from the
                 #  url. It would need to be cautious to avoid leaking secrets.
                 self.drivername = "other"
-                self.engine = create_engine(url, **kwargs)
-                self.engine.connect()
+                self.engine = create_engine(url, **dict(kwargs, **pool_options))
+                self._count_pool_events()
+                self.engine.connect().close()
 
             # Otherwise, connect using remaining kwargs
             else:
                 options, drivername = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options)
-                self.engine.connect()
+                self.engine = create_engine(options, **pool_options)
+                self._count_pool_events()
+                self.engine.connect().close()
 
         except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.DatabaseError) as sqlalchemy_error:
             raise DatasourceInitializationError(self._name, str(sqlalchemy_error))
 
         self._build_generators()
 
+    def _count_pool_events(self):
+        """Count the connections opened, checked out, and checked in by the pool of the engine, for get_pool_metrics"""
+        if not isinstance(self.engine, sqlalchemy.engine.Engine):
+            return
+        for event_name in self._pool_events:
+            sqlalchemy.event.listen(self.engine, event_name, self._build_pool_event_counter(event_name))
+
+    def _build_pool_event_counter(self, event_name):
+        def count_pool_event(*args):
+            self._pool_events[event_name] += 1
+        return count_pool_event
+
+    def get_pool_metrics(self):
+        """Report the state of the connection pool of the datasource engine, for monitoring.
+
+        Returns:
+            dict: the class of the pool, the number of database connections it opened ("connections_created") and
+            of connection checkouts and checkins since the datasource was created, and, for pools that report them,
+            the configured "size", the connections currently "checked_in" and "checked_out", and the current
+            "overflow"
+        """
+        pool = self.engine.pool
+        pool_metrics = {
+            "pool_class": pool.__class__.__name__,
+            "connections_created": self._pool_events["connect"],
+            "checkouts": self._pool_events["checkout"],
+            "checkins": self._pool_events["checkin"],
+        }
+        for metric, method in [("size", "size"), ("checked_in", "checkedin"), ("checked_out", "checkedout"),
+                               ("overflow", "overflow")]:
+            if hasattr(pool, method):
+                pool_metrics[metric] = getattr(pool, method)()
+        return pool_metrics
+
     def _get_sqlalchemy_connection_options(self, **kwargs):
         drivername = None
         if "credentials" in self._datasource_config:
@@ -11,6 +11,7 @@ try:
 except ModuleNotFoundError:
     OperationalError = RuntimeError
 
+from great_expectations.dataset.dataset import MetricRequest
 from .base import DatasetProfiler
 
 logger = logging.getLogger(__name__)
@@ -134,6 +135,14 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         for column in columns:
             meta_columns[column] = {"description": ""}
 
+        if df.caching:
+            # The cardinality of every column is computed from these metrics; datasets such as SqlAlchemyDataset
+            # compute them all in a single query
+            df.get_metrics([MetricRequest('get_row_count', None)] + [
+                MetricRequest(metric, column)
+                for column in columns for metric in ['get_column_unique_count', 'get_column_nonnull_count']
+            ])
+
         number_of_columns = len(columns)
         for i, column in enumerate(columns):
             logger.info("            Preparing column {} of {}: {}".format(i+1, number_of_columns, column))
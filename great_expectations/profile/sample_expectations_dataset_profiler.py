@@ -120,7 +120,7 @@ class SampleExpectationsDatasetProfiler(BasicDatasetProfilerBase):
                 result.exception_info["exception_traceback"]
                 or result.exception_info["exception_message"]
         ):
-            # TODO quantiles are not implemented correctly on sqlite, and likely other sql dialects
+            # Quantiles may not be available on some sql dialects
             logger.debug(result.exception_info["exception_traceback"])
             logger.debug(result.exception_info["exception_message"])
         else:
@@ -124,7 +124,7 @@ class ActionListValidationOperator(ValidationOperator):
 
         return batch
 
-    def run(self, assets_to_validate, run_id, evaluation_parameters=None):
+    def run(self, assets_to_validate, run_id, evaluation_parameters=None, max_workers=None, max_processes=None):
         result_object = {
             "success": None,
             "details": {}
@@ -142,7 +142,9 @@ class ActionListValidationOperator(ValidationOperator):
             # )
             result_object["details"][expectation_suite_identifier] = {}
             batch_validation_result = batch.validate(run_id=run_id, result_format="SUMMARY",
-                                                     evaluation_parameters=evaluation_parameters)
+                                                     evaluation_parameters=evaluation_parameters,
+                                                     max_workers=max_workers,
+                                                     max_processes=max_processes)
             result_object["details"][expectation_suite_identifier]["validation_result"] = batch_validation_result
             batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite,
                                                       batch_validation_result, run_id)
@@ -1,5 +1,5 @@
 """This is currently helping bridge APIs"""
-from great_expectations.dataset import PandasDataset, SqlAlchemyDataset, SparkDFDataset
+from great_expectations.dataset import ChunkedPandasDataset, PandasDataset, SqlAlchemyDataset, SparkDFDataset
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.types import ClassConfig
 from great_expectations.util import (
@@ -30,7 +30,7 @@ class Validator(object):
             # Guess the engine
             try:
                 import pandas as pd
-                if isinstance(batch.data, pd.DataFrame):
+                if isinstance(batch.data, pd.DataFrame) or "chunksize" in batch.batch_kwargs:
                     self.expectation_engine = PandasDataset
             except ImportError:
                 pass
@@ -55,6 +55,19 @@ class Validator(object):
         if issubclass(self.expectation_engine, PandasDataset):
             import pandas as pd
 
+            if "chunksize" in self.batch.batch_kwargs:
+                return ChunkedPandasDataset(
+                    self.batch.data,
+                    dataset_class=self.expectation_engine,
+                    expectation_suite=self.expectation_suite,
+                    batch_kwargs=self.batch.batch_kwargs,
+                    batch_parameters=self.batch.batch_parameters,
+                    batch_markers=self.batch.batch_markers,
+                    data_context=self.batch.data_context,
+                    **self.init_kwargs,
+                    **self.batch.batch_kwargs.get("dataset_options", {}),
+                )
+
             if not isinstance(self.batch["data"], pd.DataFrame):
                 raise ValueError("PandasDataset expectation_engine requires a Pandas Dataframe for its batch")
             return self.expectation_engine(
@@ -88,6 +101,10 @@ class Validator(object):
 
             if not isinstance(self.batch.data, pyspark.sql.DataFrame):
                 raise ValueError("SparkDFDataset expectation_engine requires a spark DataFrame for its batch")
+            dataset_options = {}
+            if "persist_level" in self.batch.batch_kwargs:
+                dataset_options["persist_level"] = self.batch.batch_kwargs["persist_level"]
+            dataset_options.update(self.batch.batch_kwargs.get("dataset_options", {}))
             return self.expectation_engine(
                 spark_df=self.batch.data,
                 expectation_suite=self.expectation_suite,
@@ -96,5 +113,5 @@ class Validator(object):
                 batch_markers=self.batch.batch_markers,
                 data_context=self.batch.data_context,
                 **self.init_kwargs,
-                **self.batch.batch_kwargs.get("dataset_options", {}),
+                **dataset_options,
             )
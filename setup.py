@@ -20,7 +20,7 @@ config = {
     'cmdclass': versioneer.get_cmdclass(),
     'install_requires': required,
     'extras_require': {
-        'spark':  ['pyspark>=2.3.2'],
+        'spark':  ['pyspark>=2.3.2', 'pyarrow>=0.12.0'],
         'sqlalchemy': ['sqlalchemy>=1.2'],
         'airflow': ['apache-airflow[s3]>=1.9.0', 'boto3>=1.7.3']
     },
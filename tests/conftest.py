@@ -42,6 +42,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "rendered_output: produces rendered output that should be manually reviewed."
     )
+    config.addinivalue_line(
+        "markers", "benchmark: times an implementation against an alternative; only runs with --benchmark."
+    )
 
 
 def pytest_addoption(parser):
@@ -54,6 +57,18 @@ def pytest_addoption(parser):
     parser.addoption(
         "--no-postgresql", action="store_true", help="If set, suppress tests against postgresql"
     )
+    parser.addoption(
+        "--benchmark", action="store_true", help="If set, run the tests marked as benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --benchmark.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 def build_test_backends_list(metafunc):
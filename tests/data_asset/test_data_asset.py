@@ -83,3 +83,21 @@ def test_catch_exceptions_with_bad_expectation_type():
 
     with pytest.raises(AttributeError):
         result = my_df.validate(catch_exceptions=False)
+
+
+def test_validate_with_max_workers_matches_sequential_validation(dataset):
+    dataset.set_default_expectation_argument("result_format", "COMPLETE")
+    dataset.expect_column_values_to_be_between("naturals", 1, 5, catch_exceptions=True)
+    dataset.expect_column_values_to_not_be_null("nulls", catch_exceptions=True)
+    dataset.expect_column_max_to_be_between("naturals", 0, 10, catch_exceptions=True)
+    dataset.expect_column_mean_to_be_between("nulls", 0, 10, catch_exceptions=True)
+    dataset.expect_column_values_to_be_in_set("not_a_column", [1], catch_exceptions=True)
+    dataset.expect_table_row_count_to_equal(7)
+
+    sequential = dataset.validate(run_id="test")
+    concurrent = dataset.validate(run_id="test", max_workers=4)
+
+    assert concurrent.to_json_dict() == sequential.to_json_dict()
+    assert [res.expectation_config.expectation_type for res in concurrent.results] == [
+        res.expectation_config.expectation_type for res in sequential.results
+    ]
@@ -1,9 +1,17 @@
 from __future__ import division
 
+import copy
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import pytest
 
-from great_expectations.core import ExpectationKwargs, ExpectationConfiguration, ExpectationValidationResult
+from great_expectations.core import ExpectationKwargs, ExpectationConfiguration, ExpectationSuite, \
+    ExpectationValidationResult
 from great_expectations.data_asset import DataAsset
+from great_expectations.data_asset.util import recursively_convert_to_json_serializable
 from great_expectations.dataset import PandasDataset, MetaPandasDataset
 
 
@@ -478,3 +486,26 @@ def test_column_pair_map_expectation_decorator():
             "all_even",
             result_format="BOOLEAN_ONLY"
         ) == ExpectationValidationResult(success=True)
+
+
+def test_expectation_decorator_overhead_with_large_arguments():
+    """validate used to deep-copy and re-serialize each expectation's arguments several times, which dominated
+    runtime for large value sets (about 45ms per expectation with a 10k-element value_set, vs about 8ms now)."""
+    df = PandasDataset({"x%d" % i: list(range(10)) for i in range(10)})
+    value_set = list(range(10000))
+    for column in df.columns:
+        df.expect_column_values_to_be_in_set(column, value_set)
+
+    def is_value_set(obj):
+        return isinstance(obj, list) and len(obj) == len(value_set)
+
+    with mock.patch("copy.deepcopy", wraps=copy.deepcopy) as deepcopy, \
+            mock.patch("great_expectations.data_asset.util.recursively_convert_to_json_serializable",
+                       wraps=recursively_convert_to_json_serializable) as convert:
+        assert df.validate().success
+    # The suite is copied once; only the (empty) meta of each expectation is copied besides
+    copied = [call[0][0] for call in deepcopy.call_args_list]
+    assert sum(isinstance(obj, ExpectationSuite) for obj in copied) == 1
+    assert all(obj == {} for obj in copied if not isinstance(obj, ExpectationSuite))
+    # The arguments of each expectation are converted to JSON serializable values once
+    assert sum(is_value_set(call[0][0]) for call in convert.call_args_list) == len(df.columns)
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import ChunkedPandasDataset, PandasDataset
+from great_expectations.dataset.sketches import SpaceSavingSketch
+
+
+@pytest.fixture
+def chunked_validation_data():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        "a": rng.randint(0, 20, 1000).astype(float),
+        "b": rng.choice(["x", "y", "z", None], 1000),
+        "c": rng.normal(size=1000),
+    })
+    df.loc[rng.choice(1000, 50), "a"] = np.nan
+
+    dataset = PandasDataset(df)
+    dataset.expect_column_values_to_be_between("a", 0, 15, mostly=0.5)
+    dataset.expect_column_values_to_be_in_set("b", ["x", "y"])
+    dataset.expect_column_values_to_not_be_null("a")
+    dataset.expect_column_values_to_be_null("b")
+    dataset.expect_column_pair_values_A_to_be_greater_than_B("a", "c")
+    dataset.expect_column_mean_to_be_between("a", 0, 100)
+    dataset.expect_column_stdev_to_be_between("c", 0, 2)
+    dataset.expect_column_sum_to_be_between("a", 0, 1e6)
+    dataset.expect_column_min_to_be_between("c", -10, 10)
+    dataset.expect_column_max_to_be_between("a", 0, 100)
+    dataset.expect_column_unique_value_count_to_be_between("b", 1, 10)
+    dataset.expect_column_most_common_value_to_be_in_set("a", [1.0])
+    dataset.expect_column_distinct_values_to_be_in_set("b", ["x", "y"])
+    dataset.expect_table_row_count_to_be_between(0, 2000)
+    return df, dataset
+
+
+@pytest.mark.parametrize("result_format", ["BOOLEAN_ONLY", "BASIC", "SUMMARY", "COMPLETE"])
+def test_chunked_validation_matches_in_memory_validation(chunked_validation_data, result_format):
+    df, dataset = chunked_validation_data
+    expectation_suite = dataset.get_expectation_suite(discard_failed_expectations=False)
+    chunks = [df.iloc[start:start + 137] for start in range(0, len(df), 137)]
+    chunked_dataset = ChunkedPandasDataset(chunks, expectation_suite=expectation_suite)
+
+    expected = dataset.validate(expectation_suite, result_format=result_format)
+    observed = chunked_dataset.validate(result_format=result_format)
+
+    assert observed.statistics == expected.statistics
+    for observed_result, expected_result in zip(observed.results, expected.results):
+        assert observed_result.to_json_dict() == expected_result.to_json_dict()
+
+
+def test_interactive_expectations_match_in_memory_expectations(chunked_validation_data):
+    df, dataset = chunked_validation_data
+    chunked_dataset = ChunkedPandasDataset([df.iloc[start:start + 137] for start in range(0, len(df), 137)])
+
+    for expectation_type, kwargs in [
+        ("expect_column_values_to_be_in_set", {"column": "b", "value_set": ["x", "y"]}),
+        ("expect_column_values_to_be_between", {"column": "a", "min_value": 0, "max_value": 15, "mostly": 0.5}),
+        ("expect_column_pair_values_A_to_be_greater_than_B", {"column_A": "a", "column_B": "c"}),
+        ("expect_column_mean_to_be_between", {"column": "a", "min_value": 0, "max_value": 100}),
+        ("expect_column_stdev_to_be_between", {"column": "c", "min_value": 0, "max_value": 2}),
+        ("expect_column_most_common_value_to_be_in_set", {"column": "a", "value_set": [1.0]}),
+        ("expect_column_unique_value_count_to_be_between", {"column": "b", "min_value": 1, "max_value": 10}),
+    ]:
+        observed = getattr(chunked_dataset, expectation_type)(result_format="SUMMARY", **kwargs)
+        expected = getattr(dataset, expectation_type)(result_format="SUMMARY", **kwargs)
+        assert observed.to_json_dict() == expected.to_json_dict()
+    assert len(chunked_dataset.get_expectation_suite(discard_failed_expectations=False).expectations) == 7
+
+    assert chunked_dataset.get_row_count() == len(df)
+    pd.testing.assert_series_equal(chunked_dataset.get_column_value_counts("b"), dataset.get_column_value_counts("b"))
+    with pytest.raises(NotImplementedError):
+        chunked_dataset.expect_column_values_to_be_unique("a")
+    with pytest.raises(NotImplementedError):
+        chunked_dataset.expect_column_median_to_be_between("a", 0, 100)
+
+
+def test_chunked_validation_reports_expectations_that_cannot_be_merged(chunked_validation_data):
+    df, dataset = chunked_validation_data
+    dataset.expect_column_values_to_be_unique("a")
+    dataset.expect_column_median_to_be_between("a", 0, 100)
+    expectation_suite = dataset.get_expectation_suite(discard_failed_expectations=False)
+    chunked_dataset = ChunkedPandasDataset(iter([df.iloc[:500], df.iloc[500:]]), expectation_suite=expectation_suite)
+
+    results = {
+        result.expectation_config.expectation_type: result for result in chunked_dataset.validate().results
+    }
+    assert results["expect_column_values_to_be_unique"].exception_info["raised_exception"] is True
+    assert results["expect_column_median_to_be_between"].exception_info["raised_exception"] is True
+    assert results["expect_column_values_to_be_in_set"].success is False
+    assert results["expect_column_values_to_be_in_set"].result["unexpected_count"] == (df["b"] == "z").sum()
+
+    # A one-shot iterator of chunks can only be validated once
+    with pytest.raises(ValueError):
+        chunked_dataset.validate()
+
+
+def test_chunked_validation_estimates_quantiles_and_unique_counts_with_sketches():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        "a": rng.normal(size=20000),
+        "b": rng.randint(0, 1000, 20000),
+        # One frequent value among thousands of rare ones, more than the sketch can track
+        "c": np.where(rng.rand(20000) < 0.1, "frequent", rng.randint(0, 5000, 20000).astype(str)),
+    })
+    dataset = PandasDataset(df)
+    dataset.expect_column_median_to_be_between("a", -0.1, 0.1, allow_relative_error=0.01)
+    dataset.expect_column_quantile_values_to_be_between(
+        "a", {"quantiles": [0.05, 0.95], "value_ranges": [[-1.8, -1.5], [1.5, 1.8]]}, allow_relative_error=0.01)
+    dataset.expect_column_unique_value_count_to_be_between("b", 950, 1050, allow_relative_error=0.02)
+    dataset.expect_column_proportion_of_unique_values_to_be_between("b", 0.04, 0.06, allow_relative_error=True)
+    dataset.expect_column_most_common_value_to_be_in_set("c", ["frequent"], allow_relative_error=0.01)
+    expectation_suite = dataset.get_expectation_suite()
+    assert len(expectation_suite.expectations) == 5
+
+    chunked_dataset = ChunkedPandasDataset(
+        iter([df.iloc[start:start + 3000] for start in range(0, len(df), 3000)]),
+        expectation_suite=expectation_suite
+    )
+    results = chunked_dataset.validate(result_format="SUMMARY").results
+    assert all(result.success for result in results)
+    assert all(result.exception_info["raised_exception"] is False for result in results)
+    assert results[-1].result["observed_value"] == ["frequent"]
+    most_common_sketch = chunked_dataset._column_sketches[(SpaceSavingSketch, "c", 0.01)]
+    assert len(most_common_sketch.counters) <= 100
+
+
+def test_chunked_validation_bounds_the_unexpected_value_counts():
+    # One frequent unexpected value among thousands of distinct ones
+    values = ["frequent"] * 500 + ["rare_%d" % idx for idx in range(5000)]
+    df = pd.DataFrame({"a": np.random.RandomState(0).permutation(values)})
+    chunks = [df.iloc[start:start + 500] for start in range(0, len(df), 500)]
+    result_format = {"result_format": "SUMMARY", "partial_unexpected_count": 3}
+
+    chunked_dataset = ChunkedPandasDataset(chunks)
+    chunked_dataset._prefetch_metrics([("expect_column_values_to_be_in_set", {
+        "column": "a", "value_set": ["expected"], "result_format": result_format})])
+    state, = chunked_dataset._map_expectation_results.values()
+    assert len(state["unexpected_value_counts"].counters) <= 30
+
+    dataset = PandasDataset(df)
+    dataset.expect_column_values_to_be_in_set("a", ["expected"])
+    result = ChunkedPandasDataset(chunks, expectation_suite=dataset.get_expectation_suite(
+        discard_failed_expectations=False)).validate(result_format=result_format).results[0]
+    assert result.result["unexpected_count"] == len(values)
+    assert result.result["partial_unexpected_counts"][0] == {"value": "frequent", "count": 500}
@@ -1,9 +1,15 @@
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import pytest
 
 from tests.test_utils import get_dataset
 from collections import OrderedDict
 
 from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.dataset import MetricRequest
 
 data = OrderedDict([
     ["a", [2.0, 5.0]],
@@ -35,6 +41,61 @@ def test_caching(test_backend):
         dataset.get_column_max.cache_info()
 
 
+def test_caching_normalizes_default_arguments(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    dataset.get_column_max('a')
+    dataset.get_column_max('a', False)
+    dataset.get_column_max('a', parse_strings_as_datetimes=False)
+    assert dataset.get_column_max.cache_info().hits == 2
+    assert dataset.get_column_max.cache_info().misses == 1
+
+    dataset.get_column_max.cache_clear()
+    dataset.get_column_max('a')
+    assert dataset.get_column_max.cache_info().misses == 1
+
+
+def test_get_metrics_primes_metric_cache(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    metrics = dataset.get_metrics([
+        MetricRequest("get_row_count", None),
+        MetricRequest("get_column_mean", "b"),
+        MetricRequest("get_column_max", "a"),
+    ])
+    assert metrics[MetricRequest("get_row_count", None)] == 2
+    assert metrics[MetricRequest("get_column_mean", "b")] == 5
+    assert metrics[MetricRequest("get_column_max", "a")] == 5.0
+
+    with mock.patch.object(dataset, "_compute_metrics") as compute_metrics:
+        assert dataset.get_metrics([MetricRequest("get_column_mean", "b")]) == {MetricRequest("get_column_mean", "b"): 5}
+        assert dataset.get_column_max("a") == 5.0
+        compute_metrics.assert_not_called()
+
+
+def test_validate_plans_metrics_before_evaluation(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    dataset.expect_column_max_to_be_between("a", 0, 10)
+    dataset.expect_column_mean_to_be_between("b", 5, 5)
+    dataset.expect_column_values_to_not_be_null("d")
+    dataset.expect_table_row_count_to_equal(2)
+    suite = dataset.get_expectation_suite()
+
+    planned_dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    with mock.patch.object(planned_dataset, "_compute_metrics", wraps=planned_dataset._compute_metrics) as \
+            compute_metrics:
+        planned_results = planned_dataset.validate(expectation_suite=suite)
+    compute_metrics.assert_called_once_with([
+        MetricRequest("get_row_count", None),
+        MetricRequest("get_column_nonnull_count", "a"),
+        MetricRequest("get_column_max", "a"),
+        MetricRequest("get_column_nonnull_count", "b"),
+        MetricRequest("get_column_mean", "b"),
+    ])
+
+    unplanned_dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=False)
+    unplanned_results = unplanned_dataset.validate(expectation_suite=suite)
+    assert planned_results.results == unplanned_results.results
+
+
 def test_head(test_backend):
     dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
     dataset.expect_column_mean_to_be_between("b", 5, 5)
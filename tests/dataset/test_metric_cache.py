@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.metric_cache import (
+    BoundedMetricCache,
+    InMemoryMetricCache,
+    SqliteMetricCache,
+    get_size_in_bytes,
+)
+
+
+@pytest.fixture
+def sqlite_metric_cache_path(tmp_path_factory):
+    return os.path.join(str(tmp_path_factory.mktemp("metric_cache")), "metrics.db")
+
+
+def test_sqlite_metric_cache_persists_metrics_across_datasets(sqlite_metric_cache_path):
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "x", "z"]})
+    dataset = PandasDataset(df, metric_cache=SqliteMetricCache(sqlite_metric_cache_path))
+    dataset.expect_column_mean_to_be_between("a", 0, 5)
+    dataset.expect_column_distinct_values_to_be_in_set("b", ["x", "y", "z"])
+    expected = dataset.validate()
+
+    # A new cache object reading the same file, as in a later run
+    revalidated_dataset = PandasDataset(
+        df.copy(),
+        expectation_suite=dataset.get_expectation_suite(),
+        metric_cache={"class_name": "SqliteMetricCache", "path": sqlite_metric_cache_path}
+    )
+    observed = revalidated_dataset.validate()
+    assert observed.results == expected.results
+    assert revalidated_dataset.get_column_mean.cache_info().misses == 0
+    assert revalidated_dataset.get_column_value_counts("b").equals(dataset.get_column_value_counts("b"))
+
+    # Changing the data changes its fingerprint
+    changed_dataset = PandasDataset(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "z"]}),
+        metric_cache=SqliteMetricCache(sqlite_metric_cache_path)
+    )
+    assert changed_dataset.get_column_mean("a") == 2.5
+    assert changed_dataset.get_column_mean.cache_info().misses == 1
+
+
+def test_metric_cache_skips_batches_without_fingerprint():
+    metric_cache = InMemoryMetricCache()
+    dataset = PandasDataset({"a": [[1], [2]]}, metric_cache=metric_cache)
+    assert dataset.get_row_count() == 2
+    assert metric_cache._metrics == {}
+
+    metric_cache = InMemoryMetricCache(fingerprinted_batches_only=False)
+    dataset = PandasDataset({"a": [[1], [2]]}, metric_cache=metric_cache,
+                            batch_kwargs={"path": "data.csv", "datasource": "files"})
+    assert dataset.get_row_count() == 2
+    assert list(metric_cache._metrics.values()) == [2]
+
+
+@pytest.mark.parametrize("eviction_policy,evicted", [("lru", ("c", ())), ("lfu", ("a", ()))])
+def test_bounded_metric_cache_evicts_entries(eviction_policy, evicted):
+    metric_cache = BoundedMetricCache(max_bytes=None, maxsize=3, eviction_policy=eviction_policy)
+    for metric in ["a", "b", "c"]:
+        metric_cache[(metric, ())] = metric
+    for metric in ["c", "c", "a", "b"]:
+        metric_cache.lookup((metric, ()))
+    with pytest.raises(KeyError):
+        metric_cache.lookup(("d", ()))
+    metric_cache[("d", ())] = "d"
+
+    assert evicted not in metric_cache
+    assert len(metric_cache) == 3
+    info = metric_cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (4, 1, 1, 3)
+
+
+def test_bounded_metric_cache_accounts_bytes():
+    series = pd.Series(np.arange(1000, dtype=np.int64))
+    assert get_size_in_bytes(series) >= 8000
+    assert get_size_in_bytes((series, series)) >= 16000
+
+    metric_cache = BoundedMetricCache(max_bytes=get_size_in_bytes(series) * 2)
+    metric_cache[("get_column_value_counts", ("a",))] = series
+    metric_cache[("get_column_value_counts", ("b",))] = series
+    metric_cache[("get_column_value_counts", ("c",))] = series
+    assert ("get_column_value_counts", ("a",)) not in metric_cache
+    assert metric_cache.info().currbytes == get_size_in_bytes(series) * 2
+
+    # A value above the limit is not cached
+    metric_cache[("get_column_value_counts", ("d",))] = pd.concat([series, series, series])
+    assert ("get_column_value_counts", ("d",)) not in metric_cache
+    assert len(metric_cache) == 2
+
+
+def test_dataset_metric_cache_is_bounded_and_invalidated():
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 7})
+    dataset = PandasDataset(df, metric_cache_maxsize=2)
+    dataset.get_column_value_counts("a")
+    dataset.get_column_value_counts("b")
+    dataset.get_column_mean("b")
+    info = dataset.get_metric_cache_info()
+    assert (info.currsize, info.evictions, info.maxsize) == (2, 1, 2)
+
+    assert dataset.get_column_mean("b") == df["b"].mean()
+    assert dataset.get_row_count() == 1000
+    dataset["b"] = 1
+    dataset.invalidate_metric_cache(columns=["b"])
+    assert dataset.get_column_mean("b") == 1
+    assert dataset.get_row_count() == 1000
+    assert dataset.get_column_mean.cache_info().misses == 2
+    assert dataset.get_row_count.cache_info().misses == 2
@@ -1,5 +1,10 @@
 from __future__ import division
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import pytest
 import json
 import datetime
@@ -99,6 +104,14 @@ def test_expect_column_values_to_be_json_parseable():
         assert t['out']['unexpected_list'] == out.result['unexpected_list']
 
 
+def test_expect_column_median_with_relative_error_is_exact():
+    df = ge.dataset.PandasDataset({"a": [1, 2, 3, 4]})
+    for allow_relative_error in [False, True, 0.1]:
+        result = df.expect_column_median_to_be_between("a", 2.5, 2.5, allow_relative_error=allow_relative_error)
+        assert result.success
+        assert result.result["observed_value"] == 2.5
+
+
 def test_expectation_decorator_summary_mode():
 
     df = ge.dataset.PandasDataset({
@@ -606,3 +619,88 @@ def test_expect_values_to_be_of_type_list():
 
     validation = df.expect_column_values_to_be_of_type("A", "list")
     assert not validation.success
+
+
+def test_validate_with_max_processes_matches_in_process_validation():
+    df = ge.dataset.PandasDataset({
+        "a": [1, 2, 3, 4, None],
+        "b": ["cat", "dog", "fish", "1", "2"],
+        "c": ["2020-01-01", "2020-01-02", "not a date", "2020-01-04", "2020-01-05"],
+    })
+    df.set_default_expectation_argument("result_format", "COMPLETE")
+    df.expect_table_row_count_to_equal(5)
+    df.expect_column_values_to_be_between("a", 1, 3)
+    df.expect_column_mean_to_be_between("a", 0, 10)
+    df.expect_column_values_to_match_regex("b", "^[a-z]+$")
+    df.expect_column_values_to_be_dateutil_parseable("c")
+    df.expect_column_pair_values_A_to_be_greater_than_B("a", "a", or_equal=True)
+    df.expect_column_values_to_be_in_set("not_a_column", [1], catch_exceptions=True)
+
+    in_process = df.validate(run_id="test")
+    sharded = df.validate(run_id="test", max_processes=2)
+
+    assert sharded.to_json_dict() == in_process.to_json_dict()
+
+
+def test_column_map_expectation_collects_only_reported_unexpected_values():
+    # The most common unexpected values ("b", then "c") only appear after the first partial_unexpected_count values
+    df = ge.dataset.PandasDataset({"x": ["a", "d", "e"] + ["c"] * 4 + ["b"] * 5 + ["ok"] * 3})
+    result_format = {"result_format": "SUMMARY", "partial_unexpected_count": 2}
+
+    res = df.expect_column_values_to_be_in_set("x", ["a", "ok"], result_format=result_format)
+    assert res.result["unexpected_count"] == 11
+    assert res.result["partial_unexpected_list"] == ["d", "e"]
+    assert res.result["partial_unexpected_index_list"] == [1, 2]
+    assert res.result["partial_unexpected_counts"] == [{"value": "b", "count": 5}, {"value": "c", "count": 4}]
+
+    res = df.expect_column_values_to_be_in_set("x", ["a", "ok"], result_format="BOOLEAN_ONLY")
+    assert res.success is False
+    assert res.result == {}
+
+    res = df.expect_column_values_to_be_in_set("x", ["a", "ok"], result_format="COMPLETE")
+    assert len(res.result["unexpected_list"]) == 11
+    assert res.result["unexpected_index_list"] == list(range(1, 12))
+
+    # Counting unhashable values is reported rather than raised
+    df = ge.dataset.PandasDataset({"x": [[1], [2], [2]]})
+    res = df.expect_column_values_to_be_in_set("x", [], result_format="SUMMARY")
+    assert res.result["partial_unexpected_counts"] == ["partial_exception_counts requires a hashable type"]
+
+
+def test_regex_expectations_convert_each_column_to_strings_once_per_validation():
+    df = ge.dataset.PandasDataset({"a": ["x1", " y2", "z3 ", None], "b": [1, 2, 3, 4]})
+    df.expect_column_values_to_match_regex("a", r"\d")
+    df.expect_column_values_to_not_match_regex("a", r"^\s+|\s+$")
+    df.expect_column_values_to_match_regex_list("a", ["x", "y"], match_on="any")
+    df.expect_column_values_to_not_match_regex_list("b", ["5", "6"])
+    df.expect_column_value_lengths_to_be_between("a", 2, 3)
+    suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+    astype = pd.Series.astype
+    with mock.patch.object(pd.Series, "astype", autospec=True, side_effect=astype) as mock_astype:
+        results = df.validate(expectation_suite=suite).results
+    assert [call[0][1] for call in mock_astype.call_args_list].count(str) == 2
+    assert [result.success for result in results] == [True, False, False, True, True]
+    assert results[1].result["unexpected_count"] == 2
+    assert df._converted_columns is None
+
+    # Expectations evaluated in threads share the converted columns
+    concurrent_results = df.validate(expectation_suite=suite, max_workers=4).results
+    assert [result.to_json_dict() for result in concurrent_results] == [result.to_json_dict() for result in results]
+
+
+def test_datetime_expectations_parse_each_column_once_per_validation():
+    df = ge.dataset.PandasDataset({"a": ["2019-01-01", "2019-01-02", None, "2019-01-04"]})
+    df.expect_column_values_to_be_increasing("a", parse_strings_as_datetimes=True)
+    df.expect_column_values_to_be_between("a", "2019-01-01", "2019-01-03", parse_strings_as_datetimes=True)
+    df.expect_column_max_to_be_between("a", "2019-01-01", "2019-01-05", parse_strings_as_datetimes=True)
+    suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+    parse_datetimes = ge.dataset.pandas_dataset.parse_datetimes
+    with mock.patch("great_expectations.dataset.pandas_dataset.parse_datetimes",
+                    side_effect=parse_datetimes) as mock_parse_datetimes:
+        results = df.validate(expectation_suite=suite, result_format="COMPLETE").results
+    assert mock_parse_datetimes.call_count == 1
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].result["unexpected_list"] == ["2019-01-04"]
+    assert results[2].result["observed_value"] == "2019-01-04 00:00:00"
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset.sketches import HyperLogLog, KLLSketch, SpaceSavingSketch, get_relative_error
+
+
+def test_get_relative_error():
+    assert get_relative_error(False) == 0
+    assert get_relative_error(True) == 0.01
+    assert get_relative_error(0.05) == 0.05
+    with pytest.raises(ValueError):
+        get_relative_error(2)
+
+
+def test_kll_sketch_is_exact_for_small_data():
+    sketch = KLLSketch()
+    sketch.update([3, 1, 2, 5, 4])
+    assert sketch.quantiles([0, 0.25, 0.5, 0.75, 1]) == \
+        pd.Series([3, 1, 2, 5, 4]).quantile([0, 0.25, 0.5, 0.75, 1], interpolation="nearest").tolist()
+    assert KLLSketch().quantiles([0.5]) == [None]
+
+
+def test_merged_kll_sketches_estimate_quantiles_within_relative_error():
+    values = np.random.RandomState(0).lognormal(size=200000)
+    sketch = KLLSketch.from_relative_error(0.01)
+    for part in np.array_split(values, 7):
+        part_sketch = KLLSketch.from_relative_error(0.01, seed=len(part))
+        part_sketch.update(part)
+        sketch.merge(part_sketch)
+
+    quantiles = np.linspace(0, 1, 21)
+    estimates = sketch.quantiles(quantiles)
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+    assert np.max(np.abs(ranks - quantiles)) < 0.01
+    assert estimates[0] == values.min()
+    assert estimates[-1] == values.max()
+    assert sketch.count == len(values)
+
+
+def test_merged_hyperloglogs_estimate_distinct_counts_within_relative_error():
+    values = np.random.RandomState(0).randint(0, 100000, 500000)
+    sketch = HyperLogLog.from_relative_error(0.01)
+    for part in np.array_split(values, 5):
+        part_sketch = HyperLogLog(sketch.p)
+        part_sketch.update(part)
+        sketch.merge(part_sketch)
+    exact = len(np.unique(values))
+    assert abs(sketch.count() - exact) / exact < 0.03
+
+    sketch = HyperLogLog()
+    sketch.update(np.array(["a", "b", "a"]))
+    # Integers and floats with the same value are counted once
+    sketch.update(np.array([1, 2]))
+    sketch.update(np.array([1.0, 2.0, 3.0]))
+    assert sketch.count() == 5
+
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLog(10))
+
+
+def test_merged_space_saving_sketches_find_heavy_hitters():
+    values = np.random.RandomState(0).zipf(1.5, 100000)
+    sketch = SpaceSavingSketch(50)
+    for part in np.array_split(values, 10):
+        part_sketch = SpaceSavingSketch(50)
+        part_sketch.update(part)
+        sketch.merge(part_sketch)
+
+    exact = pd.Series(values).value_counts()
+    most_common = sketch.most_common(5)
+    assert [value for value, _, _ in most_common] == list(exact.index[:5])
+    for value, count, lower_bound in most_common:
+        assert lower_bound <= exact[value] <= count <= exact[value] + len(values) / 50
+    assert sketch.count == len(values)
@@ -1,5 +1,6 @@
 from unittest import mock
 import pandas as pd
+import pytest
 
 from great_expectations.dataset.sparkdf_dataset import SparkDFDataset
 
@@ -20,3 +21,284 @@ def test_sparkdfdataset_persist(spark_session):
     sdf.persist = mock.MagicMock()
     _ = SparkDFDataset(sdf)
     sdf.persist.assert_called_once()
+
+
+def test_parse_datetime_batch_matches_dateutil():
+    from dateutil.parser import parse
+    from great_expectations.dataset.sparkdf_dataset import _parse_datetime_batch
+
+    values = pd.Series(["2019-01-01", None, "2019-1-2 10:00", "January 3, 2019"])
+    parsed = _parse_datetime_batch(values)
+    assert parsed.dtype == "datetime64[ns]"
+    assert parsed.index.equals(values.index)
+    assert pd.isnull(parsed[1])
+    assert [parsed[i] for i in (0, 2, 3)] == [parse(values[i]) for i in (0, 2, 3)]
+    assert _parse_datetime_batch(pd.Series([None, None])).isnull().all()
+
+
+def _python_udf_results(sdf, strftime_format):
+    """The max of column "a" parsed as dates and the count of values matching strftime_format, computed with the row
+    at a time Python UDFs the pandas UDFs replace."""
+    from datetime import datetime
+    from dateutil.parser import parse
+    from pyspark.sql.functions import udf
+    import pyspark.sql.types as sparktypes
+
+    def is_parseable_by_format(val):
+        try:
+            datetime.strptime(val, strftime_format)
+            return True
+        except ValueError:
+            return False
+
+    parsed_max = sdf.select(udf(parse, sparktypes.TimestampType())("a").alias("a")).agg({"a": "max"}).collect()[0][0]
+    success_count = sdf.filter(udf(is_parseable_by_format, sparktypes.BooleanType())("a")).count()
+    return parsed_max, success_count
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_datetime_expectations_match_python_udfs(spark_session, use_pyarrow, monkeypatch):
+    if not use_pyarrow:
+        monkeypatch.setattr("great_expectations.dataset.sparkdf_dataset.pyarrow", None)
+    strftime_format = "%Y-%m-%d %H:%M:%S"
+    dates = list(pd.date_range("2000-01-01", periods=100, freq="D").strftime(strftime_format))
+    dates += ["2000-01-01", "not a date", "January 3, 2019"]
+    sdf = spark_session.createDataFrame(pd.DataFrame({"a": dates}))
+    dataset = SparkDFDataset(sdf)
+
+    parsed_max, success_count = _python_udf_results(sdf.filter("a != 'not a date'"), strftime_format)
+    assert SparkDFDataset(sdf.filter("a != 'not a date'")).get_column_max(
+        "a", parse_strings_as_datetimes=True) == parsed_max
+    result = dataset.expect_column_values_to_match_strftime_format("a", strftime_format, result_format="SUMMARY")
+    assert result.result["element_count"] - result.result["unexpected_count"] == success_count == 100
+    assert sorted(result.result["partial_unexpected_list"]) == ["2000-01-01", "January 3, 2019", "not a date"]
+
+    # Month names are checked by strptime in a UDF rather than by a native condition
+    result = dataset.expect_column_values_to_match_strftime_format("a", "%B %d, %Y", result_format="SUMMARY")
+    assert result.result["unexpected_count"] == 102
+    assert "January 3, 2019" not in result.result["partial_unexpected_list"]
+
+
+def test_strptime_regex_matches_strptime():
+    import re
+    from datetime import datetime
+    from great_expectations.dataset.sparkdf_dataset import _get_strptime_regex
+
+    regex, group_indexes = _get_strptime_regex("%Y-%m-%d  T%H.%M%%")
+    assert group_indexes == {"Y": 1, "m": 2, "d": 3, "H": 4, "M": 5}
+    for value in ["2019-01-02 T03.04%", "2019-1- 2\tt3.4%", "2019-01-02T03.04%", "2019-01-02 T03:04%",
+                  "2019-01-32 T03.04%", "2019-01-02 T03.04%\n", "19-01-02 T03.04%"]:
+        try:
+            datetime.strptime(value, "%Y-%m-%d  T%H.%M%%")
+            parseable = True
+        except ValueError:
+            parseable = False
+        assert (re.match("(?i)^" + regex + r"\Z", value) is not None) == parseable
+    # Directives that depend on the locale or other fields are left to strptime
+    assert _get_strptime_regex("%B %d, %Y") is None
+    assert _get_strptime_regex("%Y %j") is None
+    assert _get_strptime_regex("%d %d") is None
+
+
+def test_strftime_format_condition_matches_strptime(spark_session):
+    from datetime import datetime
+    from pyspark.sql.functions import col
+    from great_expectations.dataset.sparkdf_dataset import _get_strftime_format_condition
+
+    values = ["2020-02-29", "2019-02-29", "1900-02-29", "2000-02-29", "0000-01-01", "2020-04-31", "2020-1- 9",
+              "2020-13-01", "2020-01-01 ", "2020-01-01\n", "2020-01-01 00:00:60", "2020-01-01 00:00:59"]
+    sdf = spark_session.createDataFrame([(value,) for value in values], ["a"])
+    for strftime_format in ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]:
+        condition = _get_strftime_format_condition(col("a"), strftime_format)
+        matched = dict((row["a"], row["success"]) for row in
+                       sdf.select("a", condition.alias("success")).collect())
+
+        def is_parseable(value):
+            try:
+                datetime.strptime(value, strftime_format)
+                return True
+            except ValueError:
+                return False
+
+        assert matched == dict((value, is_parseable(value)) for value in values)
+
+
+@pytest.mark.benchmark
+def test_benchmark_pandas_udf_expectations_against_python_udfs(spark_session):
+    """Time the pandas UDF and native condition of datetime expectations against the row at a time Python UDFs they
+    replace."""
+    import time
+
+    n = 200000
+    strftime_format = "%Y-%m-%d %H:%M:%S"
+    dates = pd.date_range("2000-01-01", periods=n, freq="min").strftime(strftime_format)
+    sdf = spark_session.createDataFrame(pd.DataFrame({"a": dates})).repartition(4).cache()
+    sdf.count()
+    dataset = SparkDFDataset(sdf)
+
+    start = time.time()
+    _python_udf_results(sdf, strftime_format)
+    python_udf_time = time.time() - start
+
+    start = time.time()
+    dataset.get_column_max("a", parse_strings_as_datetimes=True)
+    dataset.expect_column_values_to_match_strftime_format("a", strftime_format, result_format="BOOLEAN_ONLY")
+    vectorized_time = time.time() - start
+
+    print("Python UDFs: %.2fs, pandas UDF and native condition: %.2fs" % (python_udf_time, vectorized_time))
+
+
+def test_column_map_expectation_runs_one_spark_job_per_result_format(spark_session):
+    sdf = spark_session.createDataFrame([(1,), (2,), (3,), (None,), (5,), (6,)], ["a"])
+    dataset = SparkDFDataset(sdf)
+    # Prime the row count, which the planner prefetches once per validation
+    dataset.get_row_count()
+    status_tracker = spark_session.sparkContext.statusTracker()
+
+    def count_jobs(result_format, value_set):
+        spark_session.sparkContext.setJobGroup(result_format + str(value_set), "column map")
+        result = dataset.expect_column_values_to_be_in_set("a", value_set, result_format=result_format)
+        return result, len(status_tracker.getJobIdsForGroup(result_format + str(value_set)))
+
+    result, jobs = count_jobs("BOOLEAN_ONLY", [1, 2, 3])
+    assert result.success is False
+    assert jobs == 1
+    # The nonnull count is cached by the counting job
+    result, jobs = count_jobs("SUMMARY", [1, 2, 3, 5, 6])
+    assert result.success is True
+    assert result.result["unexpected_count"] == 0
+    assert result.result["missing_count"] == 1
+    assert jobs == 1
+    result, jobs = count_jobs("SUMMARY", [1, 2])
+    assert result.result["partial_unexpected_list"] == [3, 5, 6]
+    assert jobs == 2
+
+
+def test_validate_fuses_suite_into_one_aggregation(spark_session):
+    rows = [(1, "x"), (2, "y"), (3, "z"), (None, None), (5, "x"), (6, "xyz")]
+    suite_dataset = SparkDFDataset(spark_session.createDataFrame(rows, ["a", "b"]), caching=False)
+    suite_dataset.expect_column_values_to_be_in_set("a", [1, 2, 3, 5])
+    suite_dataset.expect_column_values_to_not_be_null("a")
+    suite_dataset.expect_column_values_to_be_null("b", mostly=0.1)
+    suite_dataset.expect_column_values_to_be_between("a", 0, 10)
+    suite_dataset.expect_column_value_lengths_to_be_between("b", 1, 2)
+    suite_dataset.expect_column_values_to_match_regex("b", "^x")
+    suite_dataset.expect_column_values_to_be_unique("b")
+    suite_dataset.expect_column_mean_to_be_between("a", 0, 10)
+    suite_dataset.expect_column_sum_to_be_between("a", 0, 100)
+    suite_dataset.expect_column_stdev_to_be_between("a", 0, 10)
+    suite_dataset.expect_column_min_to_be_between("b", "a", "z")
+    suite_dataset.expect_column_max_to_be_between("a", 0, 10)
+    suite_dataset.expect_column_unique_value_count_to_be_between("b", 1, 10)
+    suite_dataset.expect_table_row_count_to_equal(6)
+    expectation_suite = suite_dataset.get_expectation_suite(discard_failed_expectations=False)
+
+    unfused = SparkDFDataset(spark_session.createDataFrame(rows, ["a", "b"]), fuse_expectations=False).validate(
+        expectation_suite, result_format="SUMMARY")
+    fused = SparkDFDataset(spark_session.createDataFrame(rows, ["a", "b"])).validate(expectation_suite, result_format="SUMMARY")
+    assert fused.statistics == unfused.statistics
+    for fused_result, unfused_result in zip(fused.results, unfused.results):
+        assert fused_result.to_json_dict() == unfused_result.to_json_dict()
+
+    # Without unexpected values to sample, the whole suite but the uniqueness check is a single job
+    expectation_suite.expectations = [
+        expectation for expectation in expectation_suite.expectations
+        if expectation.expectation_type in [
+            "expect_column_values_to_be_between", "expect_column_mean_to_be_between",
+            "expect_column_sum_to_be_between", "expect_column_max_to_be_between",
+            "expect_column_unique_value_count_to_be_between", "expect_table_row_count_to_equal"
+        ]
+    ]
+    dataset = SparkDFDataset(spark_session.createDataFrame(rows, ["a", "b"]))
+    spark_session.sparkContext.setJobGroup("fused_validation", "fused validation")
+    assert dataset.validate(expectation_suite).success is True
+    assert len(spark_session.sparkContext.statusTracker().getJobIdsForGroup("fused_validation")) == 1
+
+
+def test_describe_column_primes_statistics_of_all_numeric_columns(spark_session):
+    rows = [(1, 1.5, "x"), (2, -2.0, "y"), (3, 0.25, "z"), (None, 4.0, "w"), (5, None, None)]
+    dataset = SparkDFDataset(spark_session.createDataFrame(rows, ["a", "b", "c"]))
+    spark_session.sparkContext.setJobGroup("describe_column", "describe column")
+
+    assert dataset.get_column_mean("a") == 2.75
+    assert dataset.get_column_sum("a") == 11
+    assert dataset.get_column_min("a") == 1
+    assert dataset.get_column_max("b") == 4.0
+    assert dataset.get_column_stdev("b") == pytest.approx(pd.Series([1.5, -2.0, 0.25, 4.0]).std())
+    assert dataset.get_column_nonnull_count("b") == 4
+    assert len(spark_session.sparkContext.statusTracker().getJobIdsForGroup("describe_column")) == 1
+
+    # Non-numeric columns are not described
+    assert dataset.get_column_min("c") == "w"
+
+
+def test_quantiles_use_default_relative_error_and_are_computed_once_per_column(spark_session):
+    sdf = spark_session.createDataFrame([(float(value),) for value in range(1000)], ["a"])
+    dataset = SparkDFDataset(sdf, default_relative_error=0.05)
+
+    with mock.patch.object(sdf, "approxQuantile", wraps=sdf.approxQuantile) as approx_quantile:
+        quantiles = dataset.get_column_quantiles("a", (0.25, 0.5, 0.75))
+        assert dataset.get_column_median("a") == quantiles[1]
+        assert dataset.get_column_quantiles("a", (0.5, 0.75)) == quantiles[1:]
+        assert approx_quantile.call_count == 1
+        assert approx_quantile.call_args[0] == ("a", [0.25, 0.5, 0.75], 0.05)
+    assert all(abs(value - expected) <= 50 for value, expected in zip(quantiles, [250, 500, 750]))
+
+    # Uniform bins only need the minimum and maximum
+    with mock.patch.object(sdf, "approxQuantile") as approx_quantile:
+        assert list(dataset.get_column_partition("a", bins="uniform", n_bins=4)) == [0., 249.75, 499.5, 749.25, 999.]
+        approx_quantile.assert_not_called()
+
+    # allow_relative_error is interpreted like on the other backends
+    with mock.patch.object(sdf, "approxQuantile", wraps=sdf.approxQuantile) as approx_quantile:
+        dataset.get_column_quantiles("a", (0.1,), allow_relative_error=True)
+        assert approx_quantile.call_args[0] == ("a", [0.1], 0.01)
+    with pytest.raises(ValueError):
+        dataset.get_column_quantiles("a", (0.1,), allow_relative_error=2)
+
+
+def test_value_counts_limit_bounds_distinct_values_expectations(spark_session):
+    rows = [(value % 50,) for value in range(1000)] + [(1,)] * 10 + [(None,)]
+    dataset = SparkDFDataset(spark_session.createDataFrame(rows, ["a"]), value_counts_limit=3)
+
+    assert dataset.get_column_modes("a") == [1]
+    assert dataset.get_column_value_counts("a").shape[0] == 50
+
+    result = dataset.expect_column_distinct_values_to_be_in_set("a", [0, 1, 2, 100])
+    assert result.success is False
+    assert len(result.result["observed_value"]) == 6
+    assert result.result["observed_value"][:3] == [0, 1, 2]
+    result = dataset.expect_column_distinct_values_to_contain_set("a", [0, 1, 2])
+    assert result.success is True
+    assert result.result["observed_value"][:3] == [0, 1, 2]
+    assert dataset.expect_column_distinct_values_to_contain_set("a", [0, 100]).success is False
+    assert dataset.expect_column_distinct_values_to_equal_set("a", list(range(50))).success is True
+    assert dataset.expect_column_distinct_values_to_equal_set("a", list(range(49))).success is False
+
+
+def test_persist_level_persists_suite_columns_for_validation(spark_session):
+    from pyspark import StorageLevel
+
+    sdf = spark_session.createDataFrame([(1, "x", 1.5), (2, "y", None), (3, None, 2.5)], ["a", "b", "c"])
+    dataset = SparkDFDataset(sdf, persist_level="disk_only")
+    assert not sdf.is_cached
+    dataset.expect_column_values_to_be_between("a", 0, 5)
+    dataset.expect_column_mean_to_be_between("c", 1, 3)
+    dataset.expect_table_row_count_to_equal(3)
+    dataset.expect_table_column_count_to_equal(3)
+
+    persisted = []
+    release = dataset._release_suite_columns
+
+    def record_and_release():
+        persisted.append((dataset.spark_df.columns, dataset.spark_df.storageLevel))
+        release()
+
+    dataset._release_suite_columns = record_and_release
+    assert dataset.validate().success is True
+    assert persisted == [(["a", "c"], StorageLevel.DISK_ONLY)]
+    assert dataset.spark_df is sdf
+    assert dataset.get_table_columns() == ["a", "b", "c"]
+
+    with pytest.raises(ValueError):
+        SparkDFDataset(sdf, persist_level="SOMEWHERE")
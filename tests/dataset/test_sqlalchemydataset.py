@@ -2,6 +2,8 @@ try:
     from unittest import mock
 except ImportError:
     import mock
+import threading
+import time
 import pytest
 import pandas as pd
 from tests.test_utils import get_dataset
@@ -205,6 +207,388 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
     assert res2.result["unexpected_count"] == 5
 
 
+def test_boolean_only_result_format_skips_unexpected_values_query(sa, unexpected_count_df):
+    execute = unexpected_count_df.engine.execute
+    with mock.patch.object(unexpected_count_df.engine, "execute", side_effect=execute) as spy:
+        res = unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format="BOOLEAN_ONLY")
+        assert res.success is False
+        assert spy.call_count == 1
+
+        res = unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format="BASIC")
+        assert res.result["partial_unexpected_list"] == [2, 2, 2, 2, 2]
+        assert spy.call_count == 3
+
+
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(UserWarning, match=r'Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous'):
         unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format={"result_format": "COMPLETE", "partial_unexpected_count": 2})
+
+
+def test_validate_fuses_column_map_counts(sa):
+    engine = sa.create_engine('sqlite://')
+    data = pd.DataFrame({
+        "c1": [2, 2, 2, 2, 0],
+        "c2": [4, 4, 5, None, 7],
+        "c3": ["cat", "dog", "fish", "tiger", "elephant"]
+    })
+    data.to_sql(name='test_data', con=engine, index=False)
+
+    def build_dataset(fuse):
+        dataset = SqlAlchemyDataset('test_data', engine=engine, fuse_column_map_expectations=fuse)
+        dataset.set_default_expectation_argument("result_format", "COMPLETE")
+        dataset.expect_column_values_to_be_in_set("c1", [2])
+        dataset.expect_column_values_to_be_between("c2", 4, 5, mostly=0.5)
+        dataset.expect_column_values_to_not_be_null("c2")
+        dataset.expect_column_values_to_be_in_set("c3", ["cat", "dog"])
+        dataset.expect_column_values_to_be_in_set("missing_column", [1], catch_exceptions=True)
+        return dataset
+
+    def count_queries(dataset):
+        count_query_statements = []
+        execute = dataset.engine.execute
+
+        def spy(query, *args, **kwargs):
+            if "unexpected_count" in str(query):
+                count_query_statements.append(query)
+            return execute(query, *args, **kwargs)
+
+        with mock.patch.object(dataset.engine, "execute", side_effect=spy):
+            with pytest.warns(UserWarning):
+                results = dataset.validate(catch_exceptions=True).results
+        return results, len(count_query_statements)
+
+    fused_results, fused_queries = count_queries(build_dataset(True))
+    unfused_results, unfused_queries = count_queries(build_dataset(False))
+
+    # The expectation on a missing column is left out of the fused query and fails on its own
+    assert fused_queries == 2
+    assert unfused_queries == 5
+    assert [res.success for res in fused_results] == [False, True, False, False, False]
+    assert [res.result for res in fused_results] == [res.result for res in unfused_results]
+    assert fused_results[-1].exception_info["raised_exception"] is True
+
+
+@pytest.fixture
+def quantile_dataset(sa):
+    engine = sa.create_engine('sqlite://')
+    data = pd.DataFrame({
+        "a": [float(value) for value in range(1, 101)],
+        "b": [float(value % 10) for value in range(100)],
+        "c": ["x"] * 100,
+    })
+    data.loc[5, "a"] = None
+    data.to_sql(name='quantile_data', con=engine, index=False)
+    return SqlAlchemyDataset('quantile_data', engine=engine)
+
+
+def test_quantiles_without_percentile_functions(quantile_dataset):
+    # Exact quantiles are read from sorted values, as percentile_disc would return them
+    assert quantile_dataset.get_column_quantiles("a", (0.0, 0.25, 0.5, 0.9, 1.0)) == [1., 26., 51., 91., 100.]
+    assert quantile_dataset.get_column_median("a") == 51.
+    # Columns smaller than the sample an approximate quantile needs are read exactly
+    assert quantile_dataset.get_column_quantiles("a", (0.0, 0.25, 0.5, 1.0), allow_relative_error=0.01) == \
+        [1., 26., 51., 100.]
+    assert quantile_dataset.get_column_quantiles("c", (0.5,), allow_relative_error=0.01) == ["x"]
+
+
+def test_exact_quantiles_are_read_in_one_query(sa, quantile_dataset):
+    quantile_dataset.get_column_nonnull_count("a")
+    executed = []
+    execute = quantile_dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(quantile_dataset.engine, "execute", side_effect=spy):
+        assert quantile_dataset.get_column_quantiles("a", (0.1, 0.25, 0.5, 0.9)) == [11., 26., 51., 91.]
+    # The column is sorted once by the window function, not once per quantile with OFFSET
+    assert len(executed) == 1
+    assert "row_number() OVER" in executed[0] and "OFFSET" not in executed[0]
+
+
+def test_approximate_quantiles_of_a_skewed_column(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [float(value) for value in range(1, 50000)] + [1e9]}).to_sql(
+        name='skewed_data', con=engine, index=False)
+    dataset = SqlAlchemyDataset('skewed_data', engine=engine)
+
+    # A single outlier does not move the estimated quantiles, which are order statistics of a random sample
+    approximate = dataset.get_column_quantiles("a", (0.0, 0.25, 0.5, 0.75, 1.0), allow_relative_error=0.05)
+    assert approximate[0] == 1. and approximate[-1] == 1e9
+    # Three times the allowed rank error, which a sample of this size exceeds with negligible probability
+    for quantile, value in zip([0.25, 0.5, 0.75], approximate[1:-1]):
+        assert value == pytest.approx(quantile * 50000, abs=0.15 * 50000)
+    assert dataset.expect_column_median_to_be_between("a", 20000, 30000, allow_relative_error=0.05).success
+    # The sample is drawn with a filter in one scan, without sorting the table in random order
+    executed = []
+    execute = dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(dataset.engine, "execute", side_effect=spy):
+        dataset.get_column_quantiles("a", (0.5,), allow_relative_error=0.05)
+    assert not any("ORDER BY" in statement for statement in executed)
+
+    # Exact when the sample would cover the column
+    assert dataset.get_column_quantiles("a", (0.5,), allow_relative_error=0.001) == [25000.]
+
+
+@pytest.mark.parametrize("dialect_name,relative_error,expected", [
+    ("postgresql", 0., "percentile_disc(0.25) WITHIN GROUP (ORDER BY a ASC)"),
+    ("snowflake", 0.01, "approx_percentile(a, 0.25)"),
+    ("trino", 0.01, "approx_percentile(a, 0.25)"),
+    ("databricks", 0.01, "percentile_approx(a, 0.25, 100)"),
+    ("bigquery", 0.01, "APPROX_QUANTILES(a, 100)[OFFSET(25)]"),
+    ("mysql", 0., None),
+    ("mysql", 0.01, None),
+])
+def test_quantile_expressions_by_dialect(sa, quantile_dataset, dialect_name, relative_error, expected):
+    with mock.patch.object(quantile_dataset.engine.dialect, "name", dialect_name):
+        expression = quantile_dataset._get_quantile_expression("a", 0.25, relative_error)
+    if expected is None:
+        assert expression is None
+    else:
+        assert str(expression.compile(compile_kwargs={"literal_binds": True})) == expected
+
+
+@pytest.mark.parametrize("dialect_name,relative_error,expected", [
+    ("snowflake", 0.01, "approx_count_distinct(a)"),
+    ("trino", 0.01, "approx_distinct(a, 0.01)"),
+    ("trino", 0.001, None),
+    ("databricks", 0.05, "approx_count_distinct(a, 0.05)"),
+    ("redshift", 0.01, "approximate count(DISTINCT a)"),
+    ("mysql", 0.01, None),
+])
+def test_approximate_unique_count_expressions_by_dialect(sa, quantile_dataset, dialect_name, relative_error,
+                                                         expected):
+    with mock.patch.object(quantile_dataset.engine.dialect, "name", dialect_name):
+        expression = quantile_dataset._get_approximate_unique_count_expression("a", relative_error)
+    if expected is None:
+        assert expression is None
+    else:
+        assert str(expression.compile(compile_kwargs={"literal_binds": True})) == expected
+
+
+def test_approximate_unique_count_falls_back_to_exact_count(quantile_dataset):
+    # sqlite has no approximate distinct count function
+    assert quantile_dataset.get_column_unique_count("b", allow_relative_error=0.01) == 10
+    assert quantile_dataset.expect_column_unique_value_count_to_be_between(
+        "b", 10, 10, allow_relative_error=True).success
+
+
+def test_validate_computes_medians_and_quantiles_in_one_query(sa, quantile_dataset):
+    quantile_dataset.expect_column_median_to_be_between("a", 0, 100)
+    quantile_dataset.expect_column_median_to_be_between("b", 0, 100)
+    quantile_dataset.expect_column_quantile_values_to_be_between(
+        "b", {"quantiles": [0.1, 0.9], "value_ranges": [[0, 1], [8, 9]]})
+    quantile_dataset.invalidate_metric_cache()
+
+    def quantile_expression(column, quantile, relative_error=0., interpolation=False):
+        # Stand in aggregates, since sqlite has no percentile functions
+        return sa.func.max(sa.column(column)) * quantile
+
+    executed = []
+    execute = quantile_dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(quantile_dataset, "_get_quantile_expression", side_effect=quantile_expression), \
+            mock.patch.object(quantile_dataset.engine, "execute", side_effect=spy):
+        results = quantile_dataset.validate().results
+    assert [result.result["observed_value"] for result in results] == [
+        50., 4.5, {"quantiles": [0.1, 0.9], "values": [0.9, 8.1]}
+    ]
+    assert sum("quantile_0_0" in statement for statement in executed) == 1
+    assert not any("ORDER BY" in statement for statement in executed)
+
+
+def test_get_metrics_computes_aggregates_in_one_query(sa, quantile_dataset):
+    quantile_dataset.invalidate_metric_cache()
+    executed = []
+    execute = quantile_dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(quantile_dataset.engine, "execute", side_effect=spy):
+        metrics = quantile_dataset.get_metrics(
+            [("get_row_count", None)] +
+            [(metric, column) for column in ["a", "b", "c"] for metric in [
+                "get_column_nonnull_count", "get_column_unique_count", "get_column_min", "get_column_max"]] +
+            [("get_column_mean", "a"), ("get_column_sum", "b"), ("get_column_mean", "c"), ("get_column_stdev", "a")]
+        )
+    assert metrics[("get_row_count", None)] == 100
+    assert metrics[("get_column_nonnull_count", "a")] == 99
+    assert metrics[("get_column_unique_count", "b")] == 10
+    assert metrics[("get_column_min", "a")] == 1.
+    assert metrics[("get_column_max", "c")] == "x"
+    assert metrics[("get_column_mean", "a")] == pytest.approx((5050. - 6.) / 99)
+    assert metrics[("get_column_sum", "b")] == 450.
+    # The mean of a text column and the standard deviation (sqlite has no stddev_samp) are left to their getters
+    assert len(executed) == 3
+    assert "metric_14" in executed[0]
+    assert ("get_column_stdev", "a") not in metrics
+
+    with mock.patch.object(quantile_dataset.engine, "execute") as execute_mock:
+        assert quantile_dataset.get_column_unique_count("a") == 99
+        assert quantile_dataset.get_column_nonnull_count("c") == 100
+        execute_mock.assert_not_called()
+
+
+def test_kl_divergence_reads_the_distribution_in_one_query(sa, quantile_dataset):
+    partition_object = {"bins": [0, 25, 50, 75, 100], "weights": [0.25, 0.25, 0.25, 0.25]}
+    executed = []
+    execute = quantile_dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(quantile_dataset.engine, "execute", side_effect=spy):
+        result = quantile_dataset.expect_column_kl_divergence_to_be_less_than(
+            "a", partition_object, threshold=0.1, tail_weight_holdout=0.01, result_format="SUMMARY")
+    assert result.success
+    assert result.result["details"]["observed_partition"]["weights"] == [23. / 99, 25. / 99, 25. / 99, 26. / 99]
+    # The row and nonnull counts read by the aggregate expectation decorator, then the histogram and tail counts
+    assert len(executed) == 3
+    assert "bin_0_3" in executed[2]
+
+
+def test_validate_computes_distributions_in_one_query(sa, quantile_dataset):
+    quantile_dataset.expect_column_kl_divergence_to_be_less_than(
+        "a", {"bins": [0, 50, 100], "weights": [0.5, 0.5]}, threshold=0.1)
+    quantile_dataset.expect_column_kl_divergence_to_be_less_than(
+        "b", {"bins": [-1, 4.5, 5, 10], "weights": [0.5, 0.01, 0.49]}, threshold=0.1, tail_weight_holdout=0.01,
+        result_format="SUMMARY")
+    quantile_dataset.invalidate_metric_cache()
+
+    executed = []
+    execute = quantile_dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    with mock.patch.object(quantile_dataset.engine, "execute", side_effect=spy):
+        results = quantile_dataset.validate().results
+    assert [result.success for result in results] == [True, True]
+    assert results[1].result["details"]["observed_partition"]["weights"] == [0.5, 0., 0.5]
+    assert sum("bin_1_0" in statement for statement in executed) == 1
+    assert len(executed) == 1
+
+
+def test_width_bucket_histogram(sa, quantile_dataset):
+    def width_bucket(value, low, high, count):
+        # The semantics of the postgresql function, which sqlite lacks
+        if value is None:
+            return None
+        if value < low:
+            return 0
+        if value >= high:
+            return count + 1
+        return int((value - low) / (high - low) * count) + 1
+
+    quantile_dataset.engine.connection.create_function("width_bucket", 4, width_bucket)
+    bins = (1., 25.75, 50.5, 75.25, 100.)
+    expected = quantile_dataset.get_column_distributions([("a", bins), ("b", (0, 5, 9))])
+
+    quantile_dataset._use_width_bucket = True
+    with mock.patch.object(quantile_dataset.engine.dialect, "name", "postgresql"):
+        assert quantile_dataset._get_bucket_expression("a", (0, 1, 3)) is None
+        assert quantile_dataset._get_bucket_expression("a", (-float("inf"), 0, 1)) is None
+        assert str(quantile_dataset._get_bucket_expression("a", bins).compile(
+            compile_kwargs={"literal_binds": True})) == "width_bucket(a, 1.0, 100.0, 4)"
+        distributions = quantile_dataset.get_column_distributions([("a", bins), ("b", (0, 5, 9))])
+    assert distributions == expected
+    assert [distribution["hist"] for distribution in distributions] == [[24, 25, 25, 25], [50, 50]]
+
+
+def test_validate_runs_queries_on_one_connection(sa, tmp_path):
+    connection_string = "sqlite:///" + str(tmp_path / "validation.db")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]}).to_sql(
+        name="validation_data", con=sa.create_engine(connection_string), index=False)
+    dataset = SqlAlchemyDataset("validation_data", connection_string=connection_string, caching=False)
+    dataset.expect_column_values_to_not_be_null("a")
+    dataset.expect_column_max_to_be_between("a", 0, 3)
+    dataset.expect_column_mean_to_be_between("a", 0, 3)
+    dataset.expect_table_row_count_to_equal(3)
+
+    connections = []
+    sa.event.listen(dataset.engine, "checkout", lambda *args: connections.append(args))
+    assert dataset.validate().success
+    assert len(connections) == 1
+    assert isinstance(dataset.engine, sa.engine.Engine)
+
+    # Queries from another thread during the validation check out their own connection
+    engine = dataset.engine
+    engines_seen = []
+    row_counts = []
+
+    def count_rows_in_another_thread(*args):
+        engines_seen.append(dataset.engine)
+        if not row_counts:
+            row_counts.append(None)
+            thread = threading.Thread(target=lambda: row_counts.append(dataset.get_row_count()))
+            thread.start()
+            thread.join()
+
+    del connections[:]
+    sa.event.listen(engine, "before_execute", count_rows_in_another_thread)
+    assert dataset.validate().success
+    sa.event.remove(engine, "before_execute", count_rows_in_another_thread)
+    assert row_counts == [None, 3]
+    assert len(connections) == 2
+    assert all(seen is engine for seen in engines_seen)
+
+    del connections[:]
+    assert dataset.validate(max_workers=2).success
+    assert len(connections) > 1
+
+
+def test_validate_submits_metric_queries_concurrently(sa, tmp_path):
+    connection_string = "sqlite:///" + str(tmp_path / "concurrent.db")
+    pd.DataFrame({
+        "a": [float(value) for value in range(100)],
+        "b": [value % 3 for value in range(100)],
+        "c": ["x", "y"] * 50,
+    }).to_sql(name="concurrent_data", con=sa.create_engine(connection_string), index=False)
+    dataset = SqlAlchemyDataset("concurrent_data", connection_string=connection_string, max_concurrent_queries=2)
+    dataset.expect_column_distinct_values_to_be_in_set("b", [0, 1, 2])
+    dataset.expect_column_distinct_values_to_equal_set("c", ["x", "y"])
+    dataset.expect_column_max_to_be_between("a", 0, 100)
+    dataset.expect_column_values_to_be_between("a", 0, 100)
+    dataset.expect_column_values_to_be_in_set("c", ["x", "y"])
+    dataset.expect_column_kl_divergence_to_be_less_than(
+        "a", {"bins": [0, 50, 100], "weights": [0.5, 0.5]}, threshold=0.1)
+    suite = dataset.get_expectation_suite()
+    expected = SqlAlchemyDataset("concurrent_data", connection_string=connection_string).validate(suite)
+
+    lock = threading.Lock()
+    running = []
+    overlaps = []
+    execute = dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        with lock:
+            running.append(query)
+            overlaps.append(len(running))
+        try:
+            time.sleep(0.01)
+            return execute(query, *args, **kwargs)
+        finally:
+            with lock:
+                running.remove(query)
+
+    dataset.invalidate_metric_cache()
+    with mock.patch.object(dataset.engine, "execute", side_effect=spy):
+        observed = dataset.validate()
+    assert observed.success
+    assert [(result.success, result.result) for result in observed.results] == \
+        [(result.success, result.result) for result in expected.results]
+    assert max(overlaps) == 2
@@ -1,13 +1,31 @@
 from __future__ import division
 
+import jsonschema
 import pytest
 
 import numpy as np
+import pandas as pd
 
 import sqlalchemy.dialects.sqlite as sqlite_dialect
 
+from datetime import datetime
+
+from dateutil.parser import parse
+
 from great_expectations.dataset import SqlAlchemyDataset
-from great_expectations.dataset.util import build_continuous_partition_object, is_valid_continuous_partition_object
+from great_expectations.dataset import util
+from great_expectations.dataset.util import (
+    build_continuous_partition_object,
+    combine_regex_list,
+    get_json_schema_validator,
+    is_json_parseable,
+    is_valid_continuous_partition_object,
+    loads_json,
+    map_distinct_values,
+    match_regex_list,
+    match_strftime_format,
+    parse_datetimes,
+)
 
 
 def test_build_continuous_partition_object(numeric_high_card_dataset, numeric_high_card_dict):
@@ -53,3 +71,105 @@ def test_build_continuous_partition_object(numeric_high_card_dataset, numeric_hi
     assert np.allclose(partition["weights"], weights / n)
     assert np.allclose(partition["bins"], bin_edges)
     assert is_valid_continuous_partition_object(partition)
+
+
+def test_combine_regex_list():
+    assert combine_regex_list(["^a", "b$"]) == "(?:^a)|(?:b$)"
+    # Backreferences and inline flags would change meaning in a combined expression
+    assert combine_regex_list([r"(a)\1", "b"]) is None
+    assert combine_regex_list(["(?i)a", "b"]) is None
+
+
+@pytest.mark.parametrize("regex_list,all_matches", [
+    (["^a", "c$"], [False, True, False, False]),
+    ([r"(a)\1", "c$"], [False, False, False, False]),
+])
+def test_match_regex_list(regex_list, all_matches):
+    strings = pd.Series(["aa", "abc", "bc", "b"], index=[3, 1, 2, 0])
+    any_matches = match_regex_list(strings, regex_list, match_on="any")
+    assert any_matches.index.equals(strings.index)
+    assert list(any_matches) == [True, True, True, False]
+    assert list(match_regex_list(strings, regex_list, match_on="all")) == all_matches
+    with pytest.raises(ValueError):
+        match_regex_list(strings, regex_list, match_on="some")
+
+
+@pytest.mark.parametrize("match_on", ["any", "all"])
+def test_match_regex_list_rejects_an_empty_list(match_on):
+    with pytest.raises(ValueError):
+        match_regex_list(pd.Series(["a", "b"]), [], match_on=match_on)
+
+
+@pytest.mark.parametrize("values", [
+    ["2019-01-01", "2019-1-2 10:00", "20190103", "January 4, 2019", "2019-02-30", "3000-01-01", "not a date"],
+    ["January 4, 2019", "2019-01-01", "April 1973", "5 May 1975"],
+    ["03/06/09", "12/31/2019"],
+    ["13/01/2019", "01/02/2019"],
+    ["01/13/2019", "02/01/2019", "13/01/2019"],
+])
+def test_parse_datetimes_matches_dateutil(values):
+    def parse_or_none(val):
+        try:
+            return parse(val)
+        except ValueError:
+            return None
+
+    series = pd.Series(values, index=range(10, 10 + len(values)))
+    parsed = parse_datetimes(series, errors="coerce")
+    assert parsed.index.equals(series.index)
+    assert [None if pd.isnull(val) else val for val in parsed] == [parse_or_none(val) for val in values]
+    if any(parse_or_none(val) is None for val in values):
+        with pytest.raises(ValueError):
+            parse_datetimes(series)
+
+
+@pytest.mark.parametrize("strftime_format", ["%Y-%m-%d", "%d %B %Y", "%Y-%m-%d %H:%M"])
+def test_match_strftime_format_matches_strptime(strftime_format):
+    def matches(val):
+        try:
+            datetime.strptime(val, strftime_format)
+            return True
+        except ValueError:
+            return False
+
+    values = pd.Series([
+        "2019-01-01", "2019-1-2", "2019-01-01 10:00", "20190101", "2019-02-30", "3000-01-01", " 2019-01-01",
+        "4 july 2019", "31 June 2019", "4 July 3000", "2019-01-01 25:00",
+    ], index=[3, 3, 1, 2, 0, 4, 5, 6, 7, 8, 9])
+    assert list(match_strftime_format(values, strftime_format)) == [matches(val) for val in values]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_json_matches_json(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(util, "orjson", None)
+    assert loads_json('{"a": [1, 2.5, "x", null]}') == {"a": [1, 2.5, "x", None]}
+    # Accepted by json but not by orjson
+    assert np.isnan(loads_json('NaN'))
+    assert loads_json('123456789012345678901234567890') == 123456789012345678901234567890
+    assert is_json_parseable('{"a": 1}')
+    assert not is_json_parseable('{"a": 1')
+    assert not is_json_parseable(5)
+
+
+def test_map_distinct_values_calls_function_once_per_value():
+    calls = []
+
+    def func(val):
+        calls.append(val)
+        return val == "a"
+
+    values = pd.Series(["a", "b", "a", "a"], index=[5, 6, 7, 8])
+    result = map_distinct_values(values, func)
+    assert list(result) == [True, False, True, True]
+    assert result.index.equals(values.index)
+    assert sorted(calls) == ["a", "b"]
+    assert list(map_distinct_values(pd.Series([[1], [2]]), len)) == [1, 1]
+
+
+def test_get_json_schema_validator():
+    validator = get_json_schema_validator({"type": "object", "required": ["a"]})
+    assert validator.is_valid({"a": 1})
+    assert not validator.is_valid({"b": 1})
+    with pytest.raises(jsonschema.SchemaError):
+        get_json_schema_validator({"type": "not a type"})
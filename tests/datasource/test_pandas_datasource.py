@@ -9,11 +9,12 @@ import pandas as pd
 from six import PY2, PY3
 import shutil
 
-from great_expectations.core import ExpectationSuite
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.data_context.types.base import DataContextConfigSchema
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import BatchKwargsError
+from great_expectations.dataset import ChunkedPandasDataset
 from great_expectations.datasource import PandasDatasource
 from great_expectations.datasource.types.batch_kwargs import (
     PathBatchKwargs,
@@ -314,3 +315,49 @@ def test_pandas_datasource_processes_dataset_options(test_folder_connection_path
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+@pytest.mark.parametrize("file_name", ["test.csv", "test.parquet"])
+def test_pandas_datasource_reads_batch_in_chunks(tmp_path_factory, file_name):
+    path = os.path.join(str(tmp_path_factory.mktemp("test_pandas_datasource_reads_batch_in_chunks")), file_name)
+    df = pd.DataFrame({"col_1": range(100), "col_2": ["a", "b"] * 50})
+    if file_name.endswith(".csv"):
+        df.to_csv(path, index=False)
+    else:
+        pytest.importorskip("pyarrow")
+        df.to_parquet(path, row_group_size=30)
+
+    datasource = PandasDatasource("PandasCSV")
+    batch_kwargs = datasource.process_batch_parameters(chunksize=30)
+    batch_kwargs["path"] = path
+    batch = datasource.get_batch(batch_kwargs)
+    assert "pandas_data_fingerprint" not in batch.batch_markers
+
+    # Chunks keep the row numbers of the file, and the batch can be read more than once
+    assert [list(chunk.index) for chunk in batch.data] == [list(range(start, min(start + 30, 100)))
+                                                           for start in range(0, 100, 30)]
+    pd.testing.assert_frame_equal(pd.concat(list(batch.data)), df)
+    # The columns are known without reading a whole chunk
+    assert batch.data.get_columns() == ["col_1", "col_2"]
+
+    suite = ExpectationSuite(expectation_suite_name="foo")
+    dataset = Validator(batch, suite).get_dataset()
+    assert isinstance(dataset, ChunkedPandasDataset)
+    dataset.append_expectation(ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_between",
+        kwargs={"column": "col_1", "min_value": 0, "max_value": 89}
+    ))
+    dataset.append_expectation(ExpectationConfiguration(
+        expectation_type="expect_column_mean_to_be_between",
+        kwargs={"column": "col_1", "min_value": 49, "max_value": 50}
+    ))
+    results = dataset.validate(result_format="SUMMARY").results
+    assert results[0].success is False
+    assert results[0].result["partial_unexpected_index_list"] == list(range(90, 100))
+    assert results[1].result["observed_value"] == 49.5
+
+    # The batch can be read again to evaluate expectations interactively
+    assert dataset.expect_column_values_to_be_in_set("col_2", ["a", "b"]).success is True
+    assert dataset.expect_column_max_to_be_between("col_1", 99, 99).success is True
+    with pytest.raises(NotImplementedError):
+        dataset.expect_column_values_to_be_unique("col_1")
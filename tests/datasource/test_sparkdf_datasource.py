@@ -301,3 +301,21 @@ def test_pandas_datasource_processes_dataset_options(test_folder_connection_path
     dataset = validator.get_dataset()
     assert dataset.caching is False
     assert dataset._persist is False
+
+
+def test_spark_datasource_processes_persist_level(test_folder_connection_path):
+    pytest.importorskip("pyspark")
+    datasource = SparkDFDatasource('SparkCSV', generators={
+            "subdir_reader": {
+                "class_name": "SubdirReaderBatchKwargsGenerator",
+                "base_directory": test_folder_connection_path
+            }
+        }
+    )
+    assert datasource.process_batch_parameters(persist_level="MEMORY_AND_DISK")["persist_level"] == "MEMORY_AND_DISK"
+    batch_kwargs = datasource.build_batch_kwargs("subdir_reader", name="test")
+    batch_kwargs["persist_level"] = "MEMORY_AND_DISK"
+    batch = datasource.get_batch(batch_kwargs)
+    dataset = Validator(batch, ExpectationSuite(expectation_suite_name="foo")).get_dataset()
+    assert dataset._persist_level == "MEMORY_AND_DISK"
+    assert not dataset.spark_df.is_cached
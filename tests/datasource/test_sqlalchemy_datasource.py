@@ -225,4 +225,30 @@ def test_sqlalchemy_datasource_processes_dataset_options(test_db_connection_stri
     batch = datasource.get_batch(batch_kwargs)
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
-    assert dataset.caching is False
\ No newline at end of file
+    assert dataset.caching is False
+
+
+def test_sqlalchemy_datasource_pool_options_and_metrics(test_db_connection_string, sa):
+    datasource = SqlAlchemyDatasource('SqlAlchemy', connection_string=test_db_connection_string, pool_options={
+        "poolclass": sa.pool.QueuePool, "pool_size": 2, "max_overflow": 1, "pool_pre_ping": True, "pool_recycle": 600
+    })
+    assert datasource.engine.pool.size() == 2
+    assert datasource.engine.pool._recycle == 600
+
+    pool_metrics = datasource.get_pool_metrics()
+    # The connection opened to check the datasource configuration is kept in the pool for the first batch
+    assert pool_metrics["pool_class"] == "QueuePool"
+    assert pool_metrics["connections_created"] == 1
+    assert pool_metrics["size"] == 2
+    assert pool_metrics["checked_in"] == 1
+    assert pool_metrics["checked_out"] == 0
+
+    connections = [datasource.engine.connect(), datasource.engine.connect()]
+    pool_metrics = datasource.get_pool_metrics()
+    assert pool_metrics["connections_created"] == 2
+    assert pool_metrics["checked_out"] == 2
+    for connection in connections:
+        connection.close()
+    pool_metrics = datasource.get_pool_metrics()
+    assert pool_metrics["checkouts"] == pool_metrics["checkins"] == 3
+    assert pool_metrics["checked_in"] == 2
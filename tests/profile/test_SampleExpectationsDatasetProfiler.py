@@ -149,7 +149,7 @@ def test__create_expectations_for_numeric_column(numeric_high_card_dataset, test
         column
     )
     expectation_suite = numeric_high_card_dataset.get_expectation_suite(suppress_warnings=True)
-    if test_backend in ["PandasDataset", "SparkDFDataset", "postgresql"]:
+    if test_backend in ["PandasDataset", "SparkDFDataset", "postgresql", "sqlite"]:
         assert set(
             [
                 expectation.expectation_type
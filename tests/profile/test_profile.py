@@ -97,6 +97,28 @@ def test_BasicDatasetProfiler():
     assert expected_expectations.issubset(added_expectations)
 
 
+def test_BasicDatasetProfiler_computes_column_cardinalities_in_one_query(sa):
+    engine = sa.create_engine("sqlite://")
+    ge.dataset.PandasDataset({
+        "x": [float(value) for value in range(100)],
+        "y": [value % 3 for value in range(100)],
+        "z": ["a", "b"] * 50,
+    }).to_sql(name="profiled", con=engine, index=False)
+    dataset = ge.dataset.SqlAlchemyDataset("profiled", engine=engine)
+
+    executed = []
+    execute = dataset.engine.execute
+
+    def spy(query, *args, **kwargs):
+        executed.append(str(query))
+        return execute(query, *args, **kwargs)
+
+    dataset.engine.execute = spy
+    expectation_suite, validation_results = BasicDatasetProfiler.profile(dataset)
+    assert validation_results.success is not None
+    assert sum("count(distinct(" in statement for statement in executed) == 1
+
+
 def test_BasicDatasetProfiler_null_column():
     """
     The profiler should determine that null columns are of null cardinality and of null type and